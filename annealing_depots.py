@@ -0,0 +1,247 @@
+'''
+Anytime simulated annealing over the depot locations, for a fixed wall clock budget.
+
+The search moves one depot at a time, to a site next to it or, less often, to any site with
+biomass. Moves are scored with the same greedy fill as the other optimisers, through a FillState
+that only fills again the depots a move affects, or with the exact flows when fitness is 'exact'.
+A move that lowers the cost is always taken, one that raises it by delta with probability
+exp(-delta / temperature). The temperature falls geometrically with the share of the budget
+used up, from a start calibrated on random moves, so the search roams early and settles as the
+budget runs out. Sites a depot just left are tabu for TABU_TENURE moves unless moving back beats
+the best cost, which keeps the search from undoing its own moves, and after RESTART_AFTER moves
+without a new best it jumps back to the best set.
+
+The best set so far is written to disk every time it improves, so a run killed at any point
+still leaves its answer behind:
+
+    python annealing_depots.py --time-budget 600 --best annealing_best.json
+    python annealing_depots.py --time-budget 600 --checkpoint sa.pkl --resume
+
+Budgets and checkpoints take the options of checkpoint.py, a run without a budget gets
+TIME_BUDGET seconds. The budget covers a run and all its resumes, a resumed run only gets what
+the runs before it left over.
+'''
+import argparse
+import json
+import math
+import os
+import time
+import numpy as np
+from data_context import DATA
+from greedy_solution import DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE, depot_fill_state, select_facilities
+from assignment import FITNESS, FITNESS_HELP, FITNESS_MODES, exact_depot_state
+from spatial import NEIGHBOUR_RADIUS, load_site_neighbours
+from checkpoint import CHECKPOINT_INTERVAL, CheckpointTimer, add_run_arguments, check_fitness, check_run_arguments, load_checkpoint, out_of_time, random_state, restore_random_state
+from instrumentation import METRICS, add_instrumentation_arguments, emit, run_instrumented
+from solution import predict_biomass
+
+TIME_BUDGET = 600 # seconds, when neither a budget nor an iteration count is given
+STARTS = ('greedy', 'random')
+LOCAL_MOVE_SHARE = 0.8 # share of moves to a site next to the depot, the rest go to any site with biomass
+TABU_TENURE = 50 # moves a site a depot just left stays tabu
+RESTART_AFTER = 20000 # moves without a new best before jumping back to the best set
+CALIBRATION_MOVES = 200 # random moves the start temperature is calibrated on
+START_ACCEPTANCE = 0.5 # chance of taking an average uphill move at the start temperature
+FINAL_TEMPERATURE_RATIO = 1e-4 # temperature at the end of the budget over the start temperature
+PROGRESS_INTERVAL = 10 # seconds between two progress lines
+BEST_JSON = 'annealing_best.json'
+
+def make_state(depots: list[int], biomass_forecast: np.ndarray, fitness: str = FITNESS):
+    """
+    FillState of the depots, or an AssignmentState when fitness is 'exact'
+    """
+    return (exact_depot_state if fitness == 'exact' else depot_fill_state)(depots, biomass_forecast)
+
+def greedy_depots(biomass_forecast: np.ndarray) -> list[int]:
+    depots, _ = select_facilities(biomass_forecast.copy(), DATA.number_of_depots, DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE)
+    return sorted(depots)
+
+def random_depots(sites: np.ndarray, rng: np.random.Generator) -> list[int]:
+    return sorted(int(site) for site in rng.choice(sites, DATA.number_of_depots, replace=False))
+
+def propose_move(depots: list[int], sites: np.ndarray, site_neighbours: list[np.ndarray], rng: np.random.Generator) -> tuple[int, int]:
+    """
+    A depot and the site it moves to, next to it with probability LOCAL_MOVE_SHARE
+    """
+    old = depots[rng.integers(len(depots))]
+    neighbours = site_neighbours[old]
+    if len(neighbours) and rng.random() < LOCAL_MOVE_SHARE:
+        return old, int(neighbours[rng.integers(len(neighbours))])
+    return old, int(sites[rng.integers(len(sites))])
+
+def start_temperature(state, depots: list[int], sites: np.ndarray, site_neighbours: list[np.ndarray], rng: np.random.Generator) -> float:
+    """
+    Temperature at which the average uphill move of CALIBRATION_MOVES random moves is taken with
+    probability START_ACCEPTANCE
+    """
+    cost = state.total_cost()
+    uphill = []
+    for _ in range(CALIBRATION_MOVES):
+        old, new = propose_move(depots, sites, site_neighbours, rng)
+        if new not in depots:
+            delta = state.evaluate_swap(old, new) - cost
+            if delta > 0:
+                uphill.append(delta)
+    return -np.mean(uphill) / math.log(START_ACCEPTANCE) if uphill else 1.0
+
+def save_best(path: str, depots: list[int], cost: float, fitness: str, moves: int, elapsed: float):
+    """
+    Writes the best set as json, through a temporary file so the previous best survives a crash
+    """
+    if path is None:
+        return
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as temp_file:
+        json.dump({"depots": sorted(depots), "cost": cost, "fitness": fitness, "moves": moves, "elapsed": elapsed}, temp_file, indent=2)
+    os.replace(temp_path, path)
+
+def anneal(state, depots: list[int], biomass_forecast: np.ndarray, sites: np.ndarray, site_neighbours: list[np.ndarray],
+           rng: np.random.Generator, temperature: float, progress, done, best: tuple[float, list[int]], moves: int = 0,
+           tabu: dict = None, fitness: str = FITNESS, on_best=None, on_move=None):
+    """
+    Runs the annealing until done(moves) is true, see the module docstring.
+
+    Args:
+        state: FillState or AssignmentState of the current depots
+        depots: Current depots, the set of state
+        progress: Function of the move count giving the share of the budget used, between 0 and 1
+        done: Function of the move count, true when the budget is used up
+        best: (cost, depots) of the best set so far
+        moves: Moves made before this call, when resuming
+        tabu: Site -> move until which it is tabu
+        on_best: Called with (cost, depots, moves) on every new best
+        on_move: Called with (moves, depots, best, tabu) after every move, e.g. for checkpoints
+
+    Returns:
+        (state, depots, best, moves, tabu) when the budget is used up
+    """
+    tabu = {} if tabu is None else tabu
+    cost = state.total_cost()
+    best_cost, best_depots = best
+    last_improvement = moves
+    while not done(moves):
+        moves += 1
+        old, new = propose_move(depots, sites, site_neighbours, rng)
+        if new in depots:
+            continue
+        new_cost = state.evaluate_swap(old, new)
+        if tabu.get(new, 0) > moves and new_cost >= best_cost:
+            continue
+        delta = new_cost - cost
+        current_temperature = temperature * FINAL_TEMPERATURE_RATIO ** progress(moves)
+        if delta <= 0 or rng.random() < math.exp(-delta / current_temperature):
+            METRICS.count('moves.accepted')
+            state = state.swap(old, new)
+            depots = sorted(depots[:depots.index(old)] + depots[depots.index(old) + 1:] + [new])
+            cost = new_cost
+            tabu[old] = moves + TABU_TENURE
+            if cost < best_cost:
+                best_cost, best_depots = cost, list(depots)
+                last_improvement = moves
+                if on_best is not None:
+                    on_best(best_cost, best_depots, moves)
+        if moves - last_improvement >= RESTART_AFTER:
+            METRICS.count('restarts')
+            depots = list(best_depots)
+            state = make_state(depots, biomass_forecast, fitness)
+            cost = best_cost
+            last_improvement = moves
+        if on_move is not None:
+            on_move(moves, depots, (best_cost, best_depots), tabu)
+    return state, depots, (best_cost, best_depots), moves, tabu
+
+def main(iterations: int = None, time_budget: float = None, seed: int = None, checkpoint: str = None,
+         checkpoint_every: float = CHECKPOINT_INTERVAL, resume: bool = False, neighbour_radius: int = NEIGHBOUR_RADIUS,
+         fitness: str = FITNESS, start: str = 'greedy', best: str = BEST_JSON):
+    """
+    Runs the annealing for the time budget, or for a number of moves when iterations is given.
+    The best set is written to best every time it improves.
+    """
+    if iterations is None and time_budget is None:
+        time_budget = TIME_BUDGET
+    biomass_forecast = predict_biomass()['2018/2019'].to_numpy()
+    site_neighbours = load_site_neighbours(neighbour_radius)
+    sites = np.flatnonzero(biomass_forecast > 0)
+    rng = np.random.default_rng(seed)
+    if resume:
+        run = load_checkpoint(checkpoint)
+        check_fitness(run, fitness)
+        depots, temperature, moves, tabu, elapsed_before = run['depots'], run['temperature'], run['iteration'], run['tabu'], run['elapsed']
+        best_cost, best_depots = run['best']
+        restore_random_state(run['random_state'], rng)
+        state = make_state(depots, biomass_forecast, fitness)
+        print("Resuming from move", moves, "with lowest cost:", best_cost)
+    else:
+        depots = greedy_depots(biomass_forecast) if start == 'greedy' else random_depots(sites, rng)
+        state = make_state(depots, biomass_forecast, fitness)
+        temperature = start_temperature(state, depots, sites, site_neighbours, rng)
+        moves, tabu, elapsed_before = 0, {}, 0.0
+        best_cost, best_depots = state.total_cost(), list(depots)
+        print("Initial depots:", depots, "  Total:", best_cost, "  Start temperature:", temperature)
+    start_moves = moves
+    start_time = time.monotonic()
+    save_best(best, best_depots, best_cost, fitness, moves, elapsed_before)
+
+    # the time of the runs before a resume counts against the budget
+    remaining_budget = None if time_budget is None else time_budget - elapsed_before
+
+    def progress(moves: int) -> float:
+        if iterations is not None:
+            return min(1.0, moves / iterations)
+        return min(1.0, (elapsed_before + time.monotonic() - start_time) / time_budget)
+
+    def done(moves: int) -> bool:
+        return (iterations is not None and moves >= iterations) or out_of_time(start_time, remaining_budget)
+
+    def on_best(cost: float, depots: list[int], moves: int):
+        elapsed = elapsed_before + time.monotonic() - start_time
+        save_best(best, depots, cost, fitness, moves, elapsed)
+        emit("best", iteration=moves, best_cost=cost, depots=depots)
+
+    checkpoint_timer = CheckpointTimer(checkpoint, checkpoint_every)
+    last_progress = [time.monotonic()]
+    search = {'depots': depots, 'best': (best_cost, best_depots), 'moves': moves, 'tabu': tabu}
+
+    def run_state():
+        return {
+            'depots': search['depots'],
+            'iteration': search['moves'],
+            'best': search['best'],
+            'temperature': temperature,
+            'tabu': search['tabu'],
+            'elapsed': elapsed_before + time.monotonic() - start_time,
+            'random_state': random_state(rng),
+            'fitness': fitness,
+        }
+
+    def on_move(moves: int, depots: list[int], best: tuple[float, list[int]], tabu: dict):
+        search.update(depots=depots, best=best, moves=moves, tabu=tabu)
+        now = time.monotonic()
+        if now - last_progress[0] >= PROGRESS_INTERVAL:
+            last_progress[0] = now
+            print(f"move {moves}: lowest cost {search['best'][0]}, {(moves - start_moves) / (now - start_time):.0f} moves/s")
+            emit("iteration", iteration=moves, best_cost=search['best'][0])
+        checkpoint_timer.maybe_save(run_state)
+
+    with METRICS.timer('annealing'):
+        state, depots, (best_cost, best_depots), moves, tabu = anneal(
+            state, depots, biomass_forecast, sites, site_neighbours, rng, temperature, progress, done,
+            (best_cost, best_depots), moves, tabu, fitness, on_best, on_move)
+    search.update(depots=depots, best=(best_cost, best_depots), moves=moves, tabu=tabu)
+    checkpoint_timer.maybe_save(run_state, force=True)
+    print(f"{moves - start_moves} moves in {time.monotonic() - start_time:.1f}s")
+    print("Lowest cost found:", best_cost, best_depots)
+    return best_cost, best_depots
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Simulated annealing on the depot locations within a time budget")
+    parser.add_argument('--neighbour-radius', type=int, default=NEIGHBOUR_RADIUS, help="grid cells a local move can go")
+    parser.add_argument('--fitness', choices=FITNESS_MODES, default=FITNESS, help=FITNESS_HELP)
+    parser.add_argument('--start', choices=STARTS, default='greedy', help="depots the search starts from")
+    parser.add_argument('--best', default=BEST_JSON, help="json file the best depots are written to whenever they improve")
+    add_run_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return check_run_arguments(parser, parser.parse_args(argv))
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'annealing_depots')
@@ -0,0 +1,241 @@
+'''
+Exact assignment of flows to a fixed set of facilities.
+
+The greedy fill sends each source to the nearest facility that still has room, in the order the
+facilities are filled. Here the flows of a whole stage are solved at once as a transportation
+problem:
+
+    minimise    sum (distance[i, j] - reward) * x[i, j]
+    subject to  sum_j x[i, j] <= supply[i]        for every source i
+                sum_i x[i, j] <= capacity         for every facility j
+                x[i, j] >= 0
+
+The reward is the number of facilities times the longest arc, plus one. Moving one more unit
+means sending flow along an augmenting path, which enters each facility at most once, so its
+distances add up to less than the reward and every such path lowers the objective. The solution
+therefore moves as much as the capacities allow and, among those flows, has the lowest transport
+cost. A reward only larger than the longest arc would not guarantee that: a path that reroutes
+flow away from other facilities can cost more than it earns. Each solve starts from the arcs of the
+nearest sources of each facility, enough of them to hold CAPACITY_COVER times its capacity, and
+only adds the arcs that can still lower the cost, a few per facility at a time, which keeps the
+linear programs to a few thousand variables. They are solved with HiGHS through scipy.
+
+The exact fitness is slow. A linear program over the bundled grid takes about 40 ms and a solve
+of 15 depots from scratch needs several, 0.25-0.35 s in all. scipy does not let HiGHS start from
+an earlier basis, so an AssignmentState instead carries the arcs that carry flow in its own
+solution into every set it scores, and a swap then needs fewer rounds, 0.15-0.2 s. A gradient
+descent iteration over 15 depots and their 8 neighbours, about 120 swaps, takes 20-30 s with
+the exact fitness, against well under a second with the greedy fill.
+
+The optimisers take `--fitness exact` to score their sets with these flows instead of the greedy
+fill. Both fitnesses use the capacities of greedy_solution and the share of the biomass that
+reaches a depot, BIOMASS_COLLECTION_RATE, so their costs are on the same scale. They still give
+different costs for the same set, so the fitness is part of every cache key and a run is only
+resumed with the fitness it was started with, see checkpoint.check_fitness. The results
+order nothing, so a set of facilities has one cost whichever way it is listed.
+'''
+import numpy as np
+from data_context import DATA
+from cost_helpers import calculate_cost_of_flows, calculate_cost_per_destination
+from greedy_solution import BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY
+
+NEAREST_SOURCES = 100 # arcs per facility to start from at least
+CAPACITY_COVER = 1.5 # a facility starts from its nearest sources holding this many times its capacity
+FITNESS_MODES = ('greedy', 'exact') # greedy fill of greedy_solution, or the flows solved here
+FITNESS = 'greedy'
+FITNESS_HELP = "greedy fill, or exact flows at 0.15-0.35 s per scored set on the bundled grid, see assignment.py"
+ARCS_PER_ROUND = 50 # most improving arcs added per facility in one pricing round
+REDUCED_COST_TOLERANCE = 1e-6
+FLOW_TOLERANCE = 1e-6 # flows below this are solver noise and dropped
+
+def nearest_arc_mask(distances: np.ndarray, k: int = NEAREST_SOURCES):
+    """
+    Marks the arcs from the k nearest sources of each facility, or more generally the k lowest
+    values of each column.
+
+    Args:
+        distances: (n_sources x n_facilities) distance of every arc
+        k: Arcs per facility, every arc when None
+
+    Returns:
+        Boolean array shaped like distances
+    """
+    if k is None or k >= len(distances):
+        return np.ones(distances.shape, dtype=bool)
+    mask = np.zeros(distances.shape, dtype=bool)
+    nearest = np.argpartition(distances, k - 1, axis=0)[:k]
+    np.put_along_axis(mask, nearest, True, axis=0)
+    return mask
+
+def covering_arc_mask(distances: np.ndarray, supply: np.ndarray, capacity: float, k: int = NEAREST_SOURCES):
+    """
+    Marks the arcs from the nearest sources of each facility that together hold CAPACITY_COVER
+    times its capacity, and at least the k nearest.
+
+    Args:
+        distances: (n_sources x n_facilities) distance of every arc
+        supply: Amount available at each source
+
+    Returns:
+        Boolean array shaped like distances
+    """
+    if k is None or k >= len(distances):
+        return np.ones(distances.shape, dtype=bool)
+    order = np.argsort(distances, axis=0, kind='stable')
+    supply_before = np.cumsum(supply[order], axis=0) - supply[order]
+    covering = supply_before < CAPACITY_COVER * capacity
+    covering[:k] = True
+    mask = np.zeros(distances.shape, dtype=bool)
+    np.put_along_axis(mask, order, covering, axis=0)
+    return mask
+
+def solve_restricted(arc_costs: np.ndarray, mask: np.ndarray, supply: np.ndarray, capacity: float):
+    """
+    Solves the transportation problem over the arcs in mask.
+
+    Returns:
+        flows: (n_sources x n_facilities) array, 0 outside mask
+        source_duals, facility_duals: Marginals of the supply and capacity constraints
+    """
+    from scipy import sparse # only needed by the exact fitness
+    from scipy.optimize import linprog
+    n_sources, n_facilities = mask.shape
+    arc_sources, arc_facilities = np.nonzero(mask)
+    arcs = np.arange(len(arc_sources))
+    constraints = sparse.vstack([
+        sparse.csr_matrix((np.ones(len(arcs)), (arc_sources, arcs)), shape=(n_sources, len(arcs))),
+        sparse.csr_matrix((np.ones(len(arcs)), (arc_facilities, arcs)), shape=(n_facilities, len(arcs))),
+    ], format='csr')
+    limits = np.concatenate((supply, np.full(n_facilities, capacity)))
+    result = linprog(arc_costs[mask], A_ub=constraints, b_ub=limits, bounds=(0, None), method='highs')
+    if result.status != 0:
+        raise RuntimeError(f"Transportation problem not solved: {result.message}")
+    flows = np.zeros(mask.shape)
+    flows[mask] = result.x
+    duals = result.ineqlin.marginals
+    return flows, duals[:n_sources], duals[n_sources:]
+
+def solve_transportation(supply: np.ndarray, facilities: list, capacity: float, k: int = NEAREST_SOURCES, arcs: dict = None):
+    """
+    Moves as much supply as fits into the facilities at the lowest transport cost.
+
+    The problem is first solved over the arcs of the nearest sources of each facility, see
+    covering_arc_mask, and the arcs given for it. Any other arc whose reduced cost under the
+    duals of that solution is negative could still lower the cost, so the ARCS_PER_ROUND most
+    negative of them for each facility are added and the problem solved again until there are
+    none. The result is optimal over all arcs, whatever arcs it started from.
+
+    Args:
+        supply: Amount available at each index, left unchanged
+        facilities: Facility indexes, each taking up to capacity
+        capacity: Amount each facility takes before it is full
+        k: Arcs per facility to start from at least, every arc when None
+        arcs: Facility -> source indexes of arcs to start from as well, e.g. from an earlier solve.
+            Updated in place with the arcs of this solve.
+
+    Returns:
+        sources, destinations, values: Flows as parallel arrays, grouped by source
+    """
+    facilities = np.array(list(dict.fromkeys(int(facility) for facility in facilities)), dtype=np.int64)
+    sources = np.flatnonzero(supply > 0)
+    if len(sources) == 0 or len(facilities) == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    distances = np.asarray(DATA.distances.block(sources, facilities), dtype=np.float64)
+    # every augmenting path earns more than its distances cost, see the module docstring
+    arc_costs = distances - (len(facilities) * distances.max() + 1)
+    mask = covering_arc_mask(distances, supply[sources], capacity, k)
+    if arcs is not None:
+        for column, facility in enumerate(facilities.tolist()):
+            if facility in arcs:
+                mask[np.searchsorted(sources, arcs[facility]), column] = True
+    while True:
+        flows, source_duals, facility_duals = solve_restricted(arc_costs, mask, supply[sources], capacity)
+        reduced_costs = arc_costs - source_duals[:, None] - facility_duals[None, :]
+        improving = (reduced_costs < -REDUCED_COST_TOLERANCE) & ~mask
+        if not improving.any():
+            break
+        mask |= nearest_arc_mask(np.where(improving, reduced_costs, np.inf), ARCS_PER_ROUND) & improving
+    if arcs is not None:
+        arcs.clear()
+        arcs.update((facility, sources[flows[:, column] > FLOW_TOLERANCE]) for column, facility in enumerate(facilities.tolist()))
+    arc_sources, arc_facilities = np.nonzero(flows > FLOW_TOLERANCE)
+    return sources[arc_sources], facilities[arc_facilities], flows[arc_sources, arc_facilities]
+
+def assign_biomass(depots: list, biomass: np.ndarray, k: int = NEAREST_SOURCES):
+    """
+    Cheapest biomass flows that fill the depots as far as the forecast allows, in the amounts
+    that reach the depots like the greedy fill
+    """
+    return solve_transportation(biomass * BIOMASS_COLLECTION_RATE, depots, DEPOT_PROCESSING_CAPACITY, k)
+
+def assign_pellets(refineries: list, pellets: np.ndarray):
+    """
+    Cheapest pellet flows from the depots to the refineries
+    """
+    return solve_transportation(pellets, refineries, REFINERY_PROCESSING_CAPACITY, k=None)
+
+def depot_inflow(biomass_flows: tuple):
+    """
+    Pellets waiting at each index after the biomass flows, what comes into a depot goes out as pellets
+    """
+    sources, destinations, values = biomass_flows
+    return np.bincount(destinations, weights=values, minlength=DATA.number_of_sites)
+
+def assignment_transport_cost(depots, biomass: np.ndarray, k: int = NEAREST_SOURCES):
+    """
+    Transport cost of the exact biomass flows into a set of depots, the exact counterpart of
+    genetic_solution.fill_depots_and_calculate_transport
+    """
+    return calculate_cost_of_flows(*assign_biomass(list(depots), biomass, k))
+
+def assignment_costs(facilities, supply: np.ndarray, capacity: float, k: int = NEAREST_SOURCES, arcs: dict = None):
+    """
+    Transport cost into each facility of the exact flows, 0 for facilities that receive nothing.
+    arcs is passed on to solve_transportation.
+    """
+    facility_costs = dict.fromkeys((int(facility) for facility in facilities), 0)
+    facility_costs.update(calculate_cost_per_destination(*solve_transportation(supply, facilities, capacity, k, arcs)))
+    return facility_costs
+
+class AssignmentState:
+    """
+    Same interface as fill_state.FillState, solving the exact flows for every set that is scored.
+    Every solve starts from the arcs this state's own solve ended with, see the module docstring.
+    """
+    def __init__(self, facilities: list, supply: np.ndarray, capacity: float, k: int = NEAREST_SOURCES, arcs: dict = None):
+        self.facilities = sorted(int(facility) for facility in facilities)
+        self.supply = supply
+        self.capacity = capacity
+        self.k = k
+        self.arcs = dict(arcs or {})
+        self.costs = assignment_costs(self.facilities, supply, capacity, k, self.arcs)
+
+    def facility_costs(self) -> dict:
+        return dict(self.costs)
+
+    def total_cost(self) -> float:
+        return sum(self.costs.values())
+
+    def swapped(self, old: int, new: int) -> list:
+        return [facility for facility in self.facilities if facility != old] + [int(new)]
+
+    def swapped_arcs(self, old: int) -> dict:
+        return {facility: sources for facility, sources in self.arcs.items() if facility != old}
+
+    def evaluate_swap(self, old: int, new: int) -> float:
+        return sum(assignment_costs(self.swapped(old, new), self.supply, self.capacity, self.k, self.swapped_arcs(old)).values())
+
+    def swap(self, old: int, new: int):
+        return AssignmentState(self.swapped(old, new), self.supply, self.capacity, self.k, self.swapped_arcs(old))
+
+def exact_depot_state(depots: list, biomass: np.ndarray):
+    """
+    Counterpart of greedy_solution.depot_fill_state with the exact biomass flows
+    """
+    return AssignmentState(depots, biomass * BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY)
+
+def exact_refinery_state(refineries: list, pellets: np.ndarray):
+    """
+    Counterpart of greedy_solution.refinery_fill_state with the exact pellet flows
+    """
+    return AssignmentState(refineries, pellets, REFINERY_PROCESSING_CAPACITY, k=None)
@@ -0,0 +1,168 @@
+'''
+Rolling-origin backtest of the biomass forecasters.
+
+Each of the years 2013-2017 is held out in turn. A forecaster is fitted on the years before
+it, for all sites at once, and its forecast of the held out year is compared with what was
+harvested. Errors are weighted by biomass, so the sites that carry most of the biomass, and
+most of the transport cost, count the most:
+
+    wape           sum |forecast - actual| / sum actual
+    bias           sum (forecast - actual) / sum actual
+    weighted_rmse  sqrt(sum actual * (forecast - actual)^2 / sum actual)
+
+Every (configuration, year) fold is independent, so the folds are spread over a process pool.
+
+    python backtest.py --workers 8
+    python backtest.py --configs configs.json --output backtest.csv
+
+A configuration is a dict naming a model of FORECASTERS, its parameters and optionally the
+first year it is fitted on, e.g. {"model": "exponential_smoothing", "smoothing_level": 0.05,
+"first_year": 2011} is the forecast of solution.predict_biomass.
+'''
+import argparse
+import json
+import multiprocessing
+import numpy as np
+import pandas as pd
+from data_context import BIOMASS_HISTORY_CSV
+from instrumentation import add_instrumentation_arguments, run_instrumented
+from solution import HISTORY_COLUMNS, SMOOTHING_LEVEL, exponential_smoothing_forecast
+
+HOLDOUT_YEARS = list(range(2013, 2018))
+WORKERS = 1 # 1 runs the folds in this process, more spreads them over a process pool
+
+def average_forecast(history: np.ndarray):
+    """
+    Mean of the past years, see solution.predict_biomass_average
+    """
+    return history.mean(axis=1)
+
+def last_value_forecast(history: np.ndarray):
+    """
+    Naive baseline, next year is the same as the last one
+    """
+    return history[:, -1]
+
+def statsmodels_forecast(history: np.ndarray, smoothing_level: float = None, trend: str = None):
+    """
+    One statsmodels model per site, the smoothing level is optimised when None as in
+    solution.predict_biomass_2019. Slow, about 6 s for all sites.
+    """
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    forecasts = []
+    for values in history:
+        fitted = ExponentialSmoothing(values, trend=trend).fit(smoothing_level=smoothing_level)
+        forecasts.append(float(fitted.forecast(1)[0]))
+    return np.array(forecasts)
+
+FORECASTERS = {
+    'average': average_forecast,
+    'last_value': last_value_forecast,
+    'exponential_smoothing': exponential_smoothing_forecast,
+    'statsmodels': statsmodels_forecast,
+}
+
+def default_configs() -> list[dict]:
+    """
+    Baselines, the current forecast and a grid of smoothing parameters around it
+    """
+    configs = [{'model': 'average'}, {'model': 'last_value'}, {'model': 'statsmodels', 'first_year': 2011}]
+    for first_year in (2010, 2011):
+        for smoothing_level in (SMOOTHING_LEVEL, 0.1, 0.2, 0.3, 0.5, 0.8):
+            configs.append({'model': 'exponential_smoothing', 'smoothing_level': smoothing_level, 'first_year': first_year})
+        for smoothing_trend in (0.05, 0.2):
+            configs.append({'model': 'exponential_smoothing', 'smoothing_level': 0.2, 'trend': 'add',
+                            'smoothing_trend': smoothing_trend, 'first_year': first_year})
+    return configs
+
+def config_name(config: dict) -> str:
+    return json.dumps(config, sort_keys=True)
+
+def load_history(csv_path: str = BIOMASS_HISTORY_CSV) -> pd.DataFrame:
+    """
+    (n_sites x n_years) biomass history, one column per year
+    """
+    history = pd.read_csv(csv_path)[HISTORY_COLUMNS]
+    history.columns = [int(year) for year in history.columns]
+    return history
+
+def forecast_errors(forecast: np.ndarray, actual: np.ndarray) -> dict:
+    """
+    Biomass weighted errors of a forecast, see the module docstring
+    """
+    error = forecast - actual
+    total = actual.sum()
+    return {
+        'wape': float(np.abs(error).sum() / total),
+        'bias': float(error.sum() / total),
+        'weighted_rmse': float(np.sqrt((actual * error ** 2).sum() / total)),
+    }
+
+def run_fold(history: pd.DataFrame, config: dict, year: int) -> dict:
+    """
+    Fits config on the years before year and scores its forecast of year
+    """
+    params = dict(config)
+    model = params.pop('model')
+    first_year = params.pop('first_year', history.columns[0])
+    training = history.loc[:, first_year:year - 1].to_numpy(dtype=np.float64)
+    forecast = FORECASTERS[model](training, **params)
+    return {'config': config_name(config), 'year': year, **forecast_errors(forecast, history[year].to_numpy(dtype=np.float64))}
+
+_worker_history = None
+
+def init_worker(history: pd.DataFrame):
+    """
+    Runs once in each pool worker, the history is handed over once per worker instead of once per fold
+    """
+    global _worker_history
+    _worker_history = history
+
+def run_fold_in_worker(fold: tuple[dict, int]):
+    return run_fold(_worker_history, *fold)
+
+def backtest(history: pd.DataFrame, configs: list[dict], holdout_years: list[int] = HOLDOUT_YEARS, workers: int = WORKERS) -> pd.DataFrame:
+    """
+    Scores every configuration on every held out year.
+
+    Returns:
+        One row per fold with the config, the year and the errors of forecast_errors
+    """
+    folds = [(config, year) for config in configs for year in holdout_years]
+    if workers > 1:
+        with multiprocessing.Pool(workers, initializer=init_worker, initargs=(history,)) as pool:
+            rows = pool.map(run_fold_in_worker, folds, chunksize=1)
+    else:
+        rows = [run_fold(history, *fold) for fold in folds]
+    return pd.DataFrame(rows)
+
+def summarise(results: pd.DataFrame) -> pd.DataFrame:
+    """
+    Mean errors of each configuration over the held out years, best wape first
+    """
+    return results.drop(columns='year').groupby('config').mean().sort_values('wape')
+
+def main(configs: str = None, holdout_years: list[int] = HOLDOUT_YEARS, workers: int = WORKERS, output: str = None):
+    history = load_history()
+    if configs is not None:
+        with open(configs) as configs_file:
+            configs = json.load(configs_file)
+    else:
+        configs = default_configs()
+    results = backtest(history, configs, holdout_years, workers)
+    if output is not None:
+        results.to_csv(output, index=False)
+    with pd.option_context('display.max_colwidth', None, 'display.width', None):
+        print(summarise(results))
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Rolling-origin backtest of the biomass forecasters")
+    parser.add_argument('--configs', help="json file with a list of configurations, the default grid when not given")
+    parser.add_argument('--holdout-years', type=int, nargs='+', default=HOLDOUT_YEARS)
+    parser.add_argument('--workers', type=int, default=WORKERS, help="processes running the folds")
+    parser.add_argument('--output', help="csv file the errors of every fold are written to")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'backtest')
@@ -0,0 +1,200 @@
+'''
+Benchmarks of the optimisation and forecasting hot paths.
+
+Every benchmark is timed on the bundled inputs and on synthetic instances of several sizes, so
+it shows both where the time goes today and how it grows with the grid:
+
+    generate_cost_depots                 cost of moving all biomass to each candidate depot
+    update_biomass_depot                 one depot filled from its nearest biomass
+    update_biomass_refinery              one refinery filled from its nearest depots
+    fill_depots_and_calculate_transport  fitness of one depot set, as scored by genetic_solution
+    calculate_cost_of_transportation     transport cost of both years of flows
+    predict_biomass_2018                 forecast of every site
+
+A benchmark is run in batches long enough to time reliably, the batches are repeated and the
+best, median and mean time per call are kept. Results are written as json together with the
+commit and versions they were measured on, and an earlier run can be compared against:
+
+    python benchmark.py
+    python benchmark.py --sizes 1000 5000 --output benchmarks/after.json --compare benchmarks/before.json
+    python benchmark.py --sizes --instances instances/10k
+
+Everything runs offline, the synthetic instances are generated in memory from their seed, see
+instance_generator.py, or loaded from the directories they were written to.
+'''
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import timeit
+import numpy as np
+import pandas as pd
+from data_context import DATA, using_inputs
+from instance_generator import SEED, generate_instance, load_instance
+from cost_helpers import YEARS, calculate_cost_of_transportation
+from greedy_solution import (DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY,
+                             BIOMASS_COLLECTION_RATE, forecast_to_array, select_facilities, generate_cost_depots,
+                             update_biomass_depot, update_biomass_refinery)
+from genetic_solution import fill_depots_and_calculate_transport
+from instrumentation import add_instrumentation_arguments, run_instrumented
+from solution import predict_biomass_2018
+
+SIZES = [500, 2000, 5000] # sites of the synthetic instances
+REPEATS = 5
+MIN_BATCH_TIME = 0.2 # seconds a batch of calls runs for at least
+BENCHMARKS_DIR = 'benchmarks'
+
+def flow_rows(flows: tuple, data_type: str) -> pd.DataFrame:
+    """
+    Flows as the rows of a submission, the same flows in every year
+    """
+    sources, destinations, values = flows
+    return pd.concat([pd.DataFrame({"year": year, "data_type": data_type, "source_index": sources,
+                                    "destination_index": destinations, "value": values}) for year in YEARS])
+
+def benchmark_cases() -> dict:
+    """
+    Builds the inputs of every benchmark on the current DATA from a greedy solution.
+
+    Returns:
+        name -> function of no arguments running the benchmarked call once
+    """
+    forecast = predict_biomass_2018().iloc[:, [0, 11]]
+    biomass = forecast_to_array(forecast)
+    depots, biomass_flows = select_facilities(biomass.copy(), DATA.number_of_depots, DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE)
+    depots = sorted(depots)
+    pellets = np.zeros(len(biomass))
+    pellets[depots] = DEPOT_PROCESSING_CAPACITY
+    refineries, pellet_flows = select_facilities(pellets, DATA.number_of_refineries, REFINERY_PROCESSING_CAPACITY, sources=depots)
+    depot_forecast = pd.DataFrame({"2018/2019": DEPOT_PROCESSING_CAPACITY}, index=depots)
+    candidates = np.arange(DATA.number_of_sites)
+    biomass_rows = flow_rows(biomass_flows, "biomass_demand_supply")
+    pellet_rows = flow_rows(pellet_flows, "pellet_demand_supply")
+
+    def transport_cost():
+        with contextlib.redirect_stdout(io.StringIO()):
+            return calculate_cost_of_transportation(biomass_rows, pellet_rows)
+
+    return {
+        "generate_cost_depots": lambda: generate_cost_depots(DATA.distances, forecast, [], candidates),
+        "update_biomass_depot": lambda: update_biomass_depot(depots[0], forecast.copy(), DATA.neighbour_order, {}),
+        "update_biomass_refinery": lambda: update_biomass_refinery(refineries[0], depot_forecast.copy(), DATA.neighbour_order, {}),
+        "fill_depots_and_calculate_transport": lambda: fill_depots_and_calculate_transport(depots, biomass),
+        "calculate_cost_of_transportation": transport_cost,
+        "predict_biomass_2018": predict_biomass_2018,
+    }
+
+def time_call(function, repeats: int = REPEATS, min_batch_time: float = MIN_BATCH_TIME) -> dict:
+    """
+    Times a call in batches of at least min_batch_time seconds, after one untimed call that loads
+    whatever it reads lazily.
+
+    Returns:
+        dict: calls per batch, batches, and the best, median and mean seconds per call
+    """
+    function()
+    timer = timeit.Timer(function)
+    number = 1
+    while timer.timeit(number) < min_batch_time:
+        number *= 2
+    per_call = np.array(timer.repeat(repeats, number)) / number
+    return {"number": number, "repeats": repeats, "best": per_call.min(), "median": float(np.median(per_call)), "mean": per_call.mean()}
+
+def run_instance(instance: str, benchmarks: list[str] = None, repeats: int = REPEATS, min_batch_time: float = MIN_BATCH_TIME) -> list[dict]:
+    """
+    Runs the benchmarks on the inputs DATA currently points at
+
+    Args:
+        instance: Name of the instance, stored with each result
+        benchmarks: Names of the benchmarks to run, all of them when None
+    """
+    results = []
+    for name, function in benchmark_cases().items():
+        if benchmarks is not None and name not in benchmarks:
+            continue
+        timing = time_call(function, repeats, min_batch_time)
+        results.append({"benchmark": name, "instance": instance, "n_sites": DATA.number_of_sites, **timing})
+        print(f"{instance:>16} {name:<38} {timing['median'] * 1e3:12.4f} ms")
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_metadata() -> dict:
+    return {
+        "created": datetime.datetime.now().isoformat(timespec='seconds'),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpus": os.cpu_count(),
+    }
+
+def write_results(run: dict, path: str):
+    """
+    Writes a run as json, through a temporary file so a crashed run never leaves half a file
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as temp_file:
+        json.dump(run, temp_file, indent=2)
+    os.replace(temp_path, path)
+
+def compare(results: list[dict], baseline: list[dict]):
+    """
+    Prints the median time of every result next to the same benchmark and instance of a baseline run
+    """
+    previous = {(result["benchmark"], result["instance"]): result["median"] for result in baseline}
+    print(f"{'instance':>16} {'benchmark':<38} {'baseline ms':>12} {'ms':>12} {'speedup':>8}")
+    for result in results:
+        key = (result["benchmark"], result["instance"])
+        if key in previous:
+            print(f"{result['instance']:>16} {result['benchmark']:<38} {previous[key] * 1e3:12.4f} "
+                  f"{result['median'] * 1e3:12.4f} {previous[key] / result['median']:7.2f}x")
+
+def main(sizes: list[int] = SIZES, instances: list[str] = (), bundled: bool = True, benchmarks: list[str] = None, repeats: int = REPEATS,
+         min_batch_time: float = MIN_BATCH_TIME, seed: int = SEED, output: str = None, compare_with: str = None):
+    results = []
+    if bundled:
+        results += run_instance("bundled", benchmarks, repeats, min_batch_time)
+    for n_sites in sizes:
+        with using_inputs(generate_instance(n_sites, seed)):
+            results += run_instance(f"synthetic-{n_sites}", benchmarks, repeats, min_batch_time)
+    for directory in instances:
+        with using_inputs(load_instance(directory)):
+            results += run_instance(os.path.basename(os.path.normpath(directory)), benchmarks, repeats, min_batch_time)
+
+    run = {**run_metadata(), "seed": seed, "results": results}
+    output = output or os.path.join(BENCHMARKS_DIR, f"benchmark-{run['created'].replace(':', '')}.json")
+    write_results(run, output)
+    print("==> Results written to", output)
+    if compare_with:
+        with open(compare_with) as baseline_file:
+            compare(results, json.load(baseline_file)["results"])
+    return run
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Time the optimisation and forecasting hot paths")
+    parser.add_argument('--sizes', type=int, nargs='*', default=SIZES, help="sites of the synthetic instances")
+    parser.add_argument('--instances', nargs='+', default=[], help="directories of instances written by instance_generator.py")
+    parser.add_argument('--no-bundled', dest='bundled', action='store_false', help="skip the bundled inputs")
+    parser.add_argument('--benchmarks', nargs='+', help="names of the benchmarks to run, all of them when not given")
+    parser.add_argument('--repeats', type=int, default=REPEATS, help="timed batches per benchmark")
+    parser.add_argument('--min-batch-time', type=float, default=MIN_BATCH_TIME, help="seconds a batch runs for at least")
+    parser.add_argument('--seed', type=int, default=SEED, help="seed of the synthetic instances")
+    parser.add_argument('--output', help=f"json file of the results, a timestamped file in {BENCHMARKS_DIR}/ when not given")
+    parser.add_argument('--compare', dest='compare_with', help="json file of an earlier run to compare against")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'benchmark')
@@ -0,0 +1,107 @@
+'''
+Checkpoints and run budgets for the long running optimisers.
+
+A checkpoint is a pickled dict holding everything a run needs to carry on exactly where it
+stopped: the population or current solution, the best solution so far, the iteration number and
+the state of the random generators. It is written to a temporary file first and then renamed, so
+a run killed in the middle of a save still leaves the previous checkpoint intact.
+
+The run arguments are shared by genetic_solution, gradient_descent_depots and
+gradient_descent_refineries, e.g.
+
+    python genetic_solution.py --iterations 5000 --checkpoint ga.pkl
+    python genetic_solution.py --time-budget 3600 --checkpoint ga.pkl --resume
+'''
+import argparse
+import os
+import pickle
+import random
+import time
+import numpy as np
+
+CHECKPOINT_INTERVAL = 300 # seconds between two checkpoints
+
+def save_checkpoint(path: str, state: dict):
+    """
+    Pickles the state of a run to path, replacing the previous checkpoint atomically
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as temp_file:
+        pickle.dump(state, temp_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
+
+def load_checkpoint(path: str) -> dict:
+    with open(path, 'rb') as checkpoint_file:
+        return pickle.load(checkpoint_file)
+
+def random_state(rng: np.random.Generator = None) -> dict:
+    """
+    State of the random module and of a numpy generator, see restore_random_state
+    """
+    return {
+        'random': random.getstate(),
+        'numpy': rng.bit_generator.state if rng is not None else None,
+    }
+
+def restore_random_state(state: dict, rng: np.random.Generator = None):
+    random.setstate(state['random'])
+    if rng is not None and state['numpy'] is not None:
+        rng.bit_generator.state = state['numpy']
+
+def check_fitness(state: dict, fitness: str):
+    """
+    Refuses to resume a run with another fitness than the one it was started with, the costs it
+    carries would not compare with the new ones. Checkpoints written before the fitness was
+    recorded are taken as they are.
+    """
+    saved = state.get('fitness', fitness)
+    if saved != fitness:
+        raise ValueError(f"the checkpoint was written with --fitness {saved}, resume it with the same fitness instead of {fitness}")
+
+def add_run_arguments(parser: argparse.ArgumentParser):
+    """
+    Adds the budget and checkpoint options shared by the optimisers to parser
+    """
+    parser.add_argument('--iterations', type=int, help="number of iterations to run, asked for when no budget is given")
+    parser.add_argument('--time-budget', type=float, help="stop after the iteration that exceeds this many seconds")
+    parser.add_argument('--seed', type=int, help="seed of the random generators, ignored when resuming")
+    parser.add_argument('--checkpoint', help="file the run state is saved to")
+    parser.add_argument('--checkpoint-every', type=float, default=CHECKPOINT_INTERVAL, help="seconds between two checkpoints")
+    parser.add_argument('--resume', action='store_true', help="carry on from the state saved in --checkpoint")
+    return parser
+
+def check_run_arguments(parser: argparse.ArgumentParser, args: argparse.Namespace):
+    if args.resume and not args.checkpoint:
+        parser.error("--resume needs --checkpoint")
+    return args
+
+def is_interactive(iterations: int, time_budget: float, resume: bool) -> bool:
+    """
+    Runs without any budget fall back to asking for the number of iterations
+    """
+    return iterations is None and time_budget is None and not resume
+
+def out_of_time(start_time: float, time_budget: float) -> bool:
+    return time_budget is not None and time.monotonic() - start_time >= time_budget
+
+class CheckpointTimer:
+    """
+    Saves a checkpoint at most once every `interval` seconds, or not at all when path is None
+    """
+    def __init__(self, path: str, interval: float = CHECKPOINT_INTERVAL):
+        self.path = path
+        self.interval = interval
+        self.last_save = time.monotonic()
+
+    def maybe_save(self, make_state, force: bool = False):
+        """
+        Saves make_state() when the interval has passed or force is set. make_state is only
+        called when a checkpoint is written.
+        """
+        if self.path is None:
+            return False
+        if not force and time.monotonic() - self.last_save < self.interval:
+            return False
+        save_checkpoint(self.path, make_state())
+        self.last_save = time.monotonic()
+        return True
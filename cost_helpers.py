@@ -1,97 +1,142 @@
+import numpy as np
 import pandas as pd
+from data_context import DATA, lazy_inputs
 
-DISTANCE_MATRIX = pd.read_csv('Distance_Matrix.csv')
-SAMPLE_SUBMISSION = pd.read_csv("sample_submission.csv")
+__getattr__ = lazy_inputs(__name__, {'DISTANCE_MATRIX': 'distance_matrix', 'SAMPLE_SUBMISSION': 'sample_submission'})
 DEPOT_PROCESSING_CAPACITY = 20000
 REFINERY_PROCESSING_CAPACITY = 100000
+TRANSPORT_COST_WEIGHT = 0.001
+UNDERUTILIZATION_COST_WEIGHT = 1
+YEARS = (2018, 2019)
+DATA_TYPES = ("depot_location", "refinery_location", "biomass_forecast", "biomass_demand_supply", "pellet_demand_supply")
 
 def calculate_cost_of_single_trip(src: int, dest: int, value: int):
     
-    return DISTANCE_MATRIX.iloc[src, dest + 1] * value
+    return DATA.distances.pairs(src, dest) * value
+
+def calculate_cost_of_flows(sources: np.ndarray, destinations: np.ndarray, values: np.ndarray):
+    """
+    Transport cost of many trips at once, gathering all distances in one indexed read.
+
+    Args:
+        sources: Index of the source of each trip
+        destinations: Index of the destination of each trip
+        values: Amount moved in each trip
+
+    Returns:
+        float: Sum of distance * value over all trips
+    """
+    return float(np.dot(DATA.distances.pairs(sources, destinations), values))
+
+def calculate_cost_per_destination(sources: np.ndarray, destinations: np.ndarray, values: np.ndarray):
+    """
+    Transport cost of many trips, summed per destination.
+
+    Returns:
+        dict: {destination: cost}, in order of first appearance of each destination
+    """
+    trip_costs = DATA.distances.pairs(sources, destinations) * values
+    unique_destinations, first_trip, trip_destinations = np.unique(destinations, return_index=True, return_inverse=True)
+    destination_costs = np.bincount(trip_destinations, weights=trip_costs, minlength=len(unique_destinations))
+    return {int(unique_destinations[i]): float(destination_costs[i]) for i in np.argsort(first_trip)}
+
+def calculate_cost_of_destination(sources: np.ndarray, destination: int, values: np.ndarray):
+    """
+    Transport cost of all trips into one destination, summed in the same order as
+    calculate_cost_per_destination so both give the same float.
+    """
+    trip_costs = DATA.distances.pairs(sources, destination) * values
+    return float(np.bincount(np.zeros(len(trip_costs), dtype=np.intp), weights=trip_costs, minlength=1)[0])
+
+def split_flows(demand_supply: pd.DataFrame):
+    """
+    Splits demand supply rows of a submission into (years, sources, destinations, values) arrays.
+    """
+    return (demand_supply["year"].to_numpy(dtype=np.int64),
+            demand_supply["source_index"].to_numpy(dtype=np.int64),
+            demand_supply["destination_index"].to_numpy(dtype=np.int64),
+            demand_supply["value"].to_numpy(dtype=np.float64))
+
+def transportation_cost_breakdown(biomass_demand_supply: pd.DataFrame, pellet_demand_supply: pd.DataFrame, years: tuple = YEARS) -> dict:
+    """
+    Transport cost of a submission per data_type and per year.
+
+    Returns:
+        dict: {"biomass_demand_supply": {year: cost}, "pellet_demand_supply": {year: cost}, "total": cost}
+    """
+    breakdown = {"total": 0}
+    for data_type, demand_supply in (("biomass_demand_supply", biomass_demand_supply), ("pellet_demand_supply", pellet_demand_supply)):
+        flow_years, sources, destinations, values = split_flows(demand_supply)
+        trip_costs = DATA.distances.pairs(sources, destinations) * values
+        breakdown[data_type] = {year: float(trip_costs[flow_years == year].sum()) for year in years}
+        breakdown["total"] += sum(breakdown[data_type].values())
+    return breakdown
+
+def underutilization_cost_breakdown(biomass_demand_supply: pd.DataFrame, pellet_demand_supply: pd.DataFrame, depot_locations: pd.DataFrame, refinery_locations: pd.DataFrame, years: tuple = YEARS) -> dict:
+    """
+    Underutilization cost of a submission per facility type and per year.
+
+    Only flows into the listed depots and refineries count towards their utilization.
+
+    Returns:
+        dict: {"depot": {year: cost}, "refinery": {year: cost}, "total": cost}
+    """
+    breakdown = {"total": 0}
+    facilities = (("depot", biomass_demand_supply, depot_locations, DEPOT_PROCESSING_CAPACITY),
+                  ("refinery", pellet_demand_supply, refinery_locations, REFINERY_PROCESSING_CAPACITY))
+    for facility, demand_supply, locations, capacity in facilities:
+        sites = np.unique(locations["source_index"].to_numpy(dtype=np.int64))
+        flow_years, sources, destinations, values = split_flows(demand_supply)
+        into_sites = np.isin(destinations, sites)
+        breakdown[facility] = {year: float(capacity * len(sites) - values[into_sites & (flow_years == year)].sum()) for year in years}
+        breakdown["total"] += sum(breakdown[facility].values())
+    return breakdown
+
+def submission_cost_breakdown(submission: pd.DataFrame) -> dict:
+    """
+    Full cost breakdown of a submission in the format of sample_submission.csv.
+
+    Returns:
+        dict: {"transport": {...}, "underutilization": {...}, "total": weighted overall cost}
+    """
+    rows = {data_type: submission[submission["data_type"] == data_type] for data_type in DATA_TYPES}
+    transport = transportation_cost_breakdown(rows["biomass_demand_supply"], rows["pellet_demand_supply"])
+    underutilization = underutilization_cost_breakdown(rows["biomass_demand_supply"], rows["pellet_demand_supply"], rows["depot_location"], rows["refinery_location"])
+    return {
+        "transport": transport,
+        "underutilization": underutilization,
+        "total": TRANSPORT_COST_WEIGHT * transport["total"] + UNDERUTILIZATION_COST_WEIGHT * underutilization["total"]
+    }
 
 def calculate_cost_of_transportation(biomass_demand_supply: pd.DataFrame, pellet_demand_supply: pd.DataFrame):
-    cost = 0
-    cost_in_2018 = 0
-    cost_in_2019 = 0
-    # Sum biomass cost 
-    for index, biomass_row in biomass_demand_supply.iterrows():
-        distance_cost = calculate_cost_of_single_trip(int(biomass_row["source_index"]), int(biomass_row["destination_index"]), biomass_row["value"])
-        cost += distance_cost
-        if biomass_row["year"] == 2018:
-            cost_in_2018 += distance_cost
-        else:
-            cost_in_2019 += distance_cost
-
-    print("~ Transport cost for depots in 2018 is", cost_in_2018)
-    print("~ Transport cost for depots in 2019 is", cost_in_2019)
-
-    # Sum pellet cost 
-    cost_in_2018 = 0
-    cost_in_2019 = 0
-    for index, pellet_row in pellet_demand_supply.iterrows():
-        distance_cost = calculate_cost_of_single_trip(int(pellet_row["source_index"]), int(pellet_row["destination_index"]), pellet_row["value"])
-        cost += distance_cost
-        if pellet_row["year"] == 2018:
-            cost_in_2018 += distance_cost
-        else:
-            cost_in_2019 += distance_cost
-
-    print("~ Transport cost for refineries in 2018 is", cost_in_2018)
-    print("~ Transport cost for refineries in 2019 is", cost_in_2019)
-
-    print ("==> Transport cost is", cost)
-    return cost
+    breakdown = transportation_cost_breakdown(biomass_demand_supply, pellet_demand_supply)
+    for year, cost in breakdown["biomass_demand_supply"].items():
+        print("~ Transport cost for depots in", year, "is", cost)
+    for year, cost in breakdown["pellet_demand_supply"].items():
+        print("~ Transport cost for refineries in", year, "is", cost)
+    print ("==> Transport cost is", breakdown["total"])
+    return breakdown["total"]
 
 def calculate_cost_of_underutilization(biomass_demand_supply: pd.DataFrame, pellet_demand_supply: pd.DataFrame, depot_locations: pd.DataFrame, refinery_locations: pd.DataFrame):
-    depots = {
-        2018: {},
-        2019: {}
-    }
-    refineries = {
-        2018: {},
-        2019: {}
-    }
-    for index, depot_row in depot_locations.iterrows():
-        depots[2018][depot_row["source_index"]] = 0
-        depots[2019][depot_row["source_index"]] = 0
-    for index, refinery_row in refinery_locations.iterrows():
-        refineries[2018][refinery_row["source_index"]] = 0
-        refineries[2019][refinery_row["source_index"]] = 0
-
-    for index, biomass_row in biomass_demand_supply.iterrows():
-        depots[biomass_row["year"]][biomass_row["destination_index"]] += biomass_row["value"] 
-
-    for index, pellet_row in pellet_demand_supply.iterrows():
-        refineries[pellet_row["year"]][pellet_row["destination_index"]] += pellet_row["value"] 
-
-    cost = 0
-    for year, location_dict in depots.items():
-        yearly_cost = 0
-        for index, value in location_dict.items():
-            yearly_cost += DEPOT_PROCESSING_CAPACITY - value
-        print("~ Underutilization cost for depots in", year, "is", yearly_cost)
-        cost += yearly_cost
-
-    for year, location_dict in refineries.items():
-        yearly_cost = 0
-        for index, value in location_dict.items():
-            yearly_cost += REFINERY_PROCESSING_CAPACITY - value
-        print("~ Underutilization cost for refineries in", year, "is", yearly_cost)
-        cost += yearly_cost
-    print("==> Underutilization cost is", cost)
-    return cost
+    breakdown = underutilization_cost_breakdown(biomass_demand_supply, pellet_demand_supply, depot_locations, refinery_locations)
+    for year, cost in breakdown["depot"].items():
+        print("~ Underutilization cost for depots in", year, "is", cost)
+    for year, cost in breakdown["refinery"].items():
+        print("~ Underutilization cost for refineries in", year, "is", cost)
+    print("==> Underutilization cost is", breakdown["total"])
+    return breakdown["total"]
 
 
 def test_calculate_transport():
-    biomass_demand_supply = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "biomass_demand_supply"]
-    pellet_demand_supply = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "pellet_demand_supply"]
+    biomass_demand_supply = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "biomass_demand_supply"]
+    pellet_demand_supply = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "pellet_demand_supply"]
     calculate_cost_of_transportation(biomass_demand_supply, pellet_demand_supply)
     return
 
 def test_calculate_underutilization():
-    depot_rows = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "depot_location"]
-    refinery_rows = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "refinery_location"]
-    biomass_demand_supply = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "biomass_demand_supply"]
-    pellet_demand_supply = SAMPLE_SUBMISSION[SAMPLE_SUBMISSION.iloc[:, 1] == "pellet_demand_supply"]
+    depot_rows = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "depot_location"]
+    refinery_rows = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "refinery_location"]
+    biomass_demand_supply = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "biomass_demand_supply"]
+    pellet_demand_supply = DATA.sample_submission[DATA.sample_submission.iloc[:, 1] == "pellet_demand_supply"]
     calculate_cost_of_underutilization(depot_locations=depot_rows, refinery_locations=refinery_rows, biomass_demand_supply=biomass_demand_supply, pellet_demand_supply=pellet_demand_supply)
     return
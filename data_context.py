@@ -0,0 +1,131 @@
+'''
+Problem inputs, loaded on first use.
+
+Importing a module of this repository reads no file. The distance matrix, neighbour order,
+biomass history and sample submission are attributes of DATA and are only loaded, and for the
+distance matrix converted to its binary copy, the first time they are used. A worker process
+therefore starts without touching the inputs it does not need.
+
+    from data_context import DATA
+    DATA.distances.pairs(sources, destinations)
+
+DATA.distances is the distance provider of distance_provider.py, the dense matrix by default or
+distances computed from the coordinates of the sites with distance_provider='haversine'.
+
+The module level names the inputs used to have, e.g. greedy_solution.DISTANCE_MATRIX, still
+resolve through lazy_inputs, loading the input when they are first looked up.
+'''
+import os
+from contextlib import contextmanager
+from functools import cached_property
+import pandas as pd
+from distance_matrix import DISTANCE_MATRIX_CSV, binary_path, load_distance_matrix, load_neighbour_order
+from distance_provider import ROAD_FACTOR, DenseDistances, HaversineDistances, calibrate_road_factor
+
+BIOMASS_HISTORY_CSV = 'Biomass_History.csv'
+SAMPLE_SUBMISSION_CSV = 'sample_submission.csv'
+NEIGHBOUR_ORDER_K = None # keep every neighbour, a smaller k stops fills at the k-th nearest site
+NUMBER_OF_DEPOTS = 15
+NUMBER_OF_REFINERIES = 3
+DISTANCE_PROVIDERS = ('dense', 'haversine')
+DISTANCE_PROVIDER = 'dense'
+
+class DataContext:
+    def __init__(self, distance_matrix_csv: str = DISTANCE_MATRIX_CSV, biomass_history_csv: str = BIOMASS_HISTORY_CSV,
+                 sample_submission_csv: str = SAMPLE_SUBMISSION_CSV, neighbour_order_k: int = NEIGHBOUR_ORDER_K,
+                 number_of_depots: int = NUMBER_OF_DEPOTS, number_of_refineries: int = NUMBER_OF_REFINERIES,
+                 distance_provider: str = DISTANCE_PROVIDER, road_factor: float = None):
+        """
+        Args:
+            distance_matrix_csv: Distance matrix, see distance_matrix.py
+            biomass_history_csv: Biomass harvested at each site in each year
+            sample_submission_csv: Example of the submission format
+            neighbour_order_k: Neighbours kept per site, all of them when None, or distance_provider.NEIGHBOUR_ORDER_K for 'haversine'
+            number_of_depots, number_of_refineries: Facilities a solution of the instance places
+            distance_provider: 'dense' reads the distance matrix, 'haversine' computes distances from the coordinates
+            road_factor: Road over great circle distance for 'haversine', fitted against the distance matrix when None
+        """
+        if distance_provider not in DISTANCE_PROVIDERS:
+            raise ValueError(f"distance_provider must be one of {DISTANCE_PROVIDERS}, got {distance_provider!r}")
+        self.distance_matrix_csv = distance_matrix_csv
+        self.biomass_history_csv = biomass_history_csv
+        self.sample_submission_csv = sample_submission_csv
+        self.neighbour_order_k = neighbour_order_k
+        self.number_of_depots = number_of_depots
+        self.number_of_refineries = number_of_refineries
+        self.distance_provider = distance_provider
+        self.road_factor = road_factor
+
+    @cached_property
+    def distance_matrix(self):
+        return load_distance_matrix(self.distance_matrix_csv)
+
+    @cached_property
+    def distances(self):
+        if self.distance_provider == 'dense':
+            return DenseDistances(self.distance_matrix)
+        return HaversineDistances(self.biomass_history["Latitude"].to_numpy(), self.biomass_history["Longitude"].to_numpy(),
+                                  self.road_factor or self.fitted_road_factor())
+
+    def fitted_road_factor(self) -> float:
+        """
+        Road factor fitted against the distance matrix, ROAD_FACTOR when there is none
+        """
+        if self.distance_matrix_csv is None or not any(os.path.exists(path) for path in (self.distance_matrix_csv, binary_path(self.distance_matrix_csv))):
+            return ROAD_FACTOR
+        return calibrate_road_factor(self.distance_matrix, self.biomass_history["Latitude"].to_numpy(), self.biomass_history["Longitude"].to_numpy())
+
+    @cached_property
+    def neighbour_order(self):
+        if self.distance_provider == 'dense':
+            return load_neighbour_order(self.neighbour_order_k, self.distance_matrix_csv)
+        return self.distances.neighbour_order(self.neighbour_order_k)
+
+    @cached_property
+    def number_of_sites(self) -> int:
+        return len(self.distances)
+
+    @cached_property
+    def biomass_history(self) -> pd.DataFrame:
+        """
+        The history as read, shared by every caller, the forecasts of solution.py work on copies of it
+        """
+        return pd.read_csv(self.biomass_history_csv)
+
+    @cached_property
+    def sample_submission(self) -> pd.DataFrame:
+        return pd.read_csv(self.sample_submission_csv)
+
+DATA = DataContext()
+
+@contextmanager
+def using_inputs(context: DataContext):
+    """
+    Points DATA at the inputs of another context for the length of a with block, e.g. a synthetic
+    instance whose inputs were set directly instead of read from files. Modules hold DATA itself,
+    so its attributes are swapped rather than the name rebound.
+    """
+    saved = dict(DATA.__dict__)
+    DATA.__dict__.clear()
+    DATA.__dict__.update(context.__dict__)
+    try:
+        yield DATA
+    finally:
+        DATA.__dict__.clear()
+        DATA.__dict__.update(saved)
+
+def lazy_inputs(module_name: str, names: dict):
+    """
+    Module __getattr__ resolving old module level input names from DATA, e.g.
+
+        __getattr__ = lazy_inputs(__name__, {'DISTANCE_MATRIX': 'distance_matrix'})
+
+    Args:
+        module_name: __name__ of the module, for the error message
+        names: Module level name -> DataContext attribute
+    """
+    def __getattr__(name: str):
+        if name in names:
+            return getattr(DATA, names[name])
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+    return __getattr__
@@ -0,0 +1,171 @@
+'''
+Shared store for the site to site distance matrix.
+
+Distance_Matrix.csv is parsed once and converted into a float32 .npy file next to it.
+Every later load memory-maps the .npy file read-only, so start up takes milliseconds and
+all processes on the machine share the same pages through the OS page cache.
+
+The matrix is a plain array: DISTANCE_MATRIX[source, destination].
+
+The neighbour order index is cached the same way: NEIGHBOUR_ORDER[site] lists the sources
+sorted by their distance to that site, optionally truncated to the k nearest, so fill routines
+never have to sort a distance column again.
+'''
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from instrumentation import add_instrumentation_arguments, run_instrumented
+
+DISTANCE_MATRIX_CSV = 'Distance_Matrix.csv'
+DISTANCE_MATRIX_DTYPE = np.float32
+NEIGHBOUR_ORDER_DTYPE = np.int32
+NEIGHBOUR_ORDER_BLOCK_SIZE = 256
+
+_loaded_matrices = {}
+
+def binary_path(csv_path: str) -> str:
+    """
+    Path of the binary copy of a distance matrix csv, e.g. Distance_Matrix.csv -> Distance_Matrix.npy
+    """
+    return os.path.splitext(csv_path)[0] + '.npy'
+
+def convert_distance_matrix(csv_path: str = DISTANCE_MATRIX_CSV, npy_path: str = None) -> str:
+    """
+    Parses the distance matrix csv and writes it as a float32 .npy file.
+
+    The file is written to a temporary name first and then renamed, so a process loading the
+    matrix never sees a half written file.
+
+    Args:
+        csv_path: Path of the csv, first column is the row index and the header holds the site indexes
+        npy_path: Destination of the binary copy, defaults to the csv path with a .npy extension
+
+    Returns:
+        Path of the written .npy file
+    """
+    npy_path = npy_path or binary_path(csv_path)
+    distances = pd.read_csv(csv_path, index_col=0).to_numpy(dtype=DISTANCE_MATRIX_DTYPE)
+    if distances.shape[0] != distances.shape[1]:
+        raise ValueError(f"{csv_path} is not a square matrix: {distances.shape}")
+    temp_path = f"{npy_path}.{os.getpid()}.tmp"
+    with open(temp_path, 'wb') as temp_file:
+        np.save(temp_file, distances)
+    os.replace(temp_path, npy_path)
+    return npy_path
+
+def is_stale(csv_path: str, npy_path: str) -> bool:
+    if not os.path.exists(npy_path):
+        return True
+    return os.path.exists(csv_path) and os.path.getmtime(csv_path) > os.path.getmtime(npy_path)
+
+def load_distance_matrix(csv_path: str = DISTANCE_MATRIX_CSV, npy_path: str = None) -> np.ndarray:
+    """
+    Returns the distance matrix as a read-only memory-mapped array.
+
+    The csv is only parsed when the binary copy is missing or older than the csv. Repeated calls
+    in the same process return the same array.
+
+    Args:
+        csv_path: Path of the distance matrix csv
+        npy_path: Path of the binary copy, defaults to the csv path with a .npy extension
+
+    Returns:
+        (n_sites x n_sites) array, indexed as [source, destination]
+    """
+    npy_path = npy_path or binary_path(csv_path)
+    key = os.path.abspath(npy_path)
+    if key not in _loaded_matrices:
+        if is_stale(csv_path, npy_path):
+            convert_distance_matrix(csv_path, npy_path)
+        _loaded_matrices[key] = np.load(npy_path, mmap_mode='r')
+    return _loaded_matrices[key]
+
+def neighbour_order_path(npy_path: str, k: int = None) -> str:
+    """
+    Path of the neighbour order index of a binary distance matrix, e.g. Distance_Matrix.order.npy
+    or Distance_Matrix.order_k200.npy when truncated
+    """
+    suffix = '.order.npy' if k is None else f'.order_k{k}.npy'
+    return os.path.splitext(npy_path)[0] + suffix
+
+def build_neighbour_order(distances: np.ndarray, k: int = None) -> np.ndarray:
+    """
+    Sorts the sources of every site by their distance to it.
+
+    Columns are processed in blocks so the full matrix is never copied at once.
+
+    Args:
+        distances: (n_sites x n_sites) array, indexed as [source, destination]
+        k: Number of nearest sources to keep per site, all of them when None
+
+    Returns:
+        (n_sites x k) array, row j holds the source indexes in ascending distance to j
+    """
+    n_sites = distances.shape[1]
+    k = n_sites if k is None else min(k, n_sites)
+    order = np.empty((n_sites, k), dtype=NEIGHBOUR_ORDER_DTYPE)
+    for start in range(0, n_sites, NEIGHBOUR_ORDER_BLOCK_SIZE):
+        block = np.asarray(distances[:, start:start + NEIGHBOUR_ORDER_BLOCK_SIZE]).T
+        order[start:start + len(block)] = nearest_sources(block, k)
+    return order
+
+def nearest_sources(block: np.ndarray, k: int) -> np.ndarray:
+    """
+    The k nearest sources of a block of sites, nearest first and ties in index order
+
+    Args:
+        block: (n_block x n_sites) distances from every source to each site of the block
+    """
+    if k < block.shape[1]:
+        nearest = np.argpartition(block, k - 1, axis=1)[:, :k]
+        nearest_distances = np.take_along_axis(block, nearest, axis=1)
+        # argpartition keeps any of the sources tied at the k-th distance, those rows are sorted in full
+        kth = nearest_distances.max(axis=1, keepdims=True)
+        for row in np.flatnonzero(np.sum(block == kth, axis=1) > np.sum(nearest_distances == kth, axis=1)):
+            nearest[row] = np.argsort(block[row], kind='stable')[:k]
+            nearest_distances[row] = block[row, nearest[row]]
+        return np.take_along_axis(nearest, np.lexsort((nearest, nearest_distances), axis=1), axis=1)
+    return np.argsort(block, axis=1, kind='stable')
+
+def load_neighbour_order(k: int = None, csv_path: str = DISTANCE_MATRIX_CSV, npy_path: str = None) -> np.ndarray:
+    """
+    Returns the neighbour order index as a read-only memory-mapped array.
+
+    The index is built once from the distance matrix and cached next to it. It is rebuilt when
+    the distance matrix is newer than the cached index.
+
+    Args:
+        k: Number of nearest sources to keep per site, all of them when None
+        csv_path: Path of the distance matrix csv
+        npy_path: Path of the binary distance matrix, defaults to the csv path with a .npy extension
+
+    Returns:
+        (n_sites x k) array, row j holds the source indexes in ascending distance to j
+    """
+    npy_path = npy_path or binary_path(csv_path)
+    order_path = neighbour_order_path(npy_path, k)
+    key = os.path.abspath(order_path)
+    if key not in _loaded_matrices:
+        distances = load_distance_matrix(csv_path, npy_path)
+        if is_stale(npy_path, order_path):
+            temp_path = f"{order_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'wb') as temp_file:
+                np.save(temp_file, build_neighbour_order(distances, k))
+            os.replace(temp_path, order_path)
+        _loaded_matrices[key] = np.load(order_path, mmap_mode='r')
+    return _loaded_matrices[key]
+
+def main():
+    npy_path = convert_distance_matrix()
+    print("==> Distance matrix written to", npy_path)
+    load_neighbour_order(npy_path=npy_path)
+    print("==> Neighbour order written to", neighbour_order_path(npy_path))
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description=f"Convert {DISTANCE_MATRIX_CSV} to its binary copy and build the neighbour order")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'distance_matrix')
@@ -0,0 +1,213 @@
+'''
+Distances between sites behind one interface, read from the dense matrix or computed on demand.
+
+A dense float32 matrix of 50k sites takes 10 GB, so past the bundled grid the distances are
+better computed from the coordinates when they are needed. Fill routines and cost evaluators only
+use these calls, and take either provider:
+
+    distances = DATA.distances
+    distances.pairs(sources, destinations)    # distance of each trip
+    distances.block(sources, destinations)    # (len(sources) x len(destinations)) array
+    distances.weighted_sum(weights, sources)  # weights @ matrix[sources], one value per site
+
+DenseDistances reads the matrix of distance_matrix.py and gives exactly the numbers indexing it
+did. HaversineDistances computes great circle distances times a road factor, fitted against
+Distance_Matrix.csv by calibrate_road_factor, so memory grows linearly with the sites. Blocks it
+computes are kept in a cache of bounded size, most recently used first. Its neighbour order
+keeps the NEIGHBOUR_ORDER_K nearest sources of every site unless told otherwise, so fills stop
+at the k-th nearest site. Pick it with
+
+    DataContext(distance_provider='haversine')
+'''
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import numpy as np
+from distance_matrix import DISTANCE_MATRIX_DTYPE, NEIGHBOUR_ORDER_BLOCK_SIZE, NEIGHBOUR_ORDER_DTYPE, build_neighbour_order, nearest_sources
+
+EARTH_RADIUS = 6371.0 # km
+ROAD_FACTOR = 1.3 # road distance over great circle distance, when there is no matrix to fit it against
+CALIBRATION_PAIRS = 100000 # site pairs the road factor is fitted on
+TILE_SIZE = 256 # sites per side of a cached block
+CACHE_BYTES = 256 * 2**20 # memory the cached blocks take at most
+ROWS_PER_CHUNK = 512 # rows computed at once by weighted_sum
+NEIGHBOUR_ORDER_K = 2048 # neighbours kept per site when no k is given, a full order would take as much memory as the matrix
+
+def haversine(latitude_a, longitude_a, latitude_b, longitude_b):
+    """
+    Great circle distance in km between a and b, broadcast like any numpy operation, e.g.
+    haversine(lat[:, None], lon[:, None], lat[None, :], lon[None, :]) is the full matrix
+    """
+    latitude_a, longitude_a, latitude_b, longitude_b = (np.radians(angle) for angle in (latitude_a, longitude_a, latitude_b, longitude_b))
+    h = (np.sin((latitude_b - latitude_a) / 2) ** 2
+         + np.cos(latitude_a) * np.cos(latitude_b) * np.sin((longitude_b - longitude_a) / 2) ** 2)
+    return 2 * EARTH_RADIUS * np.arcsin(np.sqrt(np.minimum(h, 1.0)))
+
+def calibrate_road_factor(distance_matrix: np.ndarray, latitude: np.ndarray, longitude: np.ndarray,
+                          pairs: int = CALIBRATION_PAIRS, seed: int = 0) -> float:
+    """
+    Least squares factor from great circle to road distances, over random pairs of distinct sites
+
+    Args:
+        distance_matrix: Road distances, indexed as [source, destination]
+        latitude, longitude: Coordinates of the sites, in the order of the matrix
+    """
+    rng = np.random.default_rng(seed)
+    sources, destinations = rng.integers(len(latitude), size=(2, pairs))
+    distinct = sources != destinations
+    sources, destinations = sources[distinct], destinations[distinct]
+    road = np.asarray(distance_matrix[sources, destinations], dtype=np.float64)
+    straight = haversine(latitude[sources], longitude[sources], latitude[destinations], longitude[destinations])
+    return float(road @ straight / (straight @ straight))
+
+class DistanceProvider(ABC):
+    """
+    Interface of the providers, see the module docstring. Indexes are site index arrays, None
+    stands for every site.
+    """
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abstractmethod
+    def pairs(self, sources, destinations):
+        ...
+
+    @abstractmethod
+    def block(self, sources=None, destinations=None) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def weighted_sum(self, weights: np.ndarray, sources=None) -> np.ndarray:
+        ...
+
+    @abstractmethod
+    def neighbour_order(self, k: int = None) -> np.ndarray:
+        """
+        (n_sites x k) array, row j holds the source indexes in ascending distance to j, see distance_matrix.build_neighbour_order
+        """
+
+class DenseDistances(DistanceProvider):
+    def __init__(self, matrix: np.ndarray):
+        """
+        Args:
+            matrix: (n_sites x n_sites) distances indexed as [source, destination], e.g. distance_matrix.load_distance_matrix()
+        """
+        self.matrix = matrix
+
+    def __len__(self) -> int:
+        return len(self.matrix)
+
+    def pairs(self, sources, destinations):
+        return self.matrix[sources, destinations]
+
+    def block(self, sources=None, destinations=None) -> np.ndarray:
+        if sources is None:
+            return np.asarray(self.matrix if destinations is None else self.matrix[:, destinations])
+        if destinations is None:
+            return np.asarray(self.matrix[sources])
+        return np.asarray(self.matrix[np.ix_(sources, destinations)])
+
+    def weighted_sum(self, weights: np.ndarray, sources=None) -> np.ndarray:
+        return weights @ (self.matrix if sources is None else self.matrix[sources])
+
+    def neighbour_order(self, k: int = None) -> np.ndarray:
+        return build_neighbour_order(self.matrix, k)
+
+class HaversineDistances(DistanceProvider):
+    def __init__(self, latitude: np.ndarray, longitude: np.ndarray, road_factor: float = ROAD_FACTOR, cache_bytes: int = CACHE_BYTES):
+        """
+        Args:
+            latitude, longitude: Coordinates of every site, in site index order
+            road_factor: Road distance over great circle distance, see calibrate_road_factor
+            cache_bytes: Memory the cached blocks take at most
+        """
+        self.latitude = np.asarray(latitude, dtype=np.float64)
+        self.longitude = np.asarray(longitude, dtype=np.float64)
+        self.road_factor = road_factor
+        self.max_tiles = max(1, cache_bytes // (TILE_SIZE * TILE_SIZE * np.dtype(DISTANCE_MATRIX_DTYPE).itemsize))
+        self.tiles = OrderedDict()
+        self.neighbour_orders = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.latitude)
+
+    def distances(self, sources, destinations) -> np.ndarray:
+        """
+        Uncached (len(sources) x len(destinations)) distances, as the float32 a dense matrix would hold
+        """
+        sources = slice(None) if sources is None else sources
+        destinations = slice(None) if destinations is None else destinations
+        straight = haversine(self.latitude[sources, None], self.longitude[sources, None],
+                             self.latitude[None, destinations], self.longitude[None, destinations])
+        return (self.road_factor * straight).astype(DISTANCE_MATRIX_DTYPE)
+
+    def tile(self, row: int, column: int) -> np.ndarray:
+        key = (row, column)
+        if key in self.tiles:
+            self.hits += 1
+            self.tiles.move_to_end(key)
+            return self.tiles[key]
+        self.misses += 1
+        tile = self.distances(slice(row * TILE_SIZE, (row + 1) * TILE_SIZE), slice(column * TILE_SIZE, (column + 1) * TILE_SIZE))
+        self.tiles[key] = tile
+        if len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+        return tile
+
+    def pairs(self, sources, destinations):
+        straight = haversine(self.latitude[sources], self.longitude[sources], self.latitude[destinations], self.longitude[destinations])
+        return (self.road_factor * straight).astype(DISTANCE_MATRIX_DTYPE)
+
+    def block(self, sources=None, destinations=None) -> np.ndarray:
+        """
+        Reads the block from cached tiles, unless it spans every site on one side, which would
+        sweep the whole cache and is computed directly instead
+        """
+        if sources is None or destinations is None:
+            return self.distances(sources, destinations)
+        sources = np.asarray(sources, dtype=np.int64).ravel()
+        destinations = np.asarray(destinations, dtype=np.int64).ravel()
+        block = np.empty((len(sources), len(destinations)), dtype=DISTANCE_MATRIX_DTYPE)
+        source_tiles, destination_tiles = sources // TILE_SIZE, destinations // TILE_SIZE
+        for row in np.unique(source_tiles):
+            in_row = np.flatnonzero(source_tiles == row)
+            for column in np.unique(destination_tiles):
+                in_column = np.flatnonzero(destination_tiles == column)
+                block[np.ix_(in_row, in_column)] = self.tile(row, column)[np.ix_(sources[in_row] % TILE_SIZE, destinations[in_column] % TILE_SIZE)]
+        return block
+
+    def weighted_sum(self, weights: np.ndarray, sources=None) -> np.ndarray:
+        """
+        weights @ matrix[sources], computed ROWS_PER_CHUNK rows at a time and skipping zero weights
+        """
+        sources = np.arange(len(self)) if sources is None else np.asarray(sources)
+        weights = np.asarray(weights)
+        nonzero = np.flatnonzero(weights)
+        total = np.zeros(len(self))
+        for start in range(0, len(nonzero), ROWS_PER_CHUNK):
+            rows = nonzero[start:start + ROWS_PER_CHUNK]
+            total += weights[rows] @ self.distances(sources[rows], None)
+        return total
+
+    def neighbour_order(self, k: int = None) -> np.ndarray:
+        """
+        The NEIGHBOUR_ORDER_K nearest sources of every site when k is None, never the full order.
+        An order is built once and kept for later calls.
+        """
+        n_sites = len(self)
+        k = min(NEIGHBOUR_ORDER_K if k is None else k, n_sites)
+        if k not in self.neighbour_orders:
+            order = np.empty((n_sites, k), dtype=NEIGHBOUR_ORDER_DTYPE)
+            for start in range(0, n_sites, NEIGHBOUR_ORDER_BLOCK_SIZE):
+                # distances are symmetric, the rows of a block of sites are its columns
+                order[start:start + NEIGHBOUR_ORDER_BLOCK_SIZE] = nearest_sources(self.distances(slice(start, start + NEIGHBOUR_ORDER_BLOCK_SIZE), None), k)
+            self.neighbour_orders[k] = order
+        return self.neighbour_orders[k]
+
+def as_distances(distances) -> DistanceProvider:
+    """
+    Wraps a plain matrix in a DenseDistances, providers are returned as they are
+    """
+    return distances if isinstance(distances, DistanceProvider) else DenseDistances(distances)
@@ -0,0 +1,109 @@
+'''
+Array based greedy fill of depots and refineries.
+
+A facility is filled from its nearest sources first until it reaches capacity, the last source
+only giving what still fits. The supply is a plain float array indexed by site and is updated
+in place. Instead of stepping through the neighbours one site at a time, the available amounts
+of a block of neighbours are summed cumulatively and the point where the facility is full is
+found with a binary search. Blocks start small and double, since most facilities fill up from
+their first few dozen neighbours.
+
+Flows are returned in COO form, as parallel (sources, destinations, values) arrays.
+'''
+import numpy as np
+from instrumentation import METRICS
+
+FILL_BLOCK_SIZE = 64
+
+def fill_facility(neighbours: np.ndarray, supply: np.ndarray, capacity: float, ratio: float = 1.0):
+    """
+    Fills one facility from its sorted neighbours and removes what was moved from the supply.
+
+    A source that fits completely gives supply * ratio and is emptied. The source that would
+    overflow the facility gives only the remaining capacity, which is subtracted from its supply.
+
+    Args:
+        neighbours: Source indexes in ascending distance to the facility
+        supply: Amount available at each index, updated in place
+        capacity: Amount the facility takes before it is full
+        ratio: Share of a source's supply that arrives at the facility
+
+    Returns:
+        sources: Index of each source that moved something
+        values: Amount moved from each source
+    """
+    sources, values, _ = fill_facility_scanned(neighbours, supply, capacity, ratio)
+    return sources, values
+
+def fill_facility_scanned(neighbours: np.ndarray, supply: np.ndarray, capacity: float, ratio: float = 1.0, start: int = 0, filled: float = 0.0):
+    """
+    Same as fill_facility, also returning how many of the nearest neighbours the fill depends on.
+    The flows only change when the supply of one of neighbours[:scanned] changes.
+
+    A fill can be resumed at neighbours[start] with the amount it had filled by then, giving
+    the same flows from there on as a fill started from the first neighbour.
+
+    Returns:
+        sources, values: See fill_facility, from neighbours[start] on
+        scanned: Length of the neighbour prefix up to the source that filled the facility,
+            all neighbours when it never filled up
+    """
+    scanned = start
+    sources = []
+    values = []
+    block_size = FILL_BLOCK_SIZE
+    while start < len(neighbours) and filled < capacity:
+        block = np.asarray(neighbours[start:start + block_size])
+        available = supply[block] * ratio
+        cumulative = np.cumsum(np.concatenate(([filled], available)))[1:]
+        stop = int(np.searchsorted(cumulative, capacity, side='right'))
+        supply[block[:stop]] = 0
+        sources.append(block[:stop])
+        values.append(available[:stop])
+        if stop < len(block):
+            before = cumulative[stop - 1] if stop else filled
+            scanned = start + stop
+            if before < capacity:
+                supply[block[stop]] -= capacity - before
+                sources.append(block[stop:stop + 1])
+                values.append(np.array([capacity - before]))
+                scanned += 1
+            filled = capacity
+        else:
+            filled = cumulative[-1]
+            scanned = start + len(block)
+        start += len(block)
+        block_size *= 2
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0), scanned
+    sources = np.concatenate(sources)
+    values = np.concatenate(values)
+    moved = values > 0
+    return sources[moved].astype(np.int64), values[moved], scanned
+
+def fill_facilities(facilities: list, supply: np.ndarray, capacity: float, neighbour_order: np.ndarray, ratio: float = 1.0):
+    """
+    Fills each facility in turn, later facilities only getting what earlier ones left behind.
+
+    Args:
+        facilities: Facility indexes in fill order
+        supply: Amount available at each index, updated in place
+        capacity: Amount each facility takes before it is full
+        neighbour_order: Sources of each index sorted by distance, see distance_matrix.load_neighbour_order
+        ratio: Share of a source's supply that arrives at the facility
+
+    Returns:
+        sources, destinations, values: Flows as parallel arrays
+    """
+    sources = []
+    destinations = []
+    values = []
+    with METRICS.timer('fill'):
+        for facility in facilities:
+            facility_sources, facility_values = fill_facility(neighbour_order[facility], supply, capacity, ratio)
+            sources.append(facility_sources)
+            destinations.append(np.full(len(facility_sources), facility, dtype=np.int64))
+            values.append(facility_values)
+    if not sources:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0)
+    return np.concatenate(sources), np.concatenate(destinations), np.concatenate(values)
@@ -0,0 +1,126 @@
+'''
+Incremental evaluation of single facility swaps.
+
+Facilities are filled one after another in sorted order, each taking from its nearest sources
+what the facilities before it left behind. A FillState keeps, for every facility of a set, the
+supply it saw, the flows it produced and the neighbours its fill depends on. Swapping one
+facility for another only changes the supply around the two of them, so evaluate_swap replays
+the fill from the first position that changed and only fills again the facilities that scan a
+site whose supply is different. Every other facility reuses its stored flows, which gives
+exactly the same costs as filling the whole set again.
+'''
+import numpy as np
+from cost_helpers import calculate_cost_of_destination
+from fill_kernel import fill_facility, fill_facility_scanned
+from instrumentation import METRICS
+
+class FillState:
+    def __init__(self, facilities: list, supply: np.ndarray, capacity: float, neighbour_order: np.ndarray, ratio: float = 1.0):
+        """
+        Fills the facilities in sorted order and keeps what each fill depended on.
+
+        Args:
+            facilities: Facility indexes, filled in sorted order
+            supply: Amount available at each index before any facility is filled, left unchanged
+            capacity: Amount each facility takes before it is full
+            neighbour_order: Sources of each index sorted by distance, see distance_matrix.load_neighbour_order
+            ratio: Share of a source's supply that arrives at the facility
+        """
+        self.facilities = sorted(int(facility) for facility in facilities)
+        self.capacity = capacity
+        self.neighbour_order = neighbour_order
+        self.ratio = ratio
+        self.position = {facility: i for i, facility in enumerate(self.facilities)}
+        self.supply_before = [] # supply each facility saw
+        self.flows = [] # (sources, values) of each facility
+        self.supply_after = [] # supply left at the sources of each facility
+        self.scanned = [] # neighbours each fill depends on
+        self.filled_before = [] # amount filled before each scanned neighbour
+        self.source_positions = [] # position of each source among the scanned neighbours
+        self.costs = []
+        remaining = np.array(supply, dtype=np.float64)
+        with METRICS.timer('fill'):
+            for facility in self.facilities:
+                neighbours = np.asarray(self.neighbour_order[facility])
+                self.supply_before.append(remaining.copy())
+                sources, values, scanned = fill_facility_scanned(neighbours, remaining, capacity, ratio)
+                self.flows.append((sources, values))
+                self.supply_after.append(remaining[sources])
+                self.scanned.append(neighbours[:scanned])
+                # the kernel sums what it takes in one running sum, so this gives its exact amounts
+                available = self.supply_before[-1][neighbours[:scanned]] * ratio
+                self.filled_before.append(np.cumsum(np.concatenate(([0.0], available)))[:scanned])
+                self.source_positions.append(np.flatnonzero(available > 0))
+                self.costs.append(calculate_cost_of_destination(sources, facility, values))
+        self.remaining = remaining
+
+    def facility_costs(self) -> dict:
+        """
+        Transport cost of each facility, in sorted order
+        """
+        return dict(zip(self.facilities, self.costs))
+
+    def total_cost(self) -> float:
+        return sum(self.costs)
+
+    def refill(self, position: int, supply: np.ndarray, start: int) -> float:
+        """
+        Fills the facility at position again from supply, updated in place, and returns its cost.
+
+        Before scanned neighbour `start`, the first one whose supply changed, the fill takes the
+        same as before, so it is resumed from there.
+        """
+        facility = self.facilities[position]
+        supply[self.scanned[position][:start]] = 0
+        head = np.searchsorted(self.source_positions[position], start)
+        sources, values = self.flows[position]
+        tail_sources, tail_values, _ = fill_facility_scanned(np.asarray(self.neighbour_order[facility]), supply, self.capacity, self.ratio,
+                                                             start, self.filled_before[position][start])
+        sources = np.concatenate((sources[:head], tail_sources))
+        values = np.concatenate((values[:head], tail_values))
+        return calculate_cost_of_destination(sources, facility, values)
+
+    def evaluate_swap(self, old: int, new: int) -> float:
+        """
+        Total transport cost of the set with facility old replaced by new, the state is left unchanged.
+
+        The fill is replayed from the first position the swap changes. A facility whose scanned
+        neighbours hold exactly the supply it saw before gives the same flows again, so its stored
+        result is applied instead of filling it. The others are resumed at their first changed
+        neighbour, see refill.
+        """
+        new = int(new)
+        removed_position = self.position[old]
+        facilities = sorted(self.facilities[:removed_position] + self.facilities[removed_position + 1:] + [new])
+        start = min(removed_position, facilities.index(new))
+        supply = self.supply_before[start].copy()
+        total_cost = sum(self.costs[:start])
+        new_filled = False
+        with METRICS.timer('fill'):
+            for facility in facilities[start:]:
+                if facility == new:
+                    sources, values = fill_facility(np.asarray(self.neighbour_order[new]), supply, self.capacity, self.ratio)
+                    total_cost += calculate_cost_of_destination(sources, new, values)
+                    new_filled = True
+                    continue
+                position = self.position[facility]
+                if new_filled and position > removed_position and np.array_equal(supply, self.supply_before[position]):
+                    # both changes are behind and left no trace, the rest of the fill is the same as before
+                    for cost in self.costs[position:]:
+                        total_cost += cost
+                    return total_cost
+                scanned = self.scanned[position]
+                changed = np.flatnonzero(supply[scanned] != self.supply_before[position][scanned])
+                if len(changed) == 0:
+                    supply[self.flows[position][0]] = self.supply_after[position]
+                    total_cost += self.costs[position]
+                else:
+                    total_cost += self.refill(position, supply, int(changed[0]))
+            return total_cost
+
+    def swap(self, old: int, new: int):
+        """
+        Returns the state of the set with facility old replaced by new
+        """
+        facilities = [facility for facility in self.facilities if facility != old] + [int(new)]
+        return FillState(facilities, self.supply_before[0], self.capacity, self.neighbour_order, self.ratio)
@@ -0,0 +1,63 @@
+'''
+Bounded LRU cache for the fitness of depot and refinery sets.
+
+The optimisers keep revisiting the same sets: the genetic population collapses to copies of
+the elite, and the gradient descent scripts try the same neighbours again and again. Sets are
+keyed by their sorted indexes, so callers must also fill them in that sorted order for a cached
+cost to equal a fresh one.
+'''
+from collections import OrderedDict
+
+FITNESS_CACHE_SIZE = 100000
+
+def canonical(sites) -> tuple:
+    """
+    Canonical form of a set of site indexes: sorted, as a tuple of ints
+    """
+    return tuple(sorted(int(site) for site in sites))
+
+class FitnessCache:
+    def __init__(self, maxsize: int = FITNESS_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Returns the cached value and marks it as recently used, counting a hit or a miss
+        """
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+        self.misses += 1
+        return default
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value of key, calling compute() and caching its result on a miss
+        """
+        if key in self._entries:
+            return self.get(key)
+        self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def report(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups if lookups else 0
+        return f"{self.hits} hits, {self.misses} misses ({hit_rate:.1%} hit rate), {len(self)}/{self.maxsize} entries"
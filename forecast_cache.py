@@ -0,0 +1,70 @@
+'''
+Content-addressed cache of the biomass forecasts.
+
+A forecast is stored under a hash of the contents of the history, the name of the model and
+its parameters, e.g. forecast_cache/3f2a...e1.pkl. The history is hashed as the loaded table,
+not as a file, so instances built in memory are cached the same way. Editing the history or changing a parameter
+gives a new key, so a stale forecast is never loaded, and a hit is a single unpickle.
+
+Files are written to a temporary name and renamed into place. Two runs computing the same
+forecast at once both write the same content, and runs with different forecasts write to
+different files, so no run ever reads a file another run is still writing.
+'''
+import hashlib
+import json
+import os
+import pandas as pd
+from instrumentation import METRICS
+
+FORECAST_CACHE_DIR = 'forecast_cache'
+FORECAST_CACHE_VERSION = 2 # bump when the forecasting code changes what a model returns
+
+def frame_digest(frame: pd.DataFrame) -> str:
+    """
+    sha256 of the column names, dtypes and values of a table
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(column), str(dtype)] for column, dtype in frame.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(frame, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+def forecast_key(history: pd.DataFrame, model: str, params: dict) -> str:
+    """
+    Key of a forecast, the hash of the history contents, the model and its parameters
+    """
+    description = json.dumps({
+        'version': FORECAST_CACHE_VERSION,
+        'history': frame_digest(history),
+        'model': model,
+        'params': params,
+    }, sort_keys=True)
+    return hashlib.sha256(description.encode()).hexdigest()
+
+def forecast_path(key: str, cache_dir: str = FORECAST_CACHE_DIR) -> str:
+    return os.path.join(cache_dir, f"{key}.pkl")
+
+def cached_forecast(make_forecast, history: pd.DataFrame, model: str, params: dict, cache_dir: str = FORECAST_CACHE_DIR) -> pd.DataFrame:
+    """
+    Loads a forecast from the cache, computing and storing it with make_forecast() on a miss.
+
+    Args:
+        make_forecast: Function returning the forecast DataFrame
+        history: Biomass history the forecast is computed from
+        model: Name of the forecasting model
+        params: Parameters of the model, must be json serialisable
+        cache_dir: Directory of the cached forecasts
+
+    Returns:
+        The forecast, a fresh copy on every call
+    """
+    path = forecast_path(forecast_key(history, model, params), cache_dir)
+    if os.path.exists(path):
+        METRICS.count('forecast_cache.hits')
+        return pd.read_pickle(path)
+    METRICS.count('forecast_cache.misses')
+    forecast = make_forecast()
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    forecast.to_pickle(temp_path)
+    os.replace(temp_path, path)
+    return forecast.copy()
@@ -1,11 +1,11 @@
-from greedy_solution import update_biomass_refinery, update_biomass_depot, remove_empty_biomass, remove_empty_dist, generate_depot_matrix, generate_submission
+import argparse
+from data_context import DATA, lazy_inputs
+from greedy_solution import update_biomass_refinery, update_biomass_depot, remove_empty_biomass, remove_empty_dist, generate_submission
 from solution import predict_biomass, predict_biomass_average
+from instrumentation import add_instrumentation_arguments, run_instrumented
 import pandas as pd
 
-DISTANCE_MATRIX = pd.read_csv('Distance_Matrix.csv')
-SAMPLE_SUBMISSION = pd.read_csv("sample_submission.csv")
-NUMBER_OF_DEPOTS = 15
-NUMBER_OF_REFINERIES = 3
+__getattr__ = lazy_inputs(__name__, {'SAMPLE_SUBMISSION': 'sample_submission'})
 DEPOT_PROCESSING_CAPACITY = 20000 * 0.95
 REFINERY_PROCESSING_CAPACITY = 100000 * 0.95
 
@@ -14,25 +14,28 @@ refineries =  [1424, 1750, 1161]
 
 def main():
     biomass_forecast = predict_biomass().iloc[:,[0,11]]
-    dist_mat = DISTANCE_MATRIX.copy()
     total_cost = 0
 
     biomass_demand_supply = {}
     for index in depots:
         print(index)
-        move_to_depot_cost, biomass_forecast = update_biomass_depot(index,biomass_forecast,dist_mat, biomass_demand_supply)
+        move_to_depot_cost, biomass_forecast = update_biomass_depot(index,biomass_forecast,DATA.neighbour_order, biomass_demand_supply)
         total_cost += move_to_depot_cost
 
-    depot_forecast = pd.DataFrame({'Index': depots, '2018/2019':[DEPOT_PROCESSING_CAPACITY,]*NUMBER_OF_DEPOTS}, index = depots)
-    dist_mat_2 = generate_depot_matrix(depots)
+    depot_forecast = pd.DataFrame({'Index': depots, '2018/2019':[DEPOT_PROCESSING_CAPACITY,]*len(depots)}, index = depots)
     pellet_demand_supply = {}
     for index2 in refineries:   
-        move_to_refinery_cost , depot_forecast = update_biomass_refinery(index2,depot_forecast,dist_mat_2,pellet_demand_supply)
+        move_to_refinery_cost , depot_forecast = update_biomass_refinery(index2,depot_forecast,DATA.neighbour_order,pellet_demand_supply)
         total_cost += move_to_refinery_cost
 
     print("total cost: " + str(total_cost))
 
     generate_submission(depots, refineries, biomass_demand_supply, pellet_demand_supply)
 
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Write the submission of a fixed set of depots and refineries")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    run_instrumented(main, parse_arguments(), 'generate_genetic_solution')
\ No newline at end of file
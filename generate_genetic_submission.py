@@ -1,19 +1,20 @@
+import argparse
+import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from cost_helpers import DEPOT_PROCESSING_CAPACITY, calculate_cost_of_single_trip
 from solution import predict_biomass
 from generate_submission import update_biomass_demand_supply, update_pellet_demand_supply, generate_submission
-from greedy_solution import NUMBER_OF_DEPOTS, NUMBER_OF_REFINERIES, generate_cost_depots, generate_depot_matrix, remove_empty_biomass, remove_empty_dist, update_biomass_depot, update_biomass_refinery
-
-DISTANCE_MATRIX = pd.read_csv('Distance_Matrix.csv')
+from data_context import DATA
+from instrumentation import add_instrumentation_arguments, run_instrumented
+from greedy_solution import generate_cost_depots, remove_empty_biomass, remove_empty_dist, update_biomass_depot, update_biomass_refinery
 
 def fill_depots_and_track_demand_supply(depots: set[int], forecasted_biomass: pd.DataFrame, biomass_demand_supply: dict):
     cost = 0
     for depot in depots:
         biomass_in_depot = 0
-        shortest_dist_matrix = DISTANCE_MATRIX.sort_values(by=str(depot), ascending=True)
-        shortest_dist_col = shortest_dist_matrix.loc[:, str(depot)]
-        for index, value in shortest_dist_col.items():
+        for index in DATA.neighbour_order[depot]:
+            value = DATA.distances.pairs(index, depot)
             if biomass_in_depot >= DEPOT_PROCESSING_CAPACITY:
                 break
             if biomass_in_depot + forecasted_biomass.loc[index,'2018/2019'] > DEPOT_PROCESSING_CAPACITY:
@@ -35,19 +36,20 @@ def main():
     print(total_cost)
     return
     pellet_demand_supply = {}
-    depot_forecast = pd.DataFrame({'Index': list(set_of_depots), '2018/2019':[int(20000),]*NUMBER_OF_DEPOTS}, index = list(set_of_depots))
-    dist_mat_2 = generate_depot_matrix(set_of_depots)
+    depot_forecast = pd.DataFrame({'Index': list(set_of_depots), '2018/2019':[int(20000),]*len(set_of_depots)}, index = list(set_of_depots))
+    dist_mat_2 = DATA.distances
+    candidates = np.arange(len(dist_mat_2))
     refineries = []
-    for i in tqdm(range(NUMBER_OF_REFINERIES), desc = "Iterating through refineries"):
-        generated_refinery = generate_cost_depots(dist_mat_2, depot_forecast)
+    for i in tqdm(range(DATA.number_of_refineries), desc = "Iterating through refineries"):
+        generated_refinery = generate_cost_depots(dist_mat_2, depot_forecast, refineries, candidates)
         refineries.append(generated_refinery)
 
-        move_to_refinery_cost , updated_depot_forecast = update_biomass_refinery(generated_refinery,depot_forecast,dist_mat_2,pellet_demand_supply)
+        move_to_refinery_cost , updated_depot_forecast = update_biomass_refinery(generated_refinery,depot_forecast,DATA.neighbour_order,pellet_demand_supply)
         total_cost += move_to_refinery_cost
 
         index_to_remove, depot_forecast = remove_empty_biomass(updated_depot_forecast)
         #biomass_forecast.to_csv('after_remove_empty_biomass.csv')
-        dist_mat_2 = remove_empty_dist(index_to_remove, dist_mat_2)
+        candidates = remove_empty_dist(index_to_remove, candidates)
         #dist_mat.to_csv('after_remove_empty_dist.csv')
 
     print("The total transportation cost (depots to refineries) is " + str(total_cost))
@@ -56,6 +58,11 @@ def main():
     generate_submission(set_of_depots, refineries, biomass_demand_supply, pellet_demand_supply)
     return
 
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Transport cost of the depots found by the genetic search")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'generate_genetic_submission')
 
@@ -9,189 +9,41 @@ Requirements for Submission:
 
 '''
 from typing import List
+import numpy as np
 import pandas as pd
 from solution import predict_biomass
-
-
-
-temp_solution = [299, 683, 810, 867, 1121, 1161, 1224, 1330, 1403, 1542, 1595, 1612, 1691, 1751, 1978]
-temp_data = {1161: {1161: 241.45173262500003, 1162: 131.45091437875, 1160: 185.79109477875002, 1106: 135.36300706749998, 1218: 51.3573830125, 1107: 207.94981765625, 1217: 283.8874836, 1216: 324.325349825, 1163: 188.88752937750002, 1159: 253.84435465, 1105: 66.37757110625, 1277: 46.864413260000006, 1053: 275.1290121, 1275: 302.22350885, 1051: 324.27381515, 1164: 60.41974329999999, 1052: 142.05235670874998, 1276: 119.980801595, 1055: 19.73462772375, 1050: 153.54984377875, 1108: 341.8543376875, 1215: 350.481008525, 1104: 248.0152521, 1158: 205.91758825000002, 1274: 394.0826320625, 998: 311.98776625000005, 997: 116.79136656874999, 1214: 345.28005601250004, 1054: 182.6597976525, 1278: 44.34153890625, 1341: 451.88523863750004, 1109: 54.63212871625, 1049: 213.64357281249997, 1219: 71.2993989, 999: 208.75327969375002, 1165: 96.82026386125, 1157: 151.22822189625, 1103: 289.50131035, 996: 259.76500607500003, 1110: 70.30791759625001, 
-1344: 121.6397667125, 995: 190.2606029475, 1220: 15.177267790000002, 1213: 186.4569254025, 935: 155.20568181000002, 994: 166.93981839, 1342: 355.07084655, 1345: 19.766255976249997, 1407: 448.860067375, 1406: 281.0765180625, 1408: 337.5929775125, 1340: 293.52329634999995, 1221: 29.019214153750003, 1048: 130.9865922975, 1343: 265.116647725, 932: 329.727125175, 1212: 255.2272319875, 936: 146.95583152875002, 993: 159.92043782625, 1102: 140.890458125, 934: 309.42594337500003, 1166: 155.026885975, 1111: 136.924649225, 1272: 299.651649475, 1405: 314.9801273375, 1339: 247.6607971125, 1346: 233.64960480000002, 871: 243.29257773749998, 1156: 173.96204852875, 1410: 235.986412025, 1101: 173.60243223, 933: 124.67354677874998, 1409: 320.4622402125, 1112: 189.43489647500002, 1211: 153.093413355, 1167: 178.3496780375, 1271: 332.258853925, 931: 254.7774133625, 1056: 114.92174052375, 1155: 197.602626795, 1470: 324.27649974999997, 1058: 129.9787693, 1411: 150.04858016625002, 1469: 277.5589342125, 938: 154.2755069625, 1222: 128.37519265625, 937: 82.82101964875001, 870: 161.06920623124998, 873: 44.245618105, 1273: 328.84397314999995, 1338: 208.9214325, 1057: 159.8697052125, 1404: 299.0903511125, 1468: 204.50230312125, 1472: 309.2258682125, 874: 160.04101848624998, 1281: 115.41055108625, 1154: 137.41196156499998, 868: 182.73761082249996, 1210: 97.98275361749984}, 1403: {1403: 168.55261900375, 1466: 218.78964949374995, 1402: 150.67055035, 1465: 106.28122471875, 1337: 160.04428386125, 1527: 65.35079086249999, 1401: 169.0538139325, 1526: 112.13794685, 1467: 306.7093563075, 1336: 129.6697182725, 1525: 175.136925705, 1464: 154.17133235125002, 1270: 209.2991323475, 1528: 133.58934689625, 1529: 223.53523827125002, 1335: 225.4822711925, 1463: 208.04409791625002, 1588: 155.71911717375, 1269: 138.53781271999998, 1589: 179.76108836374996, 1586: 231.37473393, 1585: 237.46058370125, 1590: 392.2691974625, 1400: 182.30426787749997, 1524: 179.28264189125002, 1462: 261.8620948825, 1648: 231.17020225750002, 1268: 293.49677088749996, 1530: 
-401.40694045, 1587: 113.00986434, 1531: 384.42583655000004, 1584: 436.30901669375004, 1334: 255.33943271249998, 1333: 51.6326658725, 1649: 311.775366775, 1471: 308.0465126125, 1643: 318.4238968000001, 1646: 228.94597148625004, 1523: 257.88375187500003, 1399: 143.1433205625, 1461: 422.57507420875004, 1532: 309.29429245000006, 1210: 81.72879613375017, 1644: 481.7020645125, 1267: 123.13001727124998, 1583: 362.0816774375, 1647: 156.15052126625002, 1592: 214.10593223749999, 1645: 274.10677620875003, 1522: 357.6005134675, 1398: 287.4602017475, 1266: 37.12663531125, 1591: 349.87862205, 1533: 192.004410735, 1704: 235.1629018475, 1642: 293.939585685, 1153: 140.26663589625, 1700: 408.868816375, 1699: 556.47286985, 1703: 276.5292005375, 1582: 329.66974069, 1698: 274.18139552499997, 1593: 333.0937461875, 1534: 153.03920364375, 1209: 92.97218656375, 1701: 287.6878194625, 1100: 314.5868549375, 1697: 384.67084886125, 1473: 336.6233959375, 1207: 58.3249454475, 1397: 259.75213385, 1332: 130.79231524625, 1047: 151.80460356499998, 1046: 150.63956355874998, 1208: 43.031295777500006, 1757: 265.90303801249996, 1641: 361.34872055125004, 1460: 221.7863306875, 1521: 256.35727883125, 1099: 171.06133366500003, 1098: 218.3401603625, 1594: 376.201028825, 1331: 343.04490184124995, 1151: 231.48887632500004, 1696: 83.31335020625556}, 1224: {1224: 233.17814637500004, 1283: 43.01706171, 1225: 244.0495948875, 1282: 90.06368733, 1223: 189.69022180000002, 1169: 238.73545265, 1226: 196.96490763750003, 1168: 229.4856834375, 1284: 182.7000141125, 1347: 83.88701725125, 1285: 235.07568170000002, 1227: 225.00558089999998, 1113: 250.1785411875, 1280: 105.05830001875, 1348: 32.88335704875, 1170: 233.6426944625, 1060: 209.59534644999997, 1114: 284.836513525, 1413: 68.03080749499999, 1228: 268.306240075, 1279: 2.8825438916249997, 1352: 121.82416961875, 1351: 77.2629714175, 1417: 1.532264426375, 1415: 0.854799449375, 1414: 14.50828015875, 1171: 171.2415638, 1350: 73.51716566249999, 1286: 285.9188518625, 1115: 173.66128541250004, 1005: 214.3733558625, 1059: 232.26553535, 1412: 196.8626956875, 1416: 1.145796813125, 1349: 8.861923218, 1172: 294.927057275, 1061: 149.53463363749998, 1475: 248.05037689999995, 1004: 211.59689521250002, 1287: 356.2169074875, 1353: 304.60773657500005, 1419: 58.1638817775, 1229: 310.23983764999997, 1006: 152.60526180000002, 1062: 151.9568872375, 1288: 412.8150672875, 1476: 74.70719051375, 1173: 328.1285839125, 1116: 167.38325308749998, 942: 271.304637925, 943: 158.4426670125, 1536: 117.30882356875, 944: 157.0161399875, 1289: 354.3865928625, 1003: 276.7550125125, 1063: 165.5971403125, 941: 253.40230561250002, 1230: 325.2475395125, 1174: 232.18806648749995, 1535: 211.950391775, 1354: 375.74804877500003, 1474: 508.1888866375, 1002: 301.032373425, 879: 
-241.38818738749998, 1000: 43.992538929999995, 945: 187.350776675, 1117: 209.782554625, 1355: 320.65646933749997, 1290: 380.75299452499996, 1597: 26.27454686, 1119: 151.267046925, 1007: 
-147.43768595, 1175: 132.1119337, 1008: 139.5643367875, 940: 248.2159271125, 1537: 27.8835465925, 1009: 158.99941253749998, 1598: 4.3181154505, 1064: 166.53354739999997, 1001: 251.9887027625, 1420: 164.02397917500002, 946: 183.1096534875, 1118: 216.383882525, 1231: 310.9243431, 877: 270.245191575, 881: 46.948983193749996, 1421: 152.98449515624998, 880: 136.80991649999999, 878: 195.2373847875, 1176: 328.79150391250005, 1656: 54.24676036874999, 1596: 16.874820115, 1356: 357.39715194999997, 1120: 186.1760940625, 1291: 409.56769752499997, 1232: 420.7910976375, 816: 15.38738715625, 939: 285.07753562500005, 882: 42.94911599, 1010: 198.924491875, 815: 102.39878081124999, 1065: 147.9073801125, 812: 249.669094075, 947: 172.14970208749997, 1655: 29.170789002499998, 1066: 167.9919033, 876: 148.7422918909906}, 810: {810: 281.115011225, 744: 238.845363625, 875: 239.625707625, 811: 255.69408226249996, 745: 191.21236418750001, 
-809: 188.892474175, 743: 236.37135697500003, 675: 281.46061705, 676: 186.49805258749998, 876: 138.2928357590094, 746: 129.2073488125, 674: 272.6839446875, 808: 90.75990437749999, 609: 212.1553497375, 673: 351.55709647500004, 677: 158.1558399375, 747: 170.87130356250003, 813: 191.38251686249998, 807: 126.80518054875, 742: 272.0546111875, 607: 317.69111443750006, 608: 216.7722397, 549: 195.36046221249998, 610: 187.26952553750002, 678: 169.7016057875, 672: 289.6769161125, 748: 162.4048290125, 806: 65.11456871124999, 611: 225.94524385000003, 548: 232.72754476249997, 606: 467.0656395, 741: 160.30837726875, 547: 401.3684997625, 814: 177.73069955, 671: 127.82622051874999, 550: 210.10302735, 679: 183.48574066249998, 872: 110.20091533875, 
-740: 24.91433680125, 805: 114.07726477125, 613: 138.209969525, 546: 393.6311435625, 739: 34.14626550625, 545: 227.45561694999998, 605: 248.39335726250002, 612: 173.38786887500004, 551: 
-236.0808181875, 680: 123.17462348750001, 489: 140.24258613749998, 488: 232.25800514999997, 490: 165.03121948749998, 749: 133.6997003625, 804: 274.265604025, 553: 204.8991012625, 552: 195.03902626250002, 486: 134.583186155, 491: 194.8560752875, 434: 109.08738517125, 614: 159.0973587, 554: 259.4325561625, 604: 76.1223301875, 485: 238.63533402499996, 492: 212.31937597499999, 433: 120.96590138625, 435: 158.8009777125, 817: 1.4466636256249998, 738: 103.94374609249999, 487: 318.9684124, 383: 165.87914274999997, 493: 247.87394523749998, 750: 61.211295128749995, 431: 179.5997924875, 681: 144.85864640875, 615: 212.49630166250003, 803: 323.07441328749997, 430: 146.176365875, 382: 164.03656198, 555: 263.9289474375, 543: 15.462440014375, 432: 219.81231688749997, 544: 221.4039726125, 818: 97.79238223499999, 384: 145.2828922375, 437: 221.77463149999997, 751: 50.811618088749995, 484: 280.1735897, 494: 243.62740517499995, 380: 
-300.2147254875, 883: 161.4388503875, 869: 272.9425983375, 616: 220.94195365, 385: 157.7419233375, 682: 117.13162517375, 438: 220.8106784625, 439: 244.58709526250001, 802: 146.262236595, 930: 380.2975330375, 495: 278.85879708749997, 436: 194.658607475, 340: 246.06279566250004, 556: 200.12465476249997, 338: 191.08932234347958}, 1330: {1330: 151.13645576874998, 1329: 108.39689374250001, 1264: 230.722472185, 1396: 110.33423960375, 1395: 105.14273212500001, 1265: 179.07080794875003, 1263: 357.5781173625, 1394: 68.735641837375, 1328: 224.36222791249997, 1459: 117.80678176500001, 1458: 170.26609397750002, 1204: 442.7647495375, 1262: 261.737235065, 1206: 206.1602840375, 1519: 283.1079893175, 1520: 286.83299875625, 1203: 463.25555991249996, 1261: 290.06492710000003, 1393: 167.93679166, 1205: 318.2111988, 1327: 318.59729432374996, 1456: 211.3142356875, 1148: 469.3882942, 1457: 216.04925012499996, 1147: 672.4466934124999, 
-1392: 230.53454257374997, 1326: 362.72755050499995, 1518: 298.20255613, 1455: 229.44338132624998, 1580: 246.70912073875, 1201: 253.81843281249996, 1581: 473.39922334000005, 1150: 179.11959266250003, 1149: 370.4200401125, 1202: 418.63997841250006, 1093: 485.71123887500005, 1454: 279.94409321625, 1092: 435.23484421250004, 1517: 273.023788425, 1095: 178.23647212499998, 1391: 292.1607771025, 1639: 251.58262489999998, 1260: 284.40266369875, 1096: 218.7002983, 1039: 477.03939436250005, 1640: 425.04331588375004, 1094: 473.71126553749997, 1091: 308.7318611, 1579: 263.59701393750004, 1516: 298.9129228525, 1146: 496.0166683125, 1041: 77.75406074625002, 1638: 418.88293790625, 1259: 268.8853449975, 1042: 179.60867596250003, 1515: 351.92039012625, 1390: 258.90253495249993, 1325: 284.12095737000004, 1097: 180.00870991250002, 1152: 163.9189062, 1090: 426.49034119249995, 1037: 273.617733, 1453: 259.37191963375005, 1693: 380.92210006999994, 1695: 318.73617172624995, 1577: 210.661479475, 1578: 253.2689881275, 1040: 286.43871688750005, 1145: 275.10905074874995, 1637: 194.8973533463759}, 1595: {1595: 192.95038032499997, 1653: 402.3707046375, 1652: 521.4294166499999, 1708: 291.80319023749996, 1710: 49.50248456, 1711: 106.4112281875, 1707: 467.46263886250006, 1654: 226.67124176250002, 1657: 10.55796229825, 1712: 19.54406774125, 1709: 129.294971455, 1764: 146.28053759750003, 1762: 328.0154972, 1763: 146.04455376250002, 1706: 315.2849102125, 1765: 51.98263692875, 1766: 31.868103743749998, 1760: 342.81783486250004, 1761: 483.57197952499996, 1818: 123.8260679425, 1767: 0.34135165112500004, 1817: 48.14371967375, 1651: 376.36903953749993, 1819: 249.19847488749997, 
-1759: 272.1942405625, 1650: 319.35422324999996, 1705: 242.85393334999998, 1816: 81.25587320375, 1815: 186.96797371249997, 1820: 254.1712474875, 1870: 143.86485388, 1871: 121.53944779624999, 1872: 190.04974365, 1873: 305.8146553, 1813: 277.9076938625, 1821: 108.90118599625, 1814: 167.1925745125, 1758: 307.0625648625, 1822: 0.615688312625, 1928: 119.08172701875002, 1929: 129.81558419375, 1869: 145.79110620875, 1874: 171.31183719999999, 1927: 122.65222550375, 1868: 319.77942467500003, 1875: 0.937022913375, 1867: 455.3839530875, 1811: 452.4343757625, 1930: 140.1253023125, 1812: 309.63018224999996, 1931: 39.46741151875, 1866: 488.1937484625, 1925: 184.80668544999997, 1810: 478.0314979374999, 1986: 93.34451676375, 1702: 173.64750195374998, 1926: 175.01537322500002, 1988: 2.6644257455, 1865: 415.095794675, 1924: 331.2535819875, 1984: 269.1323165875, 1756: 300.5136509, 1864: 519.1632900625, 1985: 223.49968528749997, 1982: 41.797112465, 2041: 166.5646848625, 1755: 456.4369716625, 1922: 380.3816337625, 1983: 88.83144522625, 2040: 431.8413658125, 2042: 1.6711463182500002, 1987: 58.804074764999996, 1981: 
-150.09153842499998, 1923: 377.6366195625, 1921: 409.3477115625, 1809: 465.023544325, 1979: 298.802278525, 1920: 386.673515325, 2039: 440.82220077499994, 1754: 448.8821105875, 2091: 34.348485231249995, 1980: 193.6998367125, 2089: 441.60394668749996, 2090: 336.39136505, 1863: 288.0872966933821}, 867: {867: 209.80734538750002, 866: 369.62098313750005, 801: 243.7078991125, 737: 159.57824420125002, 736: 109.39462852374999, 929: 493.48898123749996, 865: 227.572580325, 735: 257.2715473375, 668: 9.012361169, 992: 183.19716930874998, 864: 424.59010315, 799: 
-443.9294853375, 991: 302.466144575, 928: 192.64671325, 800: 390.831792825, 734: 205.83917810000003, 990: 202.21458435, 798: 413.49904635, 927: 199.64975548750002, 863: 444.06451796249996, 989: 110.7881383775, 667: 3.023508206125, 733: 287.66221620000005, 732: 243.06853673749995, 926: 202.989911075, 666: 18.32131672, 1044: 104.71023751625, 664: 12.831140520500002, 665: 19.09668862625, 1045: 128.844822415, 925: 171.2049675, 731: 167.84739877500004, 797: 471.7487945875, 862: 644.0377159125, 988: 229.31083298750002, 1043: 113.55446721499999, 796: 613.526885975, 861: 560.1848526, 987: 220.1506347875, 795: 356.226560575, 860: 511.51897429999997, 729: 73.18630171, 730: 159.7431993875, 986: 83.057150365, 663: 1.09372290225, 985: 102.84644127249999, 923: 509.7509689499999, 728: 126.2640571425, 859: 588.5458412375001, 984: 400.604553225, 924: 453.96689223749996, 727: 87.33640909375, 794: 491.33863827500005, 662: 1.841522995375, 922: 723.1680908, 793: 710.6172600000001, 661: 1.2786969245000002, 983: 595.70209885, 921: 792.3380394124999, 1038: 382.646535875, 982: 348.29551123749997, 858: 804.8821182, 598: 86.85343361625002, 920: 543.0859298875, 660: 20.583906531249998, 856: 10.674976112125, 599: 13.079634100375, 482: 9.342683673500002, 792: 191.9824504875, 597: 213.19211387499996, 659: 
-131.3828115475, 791: 0.775533225375, 725: 1.527588674625, 726: 3.669685781, 981: 387.6699066175, 483: 119.1226768575, 724: 0.15139322512499997, 857: 155.36956295762502}, 1121: {1121: 307.912263875, 1122: 439.83196638749996, 1067: 186.179304125, 1177: 334.72499276250005, 1068: 191.972532275, 1123: 245.05152511250003, 1069: 165.4520654625, 1233: 177.5892477, 1012: 156.466223725, 1013: 190.79439733750002, 1178: 242.240638725, 1124: 156.12241269999998, 1179: 400.613170625, 951: 176.9130916625, 1292: 145.711348525, 1070: 173.3553085375, 1014: 180.54026604999999, 1015: 174.9915313875, 950: 147.71496295, 1011: 198.2123050625, 952: 175.71319770000002, 1235: 272.0602760375, 1293: 174.75668336250004, 1016: 164.5813961125, 949: 222.83942985000002, 1180: 303.6450138125, 1358: 234.51608850000002, 1234: 350.75189972499993, 889: 196.2002391875, 1236: 203.2055950125, 1125: 220.657411575, 1071: 331.51753997500003, 888: 149.335206975, 953: 169.3792629125, 1359: 64.70453786625, 948: 150.5202350625, 1017: 75.51083326375, 1360: 26.27244997, 1295: 73.25925637, 823: 149.00582504874998, 1357: 405.7871456125, 890: 190.3046894, 1294: 26.6463086575, 824: 198.85366820000002, 1181: 133.53705405375, 954: 151.1384019875, 1425: 201.982461925, 1237: 154.8280134125, 822: 141.96306420000002, 885: 180.36411858749997, 1072: 152.4167575875, 1426: 151.98664858749999, 825: 150.6290178375, 891: 112.8660717125, 887: 132.2266473875, 886: 164.6626253, 1423: 267.49358176249996, 1361: 103.21766758375, 1126: 130.120334625, 1296: 96.54596042375, 1424: 360.1430931125, 1182: 77.05601740124999, 955: 94.07751942, 1238: 52.98349762125, 1018: 87.11473846, 956: 71.2859487475, 757: 141.932008745, 892: 110.94064521375, 759: 153.76375486249998, 821: 111.596441275, 1073: 118.73341274875, 820: 135.90031051375, 1427: 252.32872962500005, 1486: 288.9717464375, 1485: 237.931921, 1422: 179.96644592500002, 826: 76.7571845075, 1362: 96.72654056125, 884: 215.35833168750003, 1297: 50.3699870125, 827: 75.38839626375, 758: 132.1785650125, 1484: 466.4109649625, 1127: 124.6320247525, 1239: 66.95436048625, 1483: 372.29848098749994, 1183: 118.92070485499998, 893: 88.23199654125, 1487: 265.3472118375, 1074: 74.55079412625, 755: 172.08791542499998, 957: 52.75590705875, 1019: 45.98520612875, 1546: 299.0983028375, 760: 145.24237058750003, 690: 215.1938419375, 754: 195.19591712500002, 1128: 100.63686179125, 1020: 94.65873909875, 756: 100.163426395, 1428: 242.1815280875, 819: 169.41692732500002, 1547: 349.7989235, 689: 159.03539086249998, 1482: 353.4349021875, 1544: 278.4846496625, 752: 97.72834396125, 1545: 294.63190841249997, 753: 146.18550873750002, 1363: 62.87995338500001, 1298: 16.160648106750003, 1481: 201.90413474999997, 1075: 46.280606271249994, 1299: 9.3372349745, 1429: 104.27690453875402}, 683: 
-{683: 88.34428786250001, 684: 170.47483633750002, 617: 154.82875347499998, 618: 209.6658497, 685: 170.09048841249998, 619: 157.4595947125, 557: 162.03468896249998, 558: 187.4260444625, 
-559: 224.27662276249995, 686: 189.03310393750002, 497: 214.3512000875, 499: 172.69508171249998, 496: 228.78464888749997, 620: 188.84648894999998, 687: 153.703000075, 498: 148.18069935875002, 621: 157.31785393750002, 560: 250.02706716250003, 500: 216.41658018750002, 441: 250.774728775, 442: 252.70283510000002, 688: 189.163316725, 561: 229.51397323749998, 440: 240.23564337500002, 443: 169.6167316625, 444: 90.71307087125001, 445: 142.8393068375, 622: 212.130870825, 390: 218.7792530125, 501: 279.84183502499997, 389: 258.00240135, 562: 263.0874805375, 391: 181.71697616249998, 394: 186.676784525, 395: 137.31039522999998, 446: 214.9979553375, 502: 254.58874892500003, 392: 178.7521400625, 623: 189.95714949999999, 346: 194.5031852875, 388: 184.2477131, 393: 170.53952122500002, 563: 169.10217285, 347: 227.5168762125, 387: 142.74539852499998, 396: 205.409086225, 352: 185.95456315, 349: 228.62275314999997, 503: 196.6592445375, 351: 279.35768891249995, 386: 192.30435753749998, 350: 180.73571968750002, 564: 186.76451875, 625: 194.031984325, 344: 183.98010825000003, 348: 250.34525871250003, 353: 64.16563749, 504: 159.44996642499999, 691: 223.9027328625, 624: 190.5342922125, 304: 186.0530033, 447: 249.86214065000001, 305: 218.17533492500002, 448: 133.76892853750002, 345: 198.829774875, 307: 245.12684632500003, 397: 80.35697651375, 303: 190.7663994, 343: 194.72883032500002, 354: 45.858235835, 565: 209.1174678625, 306: 238.4246521, 309: 320.48551177499996, 626: 55.8014173475, 265: 173.66770362499997, 302: 193.040617, 264: 143.61225701249998, 342: 248.57747650000002, 308: 181.7629413625, 449: 161.6300678375, 761: 64.85361385249999, 263: 180.13701628750002, 505: 97.645770065, 692: 71.91468238875001, 311: 154.810195925, 312: 76.49709987624999, 266: 225.2011661625, 270: 171.84382436250002, 355: 177.3405056125, 310: 224.71830178750002, 398: 
-75.02915764000001, 566: 129.64116190000001, 262: 183.00678823750002, 627: 101.78408622750001, 300: 281.15606115, 269: 210.6169014125, 341: 273.1476726625, 506: 120.04626272249999, 762: 
-68.02778148624999, 267: 161.31216240000003, 224: 156.528413775, 271: 212.30368994999998, 301: 288.5260505625, 230: 245.52475547499998, 399: 142.79927443749997, 225: 241.9060859875, 450: 138.15190027499997, 229: 248.60279082500006, 261: 11.048975957506627}, 1751: {1751: 445.61213493749995, 1805: 609.5853119375, 1752: 467.647052775, 1750: 424.2527608875, 1696: 342.1097121162444, 1804: 557.2166175374999, 1806: 530.0932826874999, 1749: 369.44187165000005, 1858: 537.507741975, 1807: 495.8397330875, 1753: 539.584724475, 1803: 423.4604625625, 1860: 474.4344673125001, 1748: 324.4929885875, 1859: 513.8865966875, 1857: 465.34209058749997, 1856: 305.800760275, 1915: 412.5073356625, 1914: 490.4434757375, 1808: 473.0781784125, 1802: 240.01574898, 1916: 368.4217634125, 1694: 281.38415718375, 1861: 438.39287758750004, 1913: 273.9207725625, 1971: 302.83582591375, 1917: 479.5092811749999, 1747: 271.53959656875, 1918: 434.1190795999999, 1855: 161.83738993999998, 1972: 434.28137969999995, 1801: 338.96325541874995, 1862: 492.2443809624999, 1746: 262.66715908125, 1970: 227.150296225, 1974: 611.7376670625, 2026: 300.88463114250004, 1745: 266.18113232875, 1854: 173.81035805, 1919: 400.49044227499996, 2027: 315.125965125, 1800: 358.8300356825, 1911: 189.575330725, 1973: 604.3916359374999, 1975: 533.0601577499999, 1863: 162.21264149411792, 1912: 135.63061046625, 1692: 299.83981658375, 1799: 313.09101580000004, 1637: 90.33970194112408, 1969: 165.28139497249998, 2025: 93.67905377749999, 2029: 493.0247745625, 1853: 130.30763721625, 1976: 152.8857329047678}, 1542: {1542: 272.72503855, 1543: 358.31941412500004, 1541: 311.5724296375, 1601: 124.89520837124999, 1602: 181.145265575, 1540: 116.64718150750002, 1600: 160.85987568374998, 1480: 128.4184522525, 1603: 296.38952063749997, 1661: 298.6380615125, 1662: 357.091354375, 1539: 101.143629075, 1479: 137.30534555, 1660: 218.35946846250005, 1604: 321.7288494, 1599: 26.067579866125, 1717: 315.96812630000005, 1716: 312.570203775, 1658: 3.8804807066249998, 1418: 53.201957699999994, 1478: 
-215.21712875, 1477: 16.73019158675, 1663: 265.6970710625, 1605: 321.7444076625, 1718: 288.3351783875, 1664: 268.9419822625, 1715: 291.62387846250004, 1772: 296.608102825, 1714: 250.43312453750002, 1771: 312.5403824, 1659: 78.90589952625001, 1538: 9.46077793925, 1770: 224.1743144875, 1773: 258.3342857375, 1665: 385.4318122875, 1713: 47.651977062499995, 1719: 326.92869950000005, 1606: 324.6019973625, 1827: 205.21388433750002, 1607: 437.60666276250004, 1768: 117.17721844875001, 1769: 222.03672600000002, 1828: 100.4718151075, 1824: 65.34076882375, 1826: 177.626447675, 1774: 216.8869934125, 1548: 367.050930025, 1608: 409.92198562500005, 1823: 8.739277422750002, 1880: 158.1789417375, 1667: 279.4124488625, 1825: 134.05021571249998, 1881: 123.10140515, 1829: 180.51656339999997, 1879: 320.88926315, 1609: 327.5603370625, 1937: 151.46436785999998, 1429: 96.43380598624597, 1488: 314.5302581875, 1878: 161.42816543749998, 1938: 151.97931860000003, 1549: 380.648265825, 1668: 220.62683676249998, 1882: 218.81210518749998, 1936: 356.54103468750003, 1364: 88.31856822875, 1830: 212.23657798750003, 1877: 33.78345108, 1994: 211.19188118625001, 1939: 147.12054731249998, 1669: 219.05424405, 1935: 330.42875672499997, 1550: 211.2801609125, 1775: 173.39517784999998, 1489: 285.62410544999994, 1934: 246.18091201250002, 1490: 284.3914947375, 1993: 196.4058838125, 1883: 274.79742050000004, 1996: 141.04649734625, 1430: 271.3262596125, 1776: 204.70045662500002, 1670: 209.8030853375, 1940: 201.6642065125, 1876: 0.28504983325, 2048: 199.01430894875, 2047: 254.136615765, 1611: 100.2325448925, 1831: 180.8213691625, 1365: 42.275375604999994, 1995: 128.0476408075, 1610: 132.18360041250003, 1933: 59.77351045625, 1724: 82.96635962125, 1884: 206.41029548750004, 1941: 226.67827988749997, 1932: 0.9976436717500001, 1997: 143.44267894375002, 1992: 115.45034107475658}, 1691: {1691: 235.182106735, 1690: 317.28697967875, 1635: 417.6118288087499, 1636: 262.6534476175, 1744: 228.31060099500002, 1634: 323.23866129249996, 1576: 391.98047159749996, 1798: 325.4206080425, 1743: 334.87082862875, 1689: 235.21398020125, 1797: 390.91024445625, 1633: 136.80105613875, 1851: 139.2623663025, 1688: 256.65130711874997, 1742: 405.82772826875004, 1575: 265.49774314250004, 1514: 278.02240276375, 1687: 388.1803455437499, 1850: 228.14790153250001, 1796: 382.31682395875, 1849: 286.24110506875, 1852: 66.52738976375001, 1574: 75.54771519375001, 1908: 81.97874260500001, 1741: 367.67682743499995, 1632: 148.99698925875, 1513: 148.39068700125, 1907: 190.70133496999998, 1848: 232.38626481250003, 1795: 329.760806565, 1909: 1.5755411460000002, 1794: 168.56714247875001, 1965: 176.67420865625004, 1740: 286.43587016875, 1686: 224.44783736625, 1512: 271.00739574874996, 1910: 83.40722846999999, 1905: 182.8142290175, 1964: 203.57981776250003, 1966: 116.70448255250001, 1573: 67.41262329, 1963: 119.10468674750001, 1847: 231.71237563750003, 1452: 122.50960421999999, 1389: 240.20984505250001, 1631: 260.41523075249995, 1906: 208.818741785, 1739: 45.410982369125, 2021: 132.445841805, 1904: 208.40025138750002, 1968: 160.82551765624999, 1793: 59.01024699, 1962: 132.66025924000002, 
-1967: 180.09610176375003, 2020: 207.30807876250003, 1324: 314.1204752875, 1323: 229.01700544500002, 1388: 245.0821423525, 1961: 152.53024196375, 1685: 101.89892257, 2071: 35.942760944999996, 2018: 224.55430697500003, 2070: 100.21887589, 2022: 130.38095093375, 1845: 141.43590401375002, 1630: 291.56123638, 1738: 33.482143879999995, 1846: 123.38860178499999, 1792: 42.6513786325, 1322: 407.52800846874993, 1451: 63.69538534125, 2072: 49.463098284999994, 1258: 303.94069910750005, 1629: 420.41189002875, 2019: 192.26340772250003, 1571: 201.1809744925, 2023: 165.96884822500002, 1572: 158.17947792, 1960: 122.95293712375, 1257: 266.5253887225, 2024: 181.77439497625, 1684: 98.86227107250001, 1903: 131.2021889775, 1959: 71.3125188375, 2067: 169.47738456625, 1256: 236.597509865, 1450: 81.61018467875, 2117: 55.834548473750004, 2017: 210.6152210375, 1570: 224.12902879749998, 2116: 86.6367836, 2118: 6.4922043085, 1510: 54.80536163275001, 2068: 221.373682975, 1321: 364.02845907374996, 1628: 257.58237742500006, 1511: 138.64632893375, 1791: 57.28092742, 1198: 269.34614612, 2069: 177.52315616125003, 1737: 164.46044301875003, 1901: 118.2467737225, 1844: 63.37398528999999, 1790: 71.64793349125, 1449: 5.615686729874142}, 299: {299: 266.8718528625, 259: 172.52903176249998, 298: 258.534523, 258: 182.39703177500002, 260: 216.08188247500001, 218: 187.80802918749998, 217: 159.4798689075, 339: 218.4903316375, 257: 228.324302675, 297: 211.00203894999999, 219: 231.4353084375, 261: 210.6655645299934, 216: 148.0813264875, 179: 161.15377996249998, 180: 230.446138375, 178: 146.71654511249997, 256: 136.1159048175, 338: 44.643452394020386, 221: 167.96892737500002, 220: 185.81427383749997, 296: 272.00991821249994, 181: 186.53554155, 381: 238.6158294875, 153: 146.10547923750002, 177: 114.72946356749999, 154: 162.6801452625, 337: 279.05836868750004, 295: 183.56124878625, 215: 70.56153202125, 152: 103.27611256624999, 222: 141.7920732625, 155: 170.5661058375, 129: 164.63832472500002, 182: 98.48089982124999, 176: 117.88427640625001, 183: 106.22506619499998, 336: 189.0792198125, 214: 106.01154804750001, 255: 100.21632195250001, 151: 133.147830025, 175: 123.75746441000001, 128: 130.3878736525, 379: 148.06465243750003, 254: 175.57456015, 150: 136.05954361250002, 223: 151.82510185, 213: 155.12763020000003, 294: 175.9285965, 103: 111.24485587375, 130: 157.67488097499998, 293: 138.44327069000002, 174: 126.04667664125, 157: 143.22785661249998, 156: 150.49363707375, 127: 122.15128709125, 126: 139.73441886249998, 378: 167.8555183375, 184: 94.89708614249999, 102: 144.44372842500002, 131: 154.38179780000002, 253: 246.7355194, 185: 79.97582531249999, 149: 134.4669542375, 79: 161.040184975, 104: 131.03263284625, 252: 167.18149375374998, 173: 128.29472828375, 132: 128.22894858749999, 292: 109.16384218875, 81: 34.80802059125, 158: 159.2930069, 148: 107.5297050425, 186: 90.3220195775, 101: 180.462800975, 100: 126.15135001875001, 212: 267.325418475, 125: 132.56803035625, 377: 145.6913623875, 80: 104.53725338875, 124: 145.48388193749997, 78: 171.7119998875, 291: 46.495891095, 123: 129.66871834375002, 335: 112.1054763725, 159: 106.07233809249999, 429: 119.74128532875, 211: 101.59627437750001, 105: 147.4977140375, 133: 132.7650527875, 147: 159.76226138750002, 334: 110.28163338375002, 99: 123.736789715, 226: 116.70838069999999, 106: 
-124.10348129875, 428: 97.76539039249998, 251: 93.38909053500001, 187: 50.5741257675, 376: 115.19152926249998, 146: 123.27746677500001, 210: 72.41377210625001, 107: 74.74180889124999, 57: 107.07983398125, 58: 105.3948507375, 97: 149.84589384999998, 290: 12.816121875, 56: 147.8164625375, 134: 36.200654505, 77: 104.1268701625, 427: 17.86228919, 82: 44.232861758750005, 98: 124.1959800525, 145: 112.67928122625001, 333: 69.8560614575, 108: 6.363543867874999, 188: 10.21847123, 122: 166.27421475, 250: 65.0642671575, 96: 136.27724646874998, 172: 88.15798139125, 59: 71.5417742725, 60: 69.13084840625, 160: 54.105222225000006, 84: 70.32611465375, 83: 30.55832242875, 332: 13.030937970125, 39: 68.06778335624999, 161: 14.0733915565, 40: 61.2050943375, 162: 8.827493668, 135: 49.85933351375, 38: 93.57494354749998, 74: 155.5723524, 209: 69.883824825, 54: 147.75070955, 289: 53.13994812875, 75: 188.6171054875, 120: 81.82864857125, 
-121: 109.33852861749999, 375: 26.1751275075, 170: 58.36077165375, 189: 62.6104202275, 85: 31.06343221625, 331: 7.410155722375001, 136: 25.69694125625, 95: 84.20380734874999, 55: 130.1042346875, 76: 145.29734612500002, 62: 7.467584371625, 72: 108.82164861124998, 42: 95.76540756250002, 249: 90.67073726375001, 109: 13.870381593374999, 288: 13.80579686125, 41: 79.33421373375, 23: 135.720691675, 53: 143.72290325625, 208: 70.35264348875, 171: 78.49414920249998, 163: 59.22734117249999, 43: 29.564334153749996, 24: 135.58051776874998, 37: 151.9179649375, 169: 15.90117681125, 63: 23.1392978425, 137: 5.96553081275, 144: 89.46339511625, 86: 6.894226849000001, 110: 5.774117470375001, 25: 63.62505197624999, 64: 10.471459567000002, 22: 114.19850063375, 248: 16.48698777, 73: 125.96678924375, 168: 0.325306646375, 9: 14.705026013107272}, 1978: {1978: 355.02066995, 2034: 368.67391776249997, 1977: 315.07577135, 2033: 368.1833133624999, 2035: 241.5082168625, 1976: 341.22370313273217, 2084: 100.1000833475, 2083: 162.13100005125, 2031: 456.1924839, 2032: 339.43181038750004, 2036: 188.60408211249998, 2085: 61.97848844375, 2130: 228.58124540499998, 2082: 207.06946277499998, 2086: 132.8807716225, 2081: 266.47624016124996, 2131: 190.77596664625003, 2030: 524.4641589500001, 2080: 303.73291491249995, 2133: 268.027200675, 2132: 243.25305176249998, 2128: 248.66376305, 2127: 86.9847550425, 2172: 275.16735457125, 2087: 320.882946025, 2037: 146.05738450375, 2129: 227.73648834125, 2038: 325.9903926875, 2170: 252.87715817125, 2174: 459.8187370250001, 2028: 360.6778345, 2173: 368.99029349999995, 2134: 309.15543747500004, 2171: 333.63741111250005, 2126: 41.41298508625, 2088: 348.47434235000003, 2175: 348.45285796249993, 2079: 304.1681919125, 2216: 347.50770758749997, 2169: 162.48269462125, 2078: 233.85410021625003, 2168: 26.48163390125, 2215: 327.96376610000004, 2125: 97.16244029875, 2214: 440.318866725, 2218: 180.74733926250002, 2077: 172.81763266874995, 2136: 379.31911852499996, 2176: 234.19318772499997, 2257: 0.48423959875, 2219: 14.177400232124999, 2211: 54.08423305125, 2256: 2.916000381125, 2212: 177.27935028625, 2252: 264.1171913175, 2213: 389.46179198749996, 2124: 57.38252925374999, 2220: 2.1734299212500003, 2217: 305.05279923750004, 2253: 102.19617272125002, 2177: 229.4605083625, 2076: 90.6538913225, 2167: 29.428773522625, 2178: 113.93900488125, 2075: 15.154281795500001, 2166: 9.944221942875, 2251: 353.8293361625, 2123: 15.556456625000001, 2250: 329.78430175, 2135: 355.1212844875, 2289: 7.098973095749999, 2248: 133.8140907275, 2255: 9.167941867625, 2122: 0.318370988625, 2288: 46.5110445025, 2316: 0.5498038242500001, 2287: 167.87332155874998, 2137: 261.7081642, 2254: 11.265563726125, 2209: 0.4499816265, 2180: 0.2915260175, 2138: 15.12819230625, 2247: 76.02850484875, 2179: 5.692807912625, 2210: 9.665543079999999, 2284: 188.634206775, 2283: 162.12137412500002, 2121: 8.834229707000002, 2286: 377.7667064625, 2315: 24.233510553250003, 2074: 82.39151477875001, 2285: 217.5806789125, 2073: 113.97765542124999, 2311: 61.278499605, 2314: 71.186977625, 2207: 0.8143055886249999, 2208: 0.08795748087500001, 2249: 140.09726617374997, 
-2337: 1.380959540375, 2310: 147.83901978875, 2120: 6.847349047875001, 2244: 59.468952657500004, 2119: 1.4209876061250002, 2282: 115.37971401, 2336: 7.728861988625, 2312: 67.35502529125, 2206: 1.000479400125, 2338: 0.31392775100000003, 2245: 40.294478416249994, 2205: 64.27523708375, 2246: 36.05779600125, 2335: 27.016326906249997, 2313: 38.555974245, 2309: 87.39272689250001, 2280: 149.41803074875, 2279: 181.91869163875, 2281: 121.925409325, 2334: 11.516144571749999, 2308: 166.0492897125, 2204: 165.22990893875, 2243: 178.55522728749997, 2165: 12.58706629125, 2307: 166.0805778375, 2242: 12.244550169652939}, 1612: {1612: 195.7733774125, 1671: 149.01474286375, 1613: 168.69121932500002, 1553: 232.98056793749998, 1551: 208.3593750125, 1726: 41.01848543, 1672: 124.0869703425, 1552: 171.923570625, 1614: 195.23641205, 1727: 17.111275672250002, 1725: 184.37924098750003, 1554: 225.25645063749997, 1673: 68.06703973500001, 1492: 337.62484359999996, 1780: 3.480594515875, 1615: 75.2135667775, 1491: 350.89984509999994, 1728: 3.4340492559999998, 1729: 0.07254655712500001, 1432: 304.1899814625, 1493: 271.6747398375, 1494: 277.13153456249995, 1674: 7.027902543250001, 1555: 192.92170143750002, 1616: 0.8481349795, 1723: 132.27281858125, 1779: 34.536804079999996, 1433: 343.4524612625, 1366: 141.13553906250002, 1431: 309.6578617, 1367: 398.2609062125, 1556: 113.53084944250001, 1434: 319.69905854999996, 1300: 127.2275495625, 1495: 268.3464317125, 1722: 231.0911312125, 1834: 50.454490185000004, 1777: 94.77949143000001, 1368: 268.2116851875, 1301: 481.6010742000001, 1833: 33.923671244999994, 1557: 83.9412250525, 1835: 48.37078118375, 1496: 213.344705575, 1436: 58.378679273749995, 1302: 274.91539765000005, 1369: 194.2211914, 1435: 166.41539765, 1886: 128.30992604500003, 1558: 20.814856767499997, 1721: 241.1511630875, 1303: 132.6370267825, 1243: 18.834181188749998, 1437: 20.544327975, 1778: 12.416785955625, 1666: 305.20434188750005, 1885: 143.1588296825, 1497: 89.94971275249999, 1888: 111.90134573375, 1836: 56.486852406249994, 1720: 243.0216789125, 1618: 2.037104546875, 1242: 218.483436575, 1617: 0.038953292625000004, 1370: 21.733129499750007, 1832: 76.93744563624999, 1559: 9.1263325795, 1887: 195.9296073875, 1498: 0.83798658025, 1244: 21.549323559999998, 1943: 162.94121646250002, 1781: 0.52238382575, 1942: 79.854896065, 1241: 219.8569603, 1945: 231.8510227375, 1944: 164.0456399875, 1304: 36.748035429999995, 2000: 49.109264136250005, 1837: 28.264730215, 1186: 140.421133025, 1240: 93.67358588874998, 1889: 66.87702703625, 1184: 103.10053633625, 1619: 0.386801260375, 1782: 1.1901010275, 1998: 114.63811062999999, 1188: 20.35701024375, 1305: 43.55562281625, 1371: 9.683410405, 1946: 214.2720680225, 1187: 26.0421965125, 2001: 125.58484886875, 1838: 26.0134165275, 1999: 47.976686477499996, 2002: 127.20616006499999, 1890: 17.81781446875, 1783: 6.319569796875, 2055: 6.837396263875, 1185: 107.35889719875, 1947: 183.2671060625, 2052: 132.18876290875, 1306: 2.5053423647499997, 1129: 66.822815895, 2003: 136.15472888500003, 1132: 28.32273387875, 1189: 22.684471130000002, 2053: 18.791287364125, 1133: 21.669456601249998, 1948: 61.83771800375, 1839: 3.35891807775, 1372: 2.02588406225, 2005: 44.29882717000001, 2056: 3.6590828597500002, 2101: 183.06722116625, 1784: 0.29834770962499996, 1130: 60.306248665, 2051: 144.45667029, 1190: 4.7727009655, 1891: 2.118011415125, 1078: 25.760284184999996, 2004: 139.233825685, 2050: 207.3496513525, 1949: 35.868806362499996, 2102: 82.870349885, 1191: 2.9835287035, 1079: 15.72539091125, 2100: 193.0316238475, 2049: 167.66957997125, 1076: 51.482589722499995, 1131: 90.83006191375, 1077: 80.5775613775, 2058: 9.930593490125, 2148: 191.80267812875002, 1134: 26.56962537875, 2057: 6.314231843, 1950: 60.80814099375, 2103: 38.04298687, 1023: 33.371510981250005, 2054: 1.783357255, 2147: 208.82981776249997, 1892: 0.655703727125, 1893: 10.3716377615, 1024: 30.15271163125, 2099: 170.27303315375002, 1022: 66.32468938875, 2098: 185.789509785, 2189: 156.80632686124997, 2146: 172.069222445, 1992: 80.03192726274344, 1021: 69.65661954875, 2104: 15.210971117249999, 2149: 137.322716705, 1135: 15.241997005000002, 1951: 82.851005075, 958: 71.66084432375, 2190: 184.33258440375, 1989: 1.3789794593749998, 962: 22.583702566249997, 1894: 13.859171271875, 2096: 212.8957033225, 1025: 20.338437199999998, 1991: 145.68336488125, 963: 10.5829302065, 2145: 246.48599910125, 1080: 17.0770276775, 2097: 249.1892118575, 899: 7.988003372999999, 2187: 166.11500455375003, 2191: 125.96597385375, 2105: 0.347666988, 959: 64.65887165125, 1136: 8.199412346125, 2095: 201.97463321249998, 895: 75.62187480624999, 2046: 289.2853212375, 2045: 267.14036561625, 2150: 91.688274855, 1895: 7.243514120625, 960: 72.241774555, 2008: 16.8015500325, 1952: 61.19255590375, 1026: 10.261008261125001, 2228: 129.82309721500002, 2188: 144.73567629375, 961: 32.6326100825, 2144: 264.3112411375, 2227: 157.90814542750002, 2229: 83.79660370626516}, 0: {}, 1: {}, 2: {}, 3: {}, 4: {}, 5: {}, 6: 
-{}, 7: {}, 8: {}, 9: {}, 10: {}, 11: {}, 12: {}, 13: {}, 14: {}, 15: {}, 16: {}, 17: {}, 18: {}, 19: {}, 20: {}, 21: {}, 22: {}, 23: {}, 24: {}, 25: {}, 26: {}, 27: {}, 28: {}, 29: {}, 
-30: {}, 31: {}, 32: {}, 33: {}, 34: {}, 35: {}, 36: {}, 37: {}, 38: {}, 39: {}, 40: {}, 41: {}, 42: {}, 43: {}, 44: {}, 45: {}, 46: {}, 47: {}, 48: {}, 49: {}, 50: {}, 51: {}, 52: {}, 53: {}, 54: {}, 55: {}, 56: {}, 57: {}, 58: {}, 59: {}, 60: {}, 61: {}, 62: {}, 63: {}, 64: {}, 65: {}, 66: {}, 67: {}, 68: {}, 69: {}, 70: {}, 71: {}, 72: {}, 73: {}, 74: {}, 75: {}, 76: {}, 77: {}, 78: {}, 79: {}, 80: {}, 81: {}, 82: {}, 83: {}, 84: {}, 85: {}, 86: {}, 87: {}, 88: {}, 89: {}, 90: {}, 91: {}, 92: {}, 93: {}, 94: {}, 95: {}, 96: {}, 97: {}, 98: {}, 99: {}, 100: {}, 101: {}, 102: {}, 103: {}, 104: {}, 105: {}, 106: {}, 107: {}, 108: {}, 109: {}, 110: {}, 111: {}, 112: {}, 113: {}, 114: {}, 115: {}, 116: {}, 117: {}, 118: {}, 119: {}, 
-120: {}, 121: {}, 122: {}, 123: {}, 124: {}, 125: {}, 126: {}, 127: {}, 128: {}, 129: {}, 130: {}, 131: {}, 132: {}, 133: {}, 134: {}, 135: {}, 136: {}, 137: {}, 138: {}, 139: {}, 140: 
-{}, 141: {}, 142: {}, 143: {}, 144: {}, 145: {}, 146: {}, 147: {}, 148: {}, 149: {}, 150: {}, 151: {}, 152: {}, 153: {}, 154: {}, 155: {}, 156: {}, 157: {}, 158: {}, 159: {}, 160: {}, 161: {}, 162: {}, 163: {}, 164: {}, 165: {}, 166: {}, 167: {}, 168: {}, 169: {}, 170: {}, 171: {}, 172: {}, 173: {}, 174: {}, 175: {}, 176: {}, 177: {}, 178: {}, 179: {}, 180: {}, 181: {}, 182: {}, 183: {}, 184: {}, 185: {}, 186: {}, 187: {}, 188: {}, 189: {}, 190: {}, 191: {}, 192: {}, 193: {}, 194: {}, 195: {}, 196: {}, 197: {}, 198: {}, 199: {}, 200: {}, 201: {}, 202: {}, 203: {}, 204: {}, 205: {}, 206: {}, 207: {}, 208: {}, 209: {}, 210: {}, 211: {}, 212: {}, 213: {}, 214: {}, 215: {}, 216: {}, 217: {}, 218: {}, 219: {}, 220: {}, 221: {}, 222: {}, 223: {}, 224: {}, 225: {}, 226: {}, 227: {}, 228: {}, 229: {}, 230: {}, 231: {}, 232: {}, 233: {}, 234: {}, 235: {}, 236: {}, 237: {}, 238: {}, 239: {}, 240: {}, 241: {}, 242: {}, 243: {}, 244: {}, 245: {}, 246: {}, 247: {}, 248: {}, 249: {}, 250: {}, 251: {}, 252: {}, 253: {}, 254: {}, 255: {}, 256: {}, 257: {}, 258: {}, 259: {}, 260: {}, 261: {}, 262: {}, 263: {}, 264: {}, 265: {}, 266: {}, 267: {}, 268: {}, 269: {}, 270: {}, 271: {}, 272: {}, 273: {}, 274: {}, 275: {}, 276: {}, 277: {}, 278: {}, 279: {}, 280: {}, 281: {}, 282: {}, 283: {}, 284: {}, 285: {}, 286: {}, 287: {}, 288: {}, 289: {}, 290: {}, 291: {}, 292: {}, 293: {}, 294: {}, 295: {}, 296: {}, 297: {}, 298: {}, 300: {}, 301: {}, 302: {}, 303: {}, 304: {}, 305: {}, 
-306: {}, 307: {}, 308: {}, 309: {}, 310: {}, 311: {}, 312: {}, 313: {}, 314: {}, 315: {}, 316: {}, 317: {}, 318: {}, 319: {}, 320: {}, 321: {}, 322: {}, 323: {}, 324: {}, 325: {}, 326: 
-{}, 327: {}, 328: {}, 329: {}, 330: {}, 331: {}, 332: {}, 333: {}, 334: {}, 335: {}, 336: {}, 337: {}, 338: {}, 339: {}, 340: {}, 341: {}, 342: {}, 343: {}, 344: {}, 345: {}, 346: {}, 347: {}, 348: {}, 349: {}, 350: {}, 351: {}, 352: {}, 353: {}, 354: {}, 355: {}, 356: {}, 357: {}, 358: {}, 359: {}, 360: {}, 361: {}, 362: {}, 363: {}, 364: {}, 365: {}, 366: {}, 367: {}, 368: {}, 369: {}, 370: {}, 371: {}, 372: {}, 373: {}, 374: {}, 375: {}, 376: {}, 377: {}, 378: {}, 379: {}, 380: {}, 381: {}, 382: {}, 383: {}, 384: {}, 385: {}, 386: {}, 387: {}, 388: {}, 389: {}, 390: {}, 391: {}, 392: {}, 393: {}, 394: {}, 395: {}, 396: {}, 397: {}, 398: {}, 399: {}, 400: {}, 401: {}, 402: {}, 403: {}, 404: {}, 405: {}, 406: {}, 407: {}, 408: {}, 409: {}, 410: {}, 411: {}, 412: {}, 413: {}, 414: {}, 415: {}, 416: {}, 417: {}, 418: {}, 419: {}, 420: {}, 421: {}, 422: {}, 423: {}, 424: {}, 425: {}, 426: {}, 427: {}, 428: {}, 429: {}, 430: {}, 431: {}, 432: {}, 433: {}, 434: {}, 435: {}, 436: {}, 437: {}, 438: {}, 439: {}, 440: {}, 441: {}, 442: {}, 443: {}, 444: {}, 445: {}, 446: {}, 447: {}, 448: {}, 449: {}, 450: {}, 451: {}, 452: {}, 453: {}, 454: {}, 455: {}, 456: {}, 457: {}, 458: {}, 459: {}, 460: {}, 461: {}, 462: {}, 463: {}, 464: {}, 465: {}, 466: {}, 467: {}, 468: {}, 469: {}, 470: {}, 471: {}, 472: {}, 473: {}, 474: {}, 475: {}, 476: {}, 477: {}, 478: {}, 479: {}, 480: {}, 481: {}, 482: {}, 483: {}, 484: {}, 485: {}, 486: {}, 487: {}, 488: {}, 489: {}, 490: {}, 
-491: {}, 492: {}, 493: {}, 494: {}, 495: {}, 496: {}, 497: {}, 498: {}, 499: {}, 500: {}, 501: {}, 502: {}, 503: {}, 504: {}, 505: {}, 506: {}, 507: {}, 508: {}, 509: {}, 510: {}, 511: 
-{}, 512: {}, 513: {}, 514: {}, 515: {}, 516: {}, 517: {}, 518: {}, 519: {}, 520: {}, 521: {}, 522: {}, 523: {}, 524: {}, 525: {}, 526: {}, 527: {}, 528: {}, 529: {}, 530: {}, 531: {}, 532: {}, 533: {}, 534: {}, 535: {}, 536: {}, 537: {}, 538: {}, 539: {}, 540: {}, 541: {}, 542: {}, 543: {}, 544: {}, 545: {}, 546: {}, 547: {}, 548: {}, 549: {}, 550: {}, 551: {}, 552: {}, 553: {}, 554: {}, 555: {}, 556: {}, 557: {}, 558: {}, 559: {}, 560: {}, 561: {}, 562: {}, 563: {}, 564: {}, 565: {}, 566: {}, 567: {}, 568: {}, 569: {}, 570: {}, 571: {}, 572: {}, 573: {}, 574: {}, 575: {}, 576: {}, 577: {}, 578: {}, 579: {}, 580: {}, 581: {}, 582: {}, 583: {}, 584: {}, 585: {}, 586: {}, 587: {}, 588: {}, 589: {}, 590: {}, 591: {}, 592: {}, 593: {}, 594: {}, 595: {}, 596: {}, 597: {}, 598: {}, 599: {}, 600: {}, 601: {}, 602: {}, 603: {}, 604: {}, 605: {}, 606: {}, 607: {}, 608: {}, 609: {}, 610: {}, 611: {}, 612: {}, 613: {}, 614: {}, 615: {}, 616: {}, 617: {}, 618: {}, 619: {}, 620: {}, 621: {}, 622: {}, 623: {}, 624: {}, 625: {}, 626: {}, 627: {}, 628: {}, 629: {}, 630: {}, 631: {}, 632: {}, 633: {}, 634: {}, 635: {}, 636: {}, 637: {}, 638: {}, 639: {}, 640: {}, 641: {}, 642: {}, 643: {}, 644: {}, 645: {}, 646: {}, 647: {}, 648: {}, 649: {}, 650: {}, 651: {}, 652: {}, 653: {}, 654: {}, 655: {}, 656: {}, 657: {}, 658: {}, 659: {}, 660: {}, 661: {}, 662: {}, 663: {}, 664: {}, 665: {}, 666: {}, 667: {}, 668: {}, 669: {}, 670: {}, 671: {}, 672: {}, 673: {}, 674: {}, 675: {}, 
-676: {}, 677: {}, 678: {}, 679: {}, 680: {}, 681: {}, 682: {}, 684: {}, 685: {}, 686: {}, 687: {}, 688: {}, 689: {}, 690: {}, 691: {}, 692: {}, 693: {}, 694: {}, 695: {}, 696: {}, 697: 
-{}, 698: {}, 699: {}, 700: {}, 701: {}, 702: {}, 703: {}, 704: {}, 705: {}, 706: {}, 707: {}, 708: {}, 709: {}, 710: {}, 711: {}, 712: {}, 713: {}, 714: {}, 715: {}, 716: {}, 717: {}, 718: {}, 719: {}, 720: {}, 721: {}, 722: {}, 723: {}, 724: {}, 725: {}, 726: {}, 727: {}, 728: {}, 729: {}, 730: {}, 731: {}, 732: {}, 733: {}, 734: {}, 735: {}, 736: {}, 737: {}, 738: {}, 739: {}, 740: {}, 741: {}, 742: {}, 743: {}, 744: {}, 745: {}, 746: {}, 747: {}, 748: {}, 749: {}, 750: {}, 751: {}, 752: {}, 753: {}, 754: {}, 755: {}, 756: {}, 757: {}, 758: {}, 759: {}, 760: {}, 761: {}, 762: {}, 763: {}, 764: {}, 765: {}, 766: {}, 767: {}, 768: {}, 769: {}, 770: {}, 771: {}, 772: {}, 773: {}, 774: {}, 775: {}, 776: {}, 777: {}, 778: {}, 779: {}, 780: {}, 781: {}, 782: {}, 783: {}, 784: {}, 785: {}, 786: {}, 787: {}, 788: {}, 789: {}, 790: {}, 791: {}, 792: {}, 793: {}, 794: {}, 795: {}, 796: {}, 797: {}, 798: {}, 799: {}, 800: {}, 801: {}, 802: {}, 803: {}, 804: {}, 805: {}, 806: {}, 807: {}, 808: {}, 809: {}, 811: {}, 812: {}, 813: {}, 814: {}, 815: {}, 816: {}, 817: {}, 818: {}, 819: {}, 820: {}, 821: {}, 822: {}, 823: {}, 824: {}, 825: {}, 826: {}, 827: {}, 828: {}, 829: {}, 830: {}, 831: {}, 832: {}, 833: {}, 834: {}, 835: {}, 836: {}, 837: {}, 838: {}, 839: {}, 840: {}, 841: {}, 842: {}, 843: {}, 844: {}, 845: {}, 846: {}, 847: {}, 848: {}, 849: {}, 850: {}, 851: {}, 852: {}, 853: {}, 854: {}, 855: {}, 856: {}, 857: {}, 858: {}, 859: {}, 860: {}, 861: {}, 862: {}, 
-863: {}, 864: {}, 865: {}, 866: {}, 868: {}, 869: {}, 870: {}, 871: {}, 872: {}, 873: {}, 874: {}, 875: {}, 876: {}, 877: {}, 878: {}, 879: {}, 880: {}, 881: {}, 882: {}, 883: {}, 884: 
-{}, 885: {}, 886: {}, 887: {}, 888: {}, 889: {}, 890: {}, 891: {}, 892: {}, 893: {}, 894: {}, 895: {}, 896: {}, 897: {}, 898: {}, 899: {}, 900: {}, 901: {}, 902: {}, 903: {}, 904: {}, 905: {}, 906: {}, 907: {}, 908: {}, 909: {}, 910: {}, 911: {}, 912: {}, 913: {}, 914: {}, 915: {}, 916: {}, 917: {}, 918: {}, 919: {}, 920: {}, 921: {}, 922: {}, 923: {}, 924: {}, 925: {}, 926: {}, 927: {}, 928: {}, 929: {}, 930: {}, 931: {}, 932: {}, 933: {}, 934: {}, 935: {}, 936: {}, 937: {}, 938: {}, 939: {}, 940: {}, 941: {}, 942: {}, 943: {}, 944: {}, 945: {}, 946: {}, 947: {}, 948: {}, 949: {}, 950: {}, 951: {}, 952: {}, 953: {}, 954: {}, 955: {}, 956: {}, 957: {}, 958: {}, 959: {}, 960: {}, 961: {}, 962: {}, 963: {}, 964: {}, 965: {}, 966: {}, 967: {}, 968: {}, 969: {}, 970: {}, 971: {}, 972: {}, 973: {}, 974: {}, 975: {}, 976: {}, 977: {}, 978: {}, 979: {}, 980: {}, 981: {}, 982: {}, 983: {}, 984: {}, 985: {}, 986: {}, 987: {}, 988: {}, 989: {}, 990: {}, 991: {}, 992: {}, 993: {}, 994: {}, 995: {}, 996: {}, 997: {}, 998: {}, 999: {}, 1000: {}, 1001: {}, 1002: {}, 1003: {}, 1004: {}, 1005: {}, 1006: {}, 1007: {}, 1008: {}, 1009: {}, 1010: {}, 1011: {}, 1012: {}, 1013: {}, 1014: {}, 1015: {}, 1016: {}, 1017: {}, 1018: {}, 1019: {}, 1020: {}, 1021: {}, 1022: {}, 1023: {}, 1024: {}, 1025: 
-{}, 1026: {}, 1027: {}, 1028: {}, 1029: {}, 1030: {}, 1031: {}, 1032: {}, 1033: {}, 1034: {}, 1035: {}, 1036: {}, 1037: {}, 1038: {}, 1039: {}, 1040: {}, 1041: {}, 1042: {}, 1043: {}, 1044: {}, 1045: {}, 1046: {}, 1047: {}, 1048: {}, 1049: {}, 1050: {}, 1051: {}, 1052: {}, 1053: {}, 1054: {}, 1055: {}, 1056: {}, 1057: {}, 1058: {}, 1059: {}, 1060: {}, 1061: {}, 1062: 
-{}, 1063: {}, 1064: {}, 1065: {}, 1066: {}, 1067: {}, 1068: {}, 1069: {}, 1070: {}, 1071: {}, 1072: {}, 1073: {}, 1074: {}, 1075: {}, 1076: {}, 1077: {}, 1078: {}, 1079: {}, 1080: {}, 1081: {}, 1082: {}, 1083: {}, 1084: {}, 1085: {}, 1086: {}, 1087: {}, 1088: {}, 1089: {}, 1090: {}, 1091: {}, 1092: {}, 1093: {}, 1094: {}, 1095: {}, 1096: {}, 1097: {}, 1098: {}, 1099: 
-{}, 1100: {}, 1101: {}, 1102: {}, 1103: {}, 1104: {}, 1105: {}, 1106: {}, 1107: {}, 1108: {}, 1109: {}, 1110: {}, 1111: {}, 1112: {}, 1113: {}, 1114: {}, 1115: {}, 1116: {}, 1117: {}, 1118: {}, 1119: {}, 1120: {}, 1122: {}, 1123: {}, 1124: {}, 1125: {}, 1126: {}, 1127: {}, 1128: {}, 1129: {}, 1130: {}, 1131: {}, 1132: {}, 1133: {}, 1134: {}, 1135: {}, 1136: {}, 1137: 
-{}, 1138: {}, 1139: {}, 1140: {}, 1141: {}, 1142: {}, 1143: {}, 1144: {}, 1145: {}, 1146: {}, 1147: {}, 1148: {}, 1149: {}, 1150: {}, 1151: {}, 1152: {}, 1153: {}, 1154: {}, 1155: {}, 1156: {}, 1157: {}, 1158: {}, 1159: {}, 1160: {}, 1162: {}, 1163: {}, 1164: {}, 1165: {}, 1166: {}, 1167: {}, 1168: {}, 1169: {}, 1170: {}, 1171: {}, 1172: {}, 1173: {}, 1174: {}, 1175: 
-{}, 1176: {}, 1177: {}, 1178: {}, 1179: {}, 1180: {}, 1181: {}, 1182: {}, 1183: {}, 1184: {}, 1185: {}, 1186: {}, 1187: {}, 1188: {}, 1189: {}, 1190: {}, 1191: {}, 1192: {}, 1193: {}, 1194: {}, 1195: {}, 1196: {}, 1197: {}, 1198: {}, 1199: {}, 1200: {}, 1201: {}, 1202: {}, 1203: {}, 1204: {}, 1205: {}, 1206: {}, 1207: {}, 1208: {}, 1209: {}, 1210: {}, 1211: {}, 1212: 
-{}, 1213: {}, 1214: {}, 1215: {}, 1216: {}, 1217: {}, 1218: {}, 1219: {}, 1220: {}, 1221: {}, 1222: {}, 1223: {}, 1225: {}, 1226: {}, 1227: {}, 1228: {}, 1229: {}, 1230: {}, 1231: {}, 1232: {}, 1233: {}, 1234: {}, 1235: {}, 1236: {}, 1237: {}, 1238: {}, 1239: {}, 1240: {}, 1241: {}, 1242: {}, 1243: {}, 1244: {}, 1245: {}, 1246: {}, 1247: {}, 1248: {}, 1249: {}, 1250: 
-{}, 1251: {}, 1252: {}, 1253: {}, 1254: {}, 1255: {}, 1256: {}, 1257: {}, 1258: {}, 1259: {}, 1260: {}, 1261: {}, 1262: {}, 1263: {}, 1264: {}, 1265: {}, 1266: {}, 1267: {}, 1268: {}, 1269: {}, 1270: {}, 1271: {}, 1272: {}, 1273: {}, 1274: {}, 1275: {}, 1276: {}, 1277: {}, 1278: {}, 1279: {}, 1280: {}, 1281: {}, 1282: {}, 1283: {}, 1284: {}, 1285: {}, 1286: {}, 1287: 
-{}, 1288: {}, 1289: {}, 1290: {}, 1291: {}, 1292: {}, 1293: {}, 1294: {}, 1295: {}, 1296: {}, 1297: {}, 1298: {}, 1299: {}, 1300: {}, 1301: {}, 1302: {}, 1303: {}, 1304: {}, 1305: {}, 1306: {}, 1307: {}, 1308: {}, 1309: {}, 1310: {}, 1311: {}, 1312: {}, 1313: {}, 1314: {}, 1315: {}, 1316: {}, 1317: {}, 1318: {}, 1319: {}, 1320: {}, 1321: {}, 1322: {}, 1323: {}, 1324: 
-{}, 1325: {}, 1326: {}, 1327: {}, 1328: {}, 1329: {}, 1331: {}, 1332: {}, 1333: {}, 1334: {}, 1335: {}, 1336: {}, 1337: {}, 1338: {}, 1339: {}, 1340: {}, 1341: {}, 1342: {}, 1343: {}, 1344: {}, 1345: {}, 1346: {}, 1347: {}, 1348: {}, 1349: {}, 1350: {}, 1351: {}, 1352: {}, 1353: {}, 1354: {}, 1355: {}, 1356: {}, 1357: {}, 1358: {}, 1359: {}, 1360: {}, 1361: {}, 1362: 
-{}, 1363: {}, 1364: {}, 1365: {}, 1366: {}, 1367: {}, 1368: {}, 1369: {}, 1370: {}, 1371: {}, 1372: {}, 1373: {}, 1374: {}, 1375: {}, 1376: {}, 1377: {}, 1378: {}, 1379: {}, 1380: {}, 1381: {}, 1382: {}, 1383: {}, 1384: {}, 1385: {}, 1386: {}, 1387: {}, 1388: {}, 1389: {}, 1390: {}, 1391: {}, 1392: {}, 1393: {}, 1394: {}, 1395: {}, 1396: {}, 1397: {}, 1398: {}, 1399: 
-{}, 1400: {}, 1401: {}, 1402: {}, 1404: {}, 1405: {}, 1406: {}, 1407: {}, 1408: {}, 1409: {}, 1410: {}, 1411: {}, 1412: {}, 1413: {}, 1414: {}, 1415: {}, 1416: {}, 1417: {}, 1418: {}, 1419: {}, 1420: {}, 1421: {}, 1422: {}, 1423: {}, 1424: {}, 1425: {}, 1426: {}, 1427: {}, 1428: {}, 1429: {}, 1430: {}, 1431: {}, 1432: {}, 1433: {}, 1434: {}, 1435: {}, 1436: {}, 1437: 
-{}, 1438: {}, 1439: {}, 1440: {}, 1441: {}, 1442: {}, 1443: {}, 1444: {}, 1445: {}, 1446: {}, 1447: {}, 1448: {}, 1449: {}, 1450: {}, 1451: {}, 1452: {}, 1453: {}, 1454: {}, 1455: {}, 1456: {}, 1457: {}, 1458: {}, 1459: {}, 1460: {}, 1461: {}, 1462: {}, 1463: {}, 1464: {}, 1465: {}, 1466: {}, 1467: {}, 1468: {}, 1469: {}, 1470: {}, 1471: {}, 1472: {}, 1473: {}, 1474: 
-{}, 1475: {}, 1476: {}, 1477: {}, 1478: {}, 1479: {}, 1480: {}, 1481: {}, 1482: {}, 1483: {}, 1484: {}, 1485: {}, 1486: {}, 1487: {}, 1488: {}, 1489: {}, 1490: {}, 1491: {}, 1492: {}, 1493: {}, 1494: {}, 1495: {}, 1496: {}, 1497: {}, 1498: {}, 1499: {}, 1500: {}, 1501: {}, 1502: {}, 1503: {}, 1504: {}, 1505: {}, 1506: {}, 1507: {}, 1508: {}, 1509: {}, 1510: {}, 1511: 
-{}, 1512: {}, 1513: {}, 1514: {}, 1515: {}, 1516: {}, 1517: {}, 1518: {}, 1519: {}, 1520: {}, 1521: {}, 1522: {}, 1523: {}, 1524: {}, 1525: {}, 1526: {}, 1527: {}, 1528: {}, 1529: {}, 1530: {}, 1531: {}, 1532: {}, 1533: {}, 1534: {}, 1535: {}, 1536: {}, 1537: {}, 1538: {}, 1539: {}, 1540: {}, 1541: {}, 1543: {}, 1544: {}, 1545: {}, 1546: {}, 1547: {}, 1548: {}, 1549: 
-{}, 1550: {}, 1551: {}, 1552: {}, 1553: {}, 1554: {}, 1555: {}, 1556: {}, 1557: {}, 1558: {}, 1559: {}, 1560: {}, 1561: {}, 1562: {}, 1563: {}, 1564: {}, 1565: {}, 1566: {}, 1567: {}, 1568: {}, 1569: {}, 1570: {}, 1571: {}, 1572: {}, 1573: {}, 1574: {}, 1575: {}, 1576: {}, 1577: {}, 1578: {}, 1579: {}, 1580: {}, 1581: {}, 1582: {}, 1583: {}, 1584: {}, 1585: {}, 1586: 
-{}, 1587: {}, 1588: {}, 1589: {}, 1590: {}, 1591: {}, 1592: {}, 1593: {}, 1594: {}, 1596: {}, 1597: {}, 1598: {}, 1599: {}, 1600: {}, 1601: {}, 1602: {}, 1603: {}, 1604: {}, 1605: {}, 1606: {}, 1607: {}, 1608: {}, 1609: {}, 1610: {}, 1611: {}, 1613: {}, 1614: {}, 1615: {}, 1616: {}, 1617: {}, 1618: {}, 1619: {}, 1620: {}, 1621: {}, 1622: {}, 1623: {}, 1624: {}, 1625: 
-{}, 1626: {}, 1627: {}, 1628: {}, 1629: {}, 1630: {}, 1631: {}, 1632: {}, 1633: {}, 1634: {}, 1635: {}, 1636: {}, 1637: {}, 1638: {}, 1639: {}, 1640: {}, 1641: {}, 1642: {}, 1643: {}, 1644: {}, 1645: {}, 1646: {}, 1647: {}, 1648: {}, 1649: {}, 1650: {}, 1651: {}, 1652: {}, 1653: {}, 1654: {}, 1655: {}, 1656: {}, 1657: {}, 1658: {}, 1659: {}, 1660: {}, 1661: {}, 1662: 
-{}, 1663: {}, 1664: {}, 1665: {}, 1666: {}, 1667: {}, 1668: {}, 1669: {}, 1670: {}, 1671: {}, 1672: {}, 1673: {}, 1674: {}, 1675: {}, 1676: {}, 1677: {}, 1678: {}, 1679: {}, 1680: {}, 1681: {}, 1682: {}, 1683: {}, 1684: {}, 1685: {}, 1686: {}, 1687: {}, 1688: {}, 1689: {}, 1690: {}, 1692: {}, 1693: {}, 1694: {}, 1695: {}, 1696: {}, 1697: {}, 1698: {}, 1699: {}, 1700: 
-{}, 1701: {}, 1702: {}, 1703: {}, 1704: {}, 1705: {}, 1706: {}, 1707: {}, 1708: {}, 1709: {}, 1710: {}, 1711: {}, 1712: {}, 1713: {}, 1714: {}, 1715: {}, 1716: {}, 1717: {}, 1718: {}, 1719: {}, 1720: {}, 1721: {}, 1722: {}, 1723: {}, 1724: {}, 1725: {}, 1726: {}, 1727: {}, 1728: {}, 1729: {}, 1730: {}, 1731: {}, 1732: {}, 1733: {}, 1734: {}, 1735: {}, 1736: {}, 1737: 
-{}, 1738: {}, 1739: {}, 1740: {}, 1741: {}, 1742: {}, 1743: {}, 1744: {}, 1745: {}, 1746: {}, 1747: {}, 1748: {}, 1749: {}, 1750: {}, 1752: {}, 1753: {}, 1754: {}, 1755: {}, 1756: {}, 1757: {}, 1758: {}, 1759: {}, 1760: {}, 1761: {}, 1762: {}, 1763: {}, 1764: {}, 1765: {}, 1766: {}, 1767: {}, 1768: {}, 1769: {}, 1770: {}, 1771: {}, 1772: {}, 1773: {}, 1774: {}, 1775: 
-{}, 1776: {}, 1777: {}, 1778: {}, 1779: {}, 1780: {}, 1781: {}, 1782: {}, 1783: {}, 1784: {}, 1785: {}, 1786: {}, 1787: {}, 1788: {}, 1789: {}, 1790: {}, 1791: {}, 1792: {}, 1793: {}, 1794: {}, 1795: {}, 1796: {}, 1797: {}, 1798: {}, 1799: {}, 1800: {}, 1801: {}, 1802: {}, 1803: {}, 1804: {}, 1805: {}, 1806: {}, 1807: {}, 1808: {}, 1809: {}, 1810: {}, 1811: {}, 1812: 
-{}, 1813: {}, 1814: {}, 1815: {}, 1816: {}, 1817: {}, 1818: {}, 1819: {}, 1820: {}, 1821: {}, 1822: {}, 1823: {}, 1824: {}, 1825: {}, 1826: {}, 1827: {}, 1828: {}, 1829: {}, 1830: {}, 1831: {}, 1832: {}, 1833: {}, 1834: {}, 1835: {}, 1836: {}, 1837: {}, 1838: {}, 1839: {}, 1840: {}, 1841: {}, 1842: {}, 1843: {}, 1844: {}, 1845: {}, 1846: {}, 1847: {}, 1848: {}, 1849: 
-{}, 1850: {}, 1851: {}, 1852: {}, 1853: {}, 1854: {}, 1855: {}, 1856: {}, 1857: {}, 1858: {}, 1859: {}, 1860: {}, 1861: {}, 1862: {}, 1863: {}, 1864: {}, 1865: {}, 1866: {}, 1867: {}, 1868: {}, 1869: {}, 1870: {}, 1871: {}, 1872: {}, 1873: {}, 1874: {}, 1875: {}, 1876: {}, 1877: {}, 1878: {}, 1879: {}, 1880: {}, 1881: {}, 1882: {}, 1883: {}, 1884: {}, 1885: {}, 1886: 
-{}, 1887: {}, 1888: {}, 1889: {}, 1890: {}, 1891: {}, 1892: {}, 1893: {}, 1894: {}, 1895: {}, 1896: {}, 1897: {}, 1898: {}, 1899: {}, 1900: {}, 1901: {}, 1902: {}, 1903: {}, 1904: {}, 1905: {}, 1906: {}, 1907: {}, 1908: {}, 1909: {}, 1910: {}, 1911: {}, 1912: {}, 1913: {}, 1914: {}, 1915: {}, 1916: {}, 1917: {}, 1918: {}, 1919: {}, 1920: {}, 1921: {}, 1922: {}, 1923: 
-{}, 1924: {}, 1925: {}, 1926: {}, 1927: {}, 1928: {}, 1929: {}, 1930: {}, 1931: {}, 1932: {}, 1933: {}, 1934: {}, 1935: {}, 1936: {}, 1937: {}, 1938: {}, 1939: {}, 1940: {}, 1941: {}, 1942: {}, 1943: {}, 1944: {}, 1945: {}, 1946: {}, 1947: {}, 1948: {}, 1949: {}, 1950: {}, 1951: {}, 1952: {}, 1953: {}, 1954: {}, 1955: {}, 1956: {}, 1957: {}, 1958: {}, 1959: {}, 1960: 
-{}, 1961: {}, 1962: {}, 1963: {}, 1964: {}, 1965: {}, 1966: {}, 1967: {}, 1968: {}, 1969: {}, 1970: {}, 1971: {}, 1972: {}, 1973: {}, 1974: {}, 1975: {}, 1976: {}, 1977: {}, 1979: {}, 1980: {}, 1981: {}, 1982: {}, 1983: {}, 1984: {}, 1985: {}, 1986: {}, 1987: {}, 1988: {}, 1989: {}, 1990: {}, 1991: {}, 1992: {}, 1993: {}, 1994: {}, 1995: {}, 1996: {}, 1997: {}, 1998: 
-{}, 1999: {}, 2000: {}, 2001: {}, 2002: {}, 2003: {}, 2004: {}, 2005: {}, 2006: {}, 2007: {}, 2008: {}, 2009: {}, 2010: {}, 2011: {}, 2012: {}, 2013: {}, 2014: {}, 2015: {}, 2016: {}, 2017: {}, 2018: {}, 2019: {}, 2020: {}, 2021: {}, 2022: {}, 2023: {}, 2024: {}, 2025: {}, 2026: {}, 2027: {}, 2028: {}, 2029: {}, 2030: {}, 2031: {}, 2032: {}, 2033: {}, 2034: {}, 2035: 
-{}, 2036: {}, 2037: {}, 2038: {}, 2039: {}, 2040: {}, 2041: {}, 2042: {}, 2043: {}, 2044: {}, 2045: {}, 2046: {}, 2047: {}, 2048: {}, 2049: {}, 2050: {}, 2051: {}, 2052: {}, 2053: {}, 2054: {}, 2055: {}, 2056: {}, 2057: {}, 2058: {}, 2059: {}, 2060: {}, 2061: {}, 2062: {}, 2063: {}, 2064: {}, 2065: {}, 2066: {}, 2067: {}, 2068: {}, 2069: {}, 2070: {}, 2071: {}, 2072: 
-{}, 2073: {}, 2074: {}, 2075: {}, 2076: {}, 2077: {}, 2078: {}, 2079: {}, 2080: {}, 2081: {}, 2082: {}, 2083: {}, 2084: {}, 2085: {}, 2086: {}, 2087: {}, 2088: {}, 2089: {}, 2090: {}, 2091: {}, 2092: {}, 2093: {}, 2094: {}, 2095: {}, 2096: {}, 2097: {}, 2098: {}, 2099: {}, 2100: {}, 2101: {}, 2102: {}, 2103: {}, 2104: {}, 2105: {}, 2106: {}, 2107: {}, 2108: {}, 2109: 
-{}, 2110: {}, 2111: {}, 2112: {}, 2113: {}, 2114: {}, 2115: {}, 2116: {}, 2117: {}, 2118: {}, 2119: {}, 2120: {}, 2121: {}, 2122: {}, 2123: {}, 2124: {}, 2125: {}, 2126: {}, 2127: {}, 2128: {}, 2129: {}, 2130: {}, 2131: {}, 2132: {}, 2133: {}, 2134: {}, 2135: {}, 2136: {}, 2137: {}, 2138: {}, 2139: {}, 2140: {}, 2141: {}, 2142: {}, 2143: {}, 2144: {}, 2145: {}, 2146: 
-{}, 2147: {}, 2148: {}, 2149: {}, 2150: {}, 2151: {}, 2152: {}, 2153: {}, 2154: {}, 2155: {}, 2156: {}, 2157: {}, 2158: {}, 2159: {}, 2160: {}, 2161: {}, 2162: {}, 2163: {}, 2164: {}, 2165: {}, 2166: {}, 2167: {}, 2168: {}, 2169: {}, 2170: {}, 2171: {}, 2172: {}, 2173: {}, 2174: {}, 2175: {}, 2176: {}, 2177: {}, 2178: {}, 2179: {}, 2180: {}, 2181: {}, 2182: {}, 2183: 
-{}, 2184: {}, 2185: {}, 2186: {}, 2187: {}, 2188: {}, 2189: {}, 2190: {}, 2191: {}, 2192: {}, 2193: {}, 2194: {}, 2195: {}, 2196: {}, 2197: {}, 2198: {}, 2199: {}, 2200: {}, 2201: {}, 2202: {}, 2203: {}, 2204: {}, 2205: {}, 2206: {}, 2207: {}, 2208: {}, 2209: {}, 2210: {}, 2211: {}, 2212: {}, 2213: {}, 2214: {}, 2215: {}, 2216: {}, 2217: {}, 2218: {}, 2219: {}, 2220: 
-{}, 2221: {}, 2222: {}, 2223: {}, 2224: {}, 2225: {}, 2226: {}, 2227: {}, 2228: {}, 2229: {}, 2230: {}, 2231: {}, 2232: {}, 2233: {}, 2234: {}, 2235: {}, 2236: {}, 2237: {}, 2238: {}, 2239: {}, 2240: {}, 2241: {}, 2242: {}, 2243: {}, 2244: {}, 2245: {}, 2246: {}, 2247: {}, 2248: {}, 2249: {}, 2250: {}, 2251: {}, 2252: {}, 2253: {}, 2254: {}, 2255: {}, 2256: {}, 2257: 
-{}, 2258: {}, 2259: {}, 2260: {}, 2261: {}, 2262: {}, 2263: {}, 2264: {}, 2265: {}, 2266: {}, 2267: {}, 2268: {}, 2269: {}, 2270: {}, 2271: {}, 2272: {}, 2273: {}, 2274: {}, 2275: {}, 2276: {}, 2277: {}, 2278: {}, 2279: {}, 2280: {}, 2281: {}, 2282: {}, 2283: {}, 2284: {}, 2285: {}, 2286: {}, 2287: {}, 2288: {}, 2289: {}, 2290: {}, 2291: {}, 2292: {}, 2293: {}, 2294: 
-{}, 2295: {}, 2296: {}, 2297: {}, 2298: {}, 2299: {}, 2300: {}, 2301: {}, 2302: {}, 2303: {}, 2304: {}, 2305: {}, 2306: {}, 2307: {}, 2308: {}, 2309: {}, 2310: {}, 2311: {}, 2312: {}, 2313: {}, 2314: {}, 2315: {}, 2316: {}, 2317: {}, 2318: {}, 2319: {}, 2320: {}, 2321: {}, 2322: {}, 2323: {}, 2324: {}, 2325: {}, 2326: {}, 2327: {}, 2328: {}, 2329: {}, 2330: {}, 2331: 
-{}, 2332: {}, 2333: {}, 2334: {}, 2335: {}, 2336: {}, 2337: {}, 2338: {}, 2339: {}, 2340: {}, 2341: {}, 2342: {}, 2343: {}, 2344: {}, 2345: {}, 2346: {}, 2347: {}, 2348: {}, 2349: {}, 2350: {}, 2351: {}, 2352: {}, 2353: {}, 2354: {}, 2355: {}, 2356: {}, 2357: {}, 2358: {}, 2359: {}, 2360: {}, 2361: {}, 2362: {}, 2363: {}, 2364: {}, 2365: {}, 2366: {}, 2367: {}, 2368: 
-{}, 2369: {}, 2370: {}, 2371: {}, 2372: {}, 2373: {}, 2374: {}, 2375: {}, 2376: {}, 2377: {}, 2378: {}, 2379: {}, 2380: {}, 2381: {}, 2382: {}, 2383: {}, 2384: {}, 2385: {}, 2386: {}, 2387: {}, 2388: {}, 2389: {}, 2390: {}, 2391: {}, 2392: {}, 2393: {}, 2394: {}, 2395: {}, 2396: {}, 2397: {}, 2398: {}, 2399: {}, 2400: {}, 2401: {}, 2402: {}, 2403: {}, 2404: {}, 2405: 
-{}, 2406: {}, 2407: {}, 2408: {}, 2409: {}, 2410: {}, 2411: {}, 2412: {}, 2413: {}, 2414: {}, 2415: {}, 2416: {}, 2417: {}}
-
-
-def generate_submission(depot_locations: pd.DataFrame, refinery_locations: pd.DataFrame, biomass_demand_supply: pd.DataFrame, pellet_demand_supply: pd.DataFrame):
-    refineries_location = format_refineries_location(refinery_locations) # PASS VALUES HERE
-    biomass_forecast_2018, biomass_forecast_2019 = format_biomass_forecast()
-    depot_location = format_depot_location(depot_locations)
-    biomass_demand_supply_2018, biomass_demand_supply_2019 = format_biomass_demand_supply(biomass_demand_supply)
-    pellet_demand_supply_2018, pellet_demand_supply_2019 = format_pellet_demand_supply(pellet_demand_supply)
-    result_df = pd.concat([depot_location, 
-                           refineries_location, 
-                           biomass_forecast_2018, 
-                           biomass_demand_supply_2018, 
-                           pellet_demand_supply_2018, 
-                           biomass_forecast_2019,
-                           biomass_demand_supply_2019,
-                           pellet_demand_supply_2019], ignore_index=True)
-    reordering = ["year","data_type","source_index","destination_index","value"]
-    result_df = result_df[reordering]
-    result_df['destination_index'] = result_df['destination_index'].apply(convert_to_int)
-    print(result_df)
-    result_df.to_csv("submission.csv", index=False)
-    print("==> Submission generated!")
-
-def convert_to_int(value):
-    if pd.notna(value):
-        return int(value)
-    return value
-
-def format_biomass_demand_supply(biomass_demand_supply: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
-    for index in range(2418):
-        if index not in biomass_demand_supply:
-            biomass_demand_supply[index] = {}
-    depot_locations = []
-    biomass_locations = []
-    value = []
-    for depot_location, locations in biomass_demand_supply.items():
-        for location, biomass in locations.items():
-            depot_locations.append(depot_location)
-            biomass_locations.append(location)
-            value.append(biomass)
-    data = {
-        'source_index': biomass_locations,
-        'destination_index': depot_locations,
-        'value': value
-    }
-    biomass_demand_supply = pd.DataFrame(data)
-    biomass_demand_supply["destination_index"] = biomass_demand_supply["destination_index"].astype(int)
-    biomass_demand_supply["data_type"] = "biomass_demand_supply"
-    biomass_demand_supply_2018 = pd.DataFrame(biomass_demand_supply.copy(deep=True))
-    biomass_demand_supply_2019 = pd.DataFrame(biomass_demand_supply)
-    biomass_demand_supply_2018["year"] = 2018
-    biomass_demand_supply_2019["year"] = 2019
-    return biomass_demand_supply_2018, biomass_demand_supply_2019
-
-def format_pellet_demand_supply(pellet_demand_supply: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
-    refinery_locations = []
-    depot_locations = []
-    value = []
-    for refinery_location, locations in pellet_demand_supply.items():
-        for location, depot in locations.items():
-            refinery_locations.append(refinery_location)
-            depot_locations.append(location)
-            value.append(depot)
-    data = {
-        'source_index': depot_locations,
-        'destination_index': refinery_locations,
-        'value': value
-    }
-    pellet_demand_supply = pd.DataFrame(data)
-    pellet_demand_supply["destination_index"] = pellet_demand_supply["destination_index"].astype(int)
-    pellet_demand_supply["data_type"] = "pellet_demand_supply"
-    pellet_demand_supply_2018 = pd.DataFrame(pellet_demand_supply.copy(deep=True))
-    pellet_demand_supply_2019 = pd.DataFrame(pellet_demand_supply)
-    pellet_demand_supply_2018["year"] = 2018
-    pellet_demand_supply_2019["year"] = 2019
-    return pellet_demand_supply_2018, pellet_demand_supply_2019
-
-def format_biomass_forecast() -> tuple[pd.DataFrame, pd.DataFrame]:
-    forecast = (pd.read_csv("forecasted_biomass.csv")).iloc[:,1:]
-    #forecast = predict_biomass()
-    forecast.rename(columns={"2018/2019": "value"}, inplace=True)
-    forecast.rename(columns={"Index": "source_index"}, inplace=True)
-    forecast_2018 = forecast.iloc[:,[0,11]].copy()
-    forecast_2019 = forecast.iloc[:,[0,11]].copy()
-    forecast_2018["data_type"] = "biomass_forecast"
-    forecast_2019["data_type"] = "biomass_forecast"
-    forecast_2018["year"] = 2018
-    forecast_2019["year"] = 2019  
-
-    return forecast_2018, forecast_2019
-
-def format_depot_location(depots: List[str]):
-    depots_df = pd.DataFrame(depots)
-    depots_df["year"] = 20182019
-    depots_df["data_type"] = "depot_location"
-    depots_df.rename(columns={0: "source_index"}, inplace=True)
-    return depots_df
-
-def format_refineries_location(refineries: List[str]):
-    refineries_df = pd.DataFrame(refineries)
-    refineries_df["year"] = 20182019
-    refineries_df["data_type"] = "refinery_location"
-    refineries_df.rename(columns={0: "source_index"}, inplace=True)
-    return refineries_df
+from submission_writer import SUBMISSION_CSV, write_submission
+
+
+def generate_submission(depot_locations: List[int], refinery_locations: List[int], biomass_demand_supply, pellet_demand_supply,
+                        biomass_forecast: pd.DataFrame = None, path: str = SUBMISSION_CSV):
+    """
+    Writes the submission, see submission_writer.py. biomass_forecast holds the Index and 2018/2019
+    columns of the forecast the flows were computed from, the cached solution.predict_biomass() when None.
+    The demand supply are flows as (sources, destinations, values) arrays, or dicts mapping each
+    destination to {source: amount}.
+    """
+    if biomass_forecast is None:
+        biomass_forecast = predict_biomass()
+    forecast = (biomass_forecast["Index"].to_numpy(), biomass_forecast["2018/2019"].to_numpy())
+    rows = write_submission(depot_locations, refinery_locations, forecast,
+                            as_flows(biomass_demand_supply), as_flows(pellet_demand_supply), path)
+    print("==> Submission generated!", rows, "rows written to", path)
+
+def as_flows(demand_supply) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if isinstance(demand_supply, dict):
+        return demand_supply_to_flows(demand_supply)
+    return demand_supply
+
+def demand_supply_to_flows(demand_supply: dict) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts a {destination: {source: amount}} dict into (sources, destinations, values) arrays, in dict order
+    """
+    counts = [len(sources) for sources in demand_supply.values()]
+    destinations = np.repeat(np.fromiter(demand_supply.keys(), dtype=np.int64, count=len(demand_supply)), counts)
+    sources = np.fromiter((source for sources in demand_supply.values() for source in sources), dtype=np.int64, count=sum(counts))
+    values = np.fromiter((value for sources in demand_supply.values() for value in sources.values()), dtype=np.float64, count=sum(counts))
+    return sources, destinations, values
 
 def update_biomass_demand_supply(depot: int, biomass_location: int, biomass_demand: int, biomass_demand_supply: pd.DataFrame):
     if depot not in biomass_demand_supply:
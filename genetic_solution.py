@@ -1,9 +1,17 @@
-import random
-import pandas as pd
+import argparse
+import itertools
+import multiprocessing
+import time
+import numpy as np
 from tqdm import tqdm
-from greedy_solution import update_biomass_depot
+from greedy_solution import fill_depot_flows
 from solution import predict_biomass
-from cost_helpers import DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY, calculate_cost_of_single_trip
+from cost_helpers import calculate_cost_of_flows
+from data_context import DATA, lazy_inputs
+from fitness_cache import FitnessCache, canonical
+from assignment import FITNESS, FITNESS_HELP, FITNESS_MODES, assignment_transport_cost
+from instrumentation import METRICS, add_instrumentation_arguments, emit, run_instrumented
+from checkpoint import CHECKPOINT_INTERVAL, CheckpointTimer, add_run_arguments, check_fitness, check_run_arguments, is_interactive, load_checkpoint, out_of_time, random_state, restore_random_state
 
 '''
 If cost of transport from nearest biomass A -> depot > cost of underutilization of depot (capacity - biomass in depot)
@@ -38,164 +46,283 @@ First, find the best Depot locations.
 '''
 
 
-DISTANCE_MATRIX = pd.read_csv('Distance_Matrix.csv')
-SAMPLE_SUBMISSION = pd.read_csv("sample_submission.csv")
+__getattr__ = lazy_inputs(__name__, {'DISTANCE_MATRIX': 'distance_matrix', 'SAMPLE_SUBMISSION': 'sample_submission', 'NUMBER_OF_SITES': 'number_of_sites'})
+POPULATION_SIZE = 10
+WORKERS = 1 # 1 scores the population in this process, more spreads it over a process pool
+SEED = None # seed of the numpy generator, None draws a fresh one each run
 
-def generate_inital_locations(sets: int = 10, locations: int = 15):
-    initial_depots = []
-    while len(initial_depots) < sets:
-        depot_locations = set()
-        while len(depot_locations) < locations:
-            depot_locations.add(random.randint(0, 2417)) 
-        initial_depots.append(depot_locations)
-    return initial_depots
+def generate_inital_locations(sets: int = 10, locations: int = 15, rng: np.random.Generator = None):
+    """
+    Draws sets of distinct site indexes, one set per row.
+
+    Args:
+        sets: Number of sets to draw
+        locations: Number of sites in each set
+        rng: numpy generator, a fresh one when None
+
+    Returns:
+        (sets x locations) int array
+    """
+    rng = rng or np.random.default_rng()
+    # the indexes of the smallest random keys in a row are a uniform sample without replacement
+    return np.argpartition(rng.random((sets, DATA.number_of_sites)), locations - 1, axis=1)[:, :locations]
 
-def fill_depots_and_calculate_transport(depots: set[int], forecasted_biomass: pd.DataFrame):
+def fill_depots_and_calculate_transport(depots, forecasted_biomass: np.ndarray, fitness: str = FITNESS):
     """
     Calculates the necessary transport required to fill all the depots using biomass and returns the cost
 
     Args:
-        depots (set[int]): A set of indexes representing the location of depots.
-        forecasted_biomass (DataFrame): The forecasted biomass at each index.
+        depots: Indexes representing the location of depots.
+        forecasted_biomass (ndarray): The forecasted biomass at each index, left unchanged.
+        fitness: 'greedy' fills the depots one after another, 'exact' solves the cheapest flows, see assignment.py
 
     Returns:
         int: Transport cost necessary to fill up all depots.
     """
-    # forecasted_biomass_list = forecasted_biomass["2018/2019"].tolist()
-    cost = 0
-    for depot in depots:
-        move_to_depot_cost, forecasted_biomass = update_biomass_depot(depot,forecasted_biomass,DISTANCE_MATRIX, pd.DataFrame())
-        cost += move_to_depot_cost
-        # biomass_in_depot = 0
-        # shortest_distance_matrix = DISTANCE_MATRIX.sort_values(by=str(depot), ascending=True)
-        # shortest_distance_col = shortest_distance_matrix.iloc[:, depot + 1]
-        # for index, value in shortest_distance_col.items():
-        #     if biomass_in_depot >= DEPOT_PROCESSING_CAPACITY:
-        #         break
-        #     if biomass_in_depot + forecasted_biomass_list[index] > DEPOT_PROCESSING_CAPACITY: # exceeds 20k
-        #         forecasted_biomass_list[depot] -= DEPOT_PROCESSING_CAPACITY - biomass_in_depot
-        #         biomass_in_depot = DEPOT_PROCESSING_CAPACITY
-        #     else: 
-        #         biomass_in_depot += forecasted_biomass_list[index]
-        #         forecasted_biomass_list[index] = 0
-
-            # cost += calculate_cost_of_single_trip(index, depot, value)
-    return cost
-
-def tournament_selection(population, fitness_scores, tournament_size):
-    selected_parents = []
-    population_size = len(population)
-
-    for _ in range(population_size):
-        # Select random participants for the tournament
-        tournament_participants = random.sample(population, tournament_size)
-
-        # Calculate fitness scores for participants
-        participant_fitness_scores = [fitness_scores[participant] for participant in tournament_participants]
-
-        # Select the participant with the lowest cost from the tournament
-        winner_index = participant_fitness_scores.index(min(participant_fitness_scores))
-        selected_parent = tournament_participants[winner_index]
-
-        selected_parents.append(selected_parent)
-
-    return selected_parents
-
-def perform_crossover(parent1: set[int], parent2: set[int]):
-    crossover_point = random.randint(0, len(parent1) - 1)
-    parent1 = list(parent1)
-    parent2 = list(parent2)
-    if len(parent1) != len(parent2):
-        print("ERROR FOUND HERE!", parent1, parent2)
-        if len(parent1) < 15:
-            parent1.append(random.randint(0, 2417))
-        if len(parent2) < 15:
-            parent2.append(random.randint(0, 2417))
-    offspring1 = set()
-    offspring2 = set()
-    for index in range(len(parent1)):
-        if index < crossover_point:
-            offspring1.add(parent1[index])
-            offspring2.add(parent2[index])
-        else:
-            offspring2.add(parent1[index])
-            offspring1.add(parent2[index])
-    index1= 0
-    while len(offspring1) < len(parent1):
-        if index1 < len(parent1):
-            offspring1.add(parent1[index1])
-        else:
-            offspring1.add(random.randint(0, 2417))
-        index1 += 1
-    index2=0
-    while len(offspring2) < len(parent2):
-        if index2 < len(parent2):
-            offspring2.add(parent2[index2])
-        else:
-            offspring2.add(random.randint(0, 2417))
-        index2 += 1
+    if fitness == 'exact':
+        return assignment_transport_cost(canonical(depots), forecasted_biomass)
+    # Filled in sorted order, so the cost only depends on the set and can be cached
+    sources, destinations, values = fill_depot_flows(list(canonical(depots)), forecasted_biomass.copy())
+    return calculate_cost_of_flows(sources, destinations, values)
 
+_worker_biomass_forecast = None
+_worker_fitness = FITNESS
+
+def init_worker(biomass_forecast: np.ndarray, fitness: str = FITNESS):
+    """
+    Runs once in each pool worker. The forecast is handed over once per worker instead of once per task,
+    and the distance matrix and neighbour order are memory-mapped on import, so every worker shares their pages.
+    """
+    global _worker_biomass_forecast, _worker_fitness
+    _worker_biomass_forecast = biomass_forecast
+    _worker_fitness = fitness
+
+def fill_depots_in_worker(depots: tuple[int]):
+    return fill_depots_and_calculate_transport(depots, _worker_biomass_forecast, _worker_fitness)
+
+def evaluate_population(sets_of_depots: np.ndarray, biomass_forecast: np.ndarray, pool=None, cache: FitnessCache = None, fitness: str = FITNESS):
+    """
+    Calculates the transport cost of every set of depots in the population.
+    Duplicate sets are only scored once, and sets already in the cache are not scored again.
+
+    Args:
+        sets_of_depots: The population, one row of depot indexes per individual.
+        biomass_forecast: The forecasted biomass at each index.
+        pool: multiprocessing.Pool started with init_worker, or None to score the sets in this process.
+        cache: FitnessCache shared across generations, or None to score every set.
+        fitness: How a set is scored, see fill_depots_and_calculate_transport. A pool scores with the fitness it was started with.
+
+    Returns:
+        list[float]: Transport cost of each set, in population order.
+    """
+    keys = [canonical(depots) for depots in sets_of_depots]
+    costs = {}
+    for key in keys:
+        if key not in costs:
+            costs[key] = cache.get((fitness, key)) if cache is not None else None
+    missing = [key for key, cost in costs.items() if cost is None]
+    if pool is None:
+        missing_costs = [fill_depots_and_calculate_transport(key, biomass_forecast, fitness) for key in missing]
+    else:
+        missing_costs = pool.map(fill_depots_in_worker, missing)
+    for key, cost in zip(missing, missing_costs):
+        costs[key] = cost
+        if cache is not None:
+            cache.put((fitness, key), cost)
+    return [costs[key] for key in keys]
+
+def tournament_selection(fitness_scores: np.ndarray, tournament_size: int, rng: np.random.Generator):
+    """
+    Runs one tournament per individual. The participants of a tournament are distinct individuals,
+    like random.sample, and the one with the lowest cost wins.
+
+    Returns:
+        Population index of each selected parent
+    """
+    population_size = len(fitness_scores)
+    participants = np.argpartition(rng.random((population_size, population_size)), tournament_size - 1, axis=1)[:, :tournament_size]
+    winners = np.argmin(fitness_scores[participants], axis=1)
+    return participants[np.arange(population_size), winners]
+
+def take_distinct(candidates: np.ndarray, locations: int):
+    """
+    Keeps the first occurrence of every site in each row and returns the first `locations` of them.
+    Each row must hold at least `locations` distinct sites.
+    """
+    width = candidates.shape[1]
+    order = np.argsort(candidates, axis=1, kind='stable')
+    sorted_candidates = np.take_along_axis(candidates, order, axis=1)
+    repeated = np.zeros(candidates.shape, dtype=bool)
+    repeated[:, 1:] = sorted_candidates[:, 1:] == sorted_candidates[:, :-1]
+    is_duplicate = np.empty(candidates.shape, dtype=bool)
+    np.put_along_axis(is_duplicate, order, repeated, axis=1)
+    # the stable sort puts the earliest position of a site first, so only later copies are marked
+    priority = np.where(is_duplicate, width, np.arange(width))
+    keep = np.argsort(priority, axis=1, kind='stable')[:, :locations]
+    return np.take_along_axis(candidates, keep, axis=1)
+
+def perform_crossover(parents1: np.ndarray, parents2: np.ndarray, rng: np.random.Generator):
+    """
+    One point crossover of each pair of parents. Both parents are shuffled first since the order
+    of sites in a row means nothing. Sites that end up twice in a child are replaced by the unused
+    sites of its own parent, so every child keeps distinct sites.
+
+    Args:
+        parents1, parents2: (pairs x locations) arrays, row i of both is one pair
+
+    Returns:
+        offspring1, offspring2: (pairs x locations) arrays
+    """
+    pairs, locations = parents1.shape
+    parents1 = rng.permuted(parents1, axis=1)
+    parents2 = rng.permuted(parents2, axis=1)
+    crossover_point = rng.integers(0, locations, size=(pairs, 1))
+    from_first = np.arange(locations) < crossover_point
+    offspring1 = np.where(from_first, parents1, parents2)
+    offspring2 = np.where(from_first, parents2, parents1)
+    # sites a child got twice are replaced by the rest of its own parent, then of the other parent
+    offspring1 = take_distinct(np.hstack([offspring1, parents1, parents2]), locations)
+    offspring2 = take_distinct(np.hstack([offspring2, parents2, parents1]), locations)
     return offspring1, offspring2
 
-def perform_mutation(children: list[set[int]], mutation_rate: float):
-    child_length = len(children[0]) 
-    for index in range(len(children)):
-        if random.random() < mutation_rate:
-            children[index].pop()
-            while len(children[index]) < child_length:
-                children[index].add(random.randint(0, 2417))  # Replace with a random integer
+def perform_mutation(children: np.ndarray, mutation_rate: float, rng: np.random.Generator):
+    """
+    Replaces one random site of each mutated child with a site it does not hold yet.
+
+    The new site is drawn uniformly from the sites missing from the row: the r-th missing site is r
+    plus the number of sorted row entries s[i] with s[i] - i <= r.
+    """
+    mutated = np.flatnonzero(rng.random(len(children)) < mutation_rate)
+    if len(mutated) == 0:
+        return children
+    locations = children.shape[1]
+    rows = np.sort(children[mutated], axis=1)
+    r = rng.integers(0, DATA.number_of_sites - locations, size=len(mutated))
+    new_sites = r + np.sum(rows - np.arange(locations) <= r[:, None], axis=1)
+    children[mutated, rng.integers(0, locations, size=len(mutated))] = new_sites
     return children
 
 
-def main():
-    iterations = input("How many iterations: ")
-    if iterations == "secret":
-        sets_of_depots = [{387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 94, 504, 985, 1981, 1086, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 504, 94, 1086, 985, 1981, 1694, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}]
-        print("Using saved depots, with lowest cost:", min([7453177.211994515, 7964046.886082531, 7584148.660531587, 7964046.886082531, 7584148.660531587, 7584148.660531587, 7584148.660531587, 7584148.660531587, 8352251.634412729, 7964046.886082529]
+def main(population_size: int = POPULATION_SIZE, workers: int = WORKERS, seed: int = SEED, iterations: int = None, time_budget: float = None,
+         checkpoint: str = None, checkpoint_every: float = CHECKPOINT_INTERVAL, resume: bool = False, fitness: str = FITNESS):
+    """
+    Runs the genetic search. Without an iteration count, time budget or checkpoint to resume from
+    the number of iterations is asked for, see checkpoint.py for the command line options.
+    """
+    rng = np.random.default_rng(seed)
+    start_iteration = 0
+    best_cost, best_depots = np.inf, None
+    skipped_mutation = False
+    if resume:
+        state = load_checkpoint(checkpoint)
+        check_fitness(state, fitness)
+        sets_of_depots = state['population']
+        start_iteration = state['iteration']
+        best_cost, best_depots = state['best']
+        restore_random_state(state['random_state'], rng)
+        iterations = iterations if iterations is not None else state['iterations']
+        skipped_mutation = state.get('skipped_mutation', False)
+        print("Resuming from iteration", start_iteration, "with lowest cost:", best_cost)
+    elif is_interactive(iterations, time_budget, resume):
+        iterations = input("How many iterations: ")
+        if iterations == "secret":
+            sets_of_depots = np.array([sorted(depots) for depots in [{387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 94, 504, 985, 1981, 1086, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 504, 94, 1086, 985, 1981, 1694, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1694, 1101, 1485, 2286, 1360, 1938, 1907, 504, 985, 1086, 1981, 94, 1469}, {387, 811, 1485, 1101, 2286, 1360, 1938, 1907, 94, 504, 985, 1086, 1981, 1694, 1469}]])
+            print("Using saved depots, with lowest cost:", min([7453177.211994515, 7964046.886082531, 7584148.660531587, 7964046.886082531, 7584148.660531587, 7584148.660531587, 7584148.660531587, 7584148.660531587, 8352251.634412729, 7964046.886082529]
 ))
-        iterations = int(input("How many iterations: ")) 
+            iterations = int(input("How many iterations: ")) 
+        else:
+            iterations = int(iterations)
+            sets_of_depots = generate_inital_locations(sets=population_size, locations=DATA.number_of_depots, rng=rng)
     else:
-        iterations = int(iterations)
-        sets_of_depots = generate_inital_locations()
-    biomass_forecast = predict_biomass().iloc[:,[0,11]]
-    for _ in tqdm(range(iterations), desc="Iteration:"):
+        sets_of_depots = generate_inital_locations(sets=population_size, locations=DATA.number_of_depots, rng=rng)
+    biomass_forecast = predict_biomass()['2018/2019'].to_numpy()
+    pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(biomass_forecast, fitness)) if workers > 1 else None
+    fitness_cache = FitnessCache()
+    METRICS.watch_cache('fitness_cache', fitness_cache)
+    cost_of_depot_sets = np.array([])
+
+    def run_state():
+        return {
+            'population': sets_of_depots,
+            'iteration': completed_iterations,
+            'iterations': iterations,
+            'best': (best_cost, best_depots),
+            'random_state': random_state(rng),
+            'fitness': fitness,
+            'skipped_mutation': skipped_mutation,
+        }
+
+    checkpoint_timer = CheckpointTimer(checkpoint, checkpoint_every)
+    start_time = time.monotonic()
+    completed_iterations = start_iteration
+    if skipped_mutation and (iterations is None or start_iteration < iterations):
+        # the run that saved the checkpoint skipped the mutation of its last planned iteration, make it now
+        # so a run extended past that iteration draws the same numbers as one that never stopped
+        with METRICS.timer('mutation'):
+            sets_of_depots = perform_mutation(sets_of_depots, 1/sets_of_depots.shape[1], rng)
+        skipped_mutation = False
+    generations = range(start_iteration, iterations) if iterations is not None else itertools.count(start_iteration)
+    for _ in tqdm(generations, desc="Iteration:", initial=start_iteration, total=iterations):
 
-        cost_of_depot_sets = []
         # calculate cost to fill each depot in each set
-        for depots in sets_of_depots:
-            biomass_for_iteration = biomass_forecast.copy()
-            cost = fill_depots_and_calculate_transport(depots, biomass_for_iteration)
-            cost_of_depot_sets.append(cost)  
-        if _ == 0: print("Initial cost:", cost_of_depot_sets)
+        with METRICS.timer('evaluation'):
+            cost_of_depot_sets = np.array(evaluate_population(sets_of_depots, biomass_forecast, pool, fitness_cache, fitness))
+        if _ == 0: print("Initial cost:", cost_of_depot_sets.tolist())
+        if cost_of_depot_sets.min() < best_cost:
+            best_cost = float(cost_of_depot_sets.min())
+            best_depots = sets_of_depots[np.argmin(cost_of_depot_sets)].tolist()
         # choose parents to have the next generation
         tournament_size = 2  # Tournament size 20% of gen size
-        population = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9]
-        selected_parents = tournament_selection(population, cost_of_depot_sets, tournament_size)
-
-        children = []
-        min_index = min(range(len(cost_of_depot_sets)), key=lambda i: cost_of_depot_sets[i])
-        children.append(sets_of_depots[min_index]) # lowest cost parent survives to next generation
-        for index in range(0, len(selected_parents) - 1, 2): # crossover to create children
-            child1, child2 = perform_crossover(sets_of_depots[selected_parents[index]], sets_of_depots[selected_parents[index + 1]])
-            children.append(child1)
-            if len(children) < 10: children.append(child2)
-
-        # Mutate children 
-        if _ < iterations - 1:
-            mutation_rate = 1/len(children[0])
-            children = perform_mutation(children, mutation_rate)
+        with METRICS.timer('selection'):
+            selected_parents = tournament_selection(cost_of_depot_sets, tournament_size, rng)
+
+        # crossover to create children, the lowest cost parent survives to next generation
+        with METRICS.timer('crossover'):
+            offspring1, offspring2 = perform_crossover(sets_of_depots[selected_parents[0:-1:2]], sets_of_depots[selected_parents[1::2]], rng)
+        elite = sets_of_depots[[np.argmin(cost_of_depot_sets)]]
+        offspring = np.stack([offspring1, offspring2], axis=1).reshape(-1, sets_of_depots.shape[1])
+        children = np.vstack([elite, offspring])[:len(sets_of_depots)]
+
+        # Mutate children
+        if iterations is None or _ < iterations - 1:
+            mutation_rate = 1/children.shape[1]
+            with METRICS.timer('mutation'):
+                children = perform_mutation(children, mutation_rate, rng)
+        else:
+            skipped_mutation = True
 
         # for i in range(len(children)):
         #     print(f"Selected Parent {i}: {sets_of_depots[selected_parents[i]]}")
         #     print(f"Children {i}: {children[i]}")
         # print(children)
         sets_of_depots = children
-    print("Final cost:", cost_of_depot_sets)
-    print("Final sets of Depots:", sets_of_depots)
+        completed_iterations = _ + 1
+        emit("generation", iteration=completed_iterations, best_cost=best_cost, population_cost=float(cost_of_depot_sets.min()))
+        if out_of_time(start_time, time_budget):
+            break
+        checkpoint_timer.maybe_save(run_state)
+    checkpoint_timer.maybe_save(run_state, force=True)
+    if pool is not None:
+        pool.close()
+        pool.join()
+    print("Final cost:", cost_of_depot_sets.tolist())
+    print("Final sets of Depots:", sets_of_depots.tolist())
+    print("Lowest cost found:", best_cost, best_depots)
+    print("Fitness cache:", fitness_cache.report())
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Genetic search for the depot locations")
+    parser.add_argument('--population-size', type=int, default=POPULATION_SIZE)
+    parser.add_argument('--workers', type=int, default=WORKERS, help="processes scoring the population")
+    parser.add_argument('--fitness', choices=FITNESS_MODES, default=FITNESS, help=FITNESS_HELP)
+    add_run_arguments(parser)
+    add_instrumentation_arguments(parser)
+    parser.set_defaults(seed=SEED)
+    return check_run_arguments(parser, parser.parse_args(argv))
 
 
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'genetic_solution')
 
 '''
 After running for: 3000 iterations ~4hrs
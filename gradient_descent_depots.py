@@ -1,107 +1,180 @@
+import argparse
+import itertools
 import random
-import pandas as pd
+import time
+import numpy as np
 from tqdm import tqdm
 from genetic_solution import generate_inital_locations
-from greedy_solution import DISTANCE_MATRIX, NUMBER_OF_DEPOTS, update_biomass_depot
+from data_context import DATA
+from greedy_solution import fill_depot_flows, depot_fill_state
+from cost_helpers import calculate_cost_per_destination
+from fitness_cache import FitnessCache, canonical
+from assignment import FITNESS, FITNESS_HELP, FITNESS_MODES, exact_depot_state
+from spatial import NEIGHBOUR_RADIUS, load_site_neighbours
+from instrumentation import METRICS, add_instrumentation_arguments, emit, run_instrumented
+from checkpoint import CHECKPOINT_INTERVAL, CheckpointTimer, add_run_arguments, check_fitness, check_run_arguments, is_interactive, load_checkpoint, out_of_time, random_state, restore_random_state
 from solution import predict_biomass
 
-def fill_depots(depots: list[int], biomass_forecast: pd.DataFrame):
-    depot_cost = {}
-    biomass_demand_supply = {}
-    # Calculate cost for filling each refinery
-    dist_mat = DISTANCE_MATRIX
-    for i in range(NUMBER_OF_DEPOTS):
-        depot = depots[i]
-        move_to_depot_cost, biomass_forecast = update_biomass_depot(depot,biomass_forecast,dist_mat, biomass_demand_supply)
-        depot_cost[depot] = move_to_depot_cost
+def calculate_depot_cost(depots: list[int], biomass_forecast: np.ndarray, fitness: str = FITNESS):
+    if fitness == 'exact':
+        return exact_depot_state(depots, biomass_forecast).facility_costs()
+    depot_cost = dict.fromkeys(depots, 0)
+    # Calculate cost for filling each depot
+    sources, destinations, values = fill_depot_flows(depots, biomass_forecast.copy())
+    depot_cost.update(calculate_cost_per_destination(sources, destinations, values))
     return depot_cost
 
-def generate_next_generation(learning_rate: int, depots: set[int], depot_cost: dict[int, int], biomass_forecast: pd.DataFrame):
-    total_cost = sum(depot_cost.values())
-    depots = list(depot_cost.keys())
-    next_generation_of_depots = []
-    dist_mat = DISTANCE_MATRIX
-    # print(depot_cost)
-    # Move each depot in direction, determined through learning_rate
-    for i in range(len(depots)):
-        if depots[i] + learning_rate < 2417:
-            new_depot_1 = depots[i] + learning_rate
-        else: 
-            new_depot_1 = depots[i] - 2 * learning_rate
+def fill_depots(depots: list[int], biomass_forecast: np.ndarray, fitness: str = FITNESS, cache: FitnessCache = None):
+    """
+    Fills the depots in sorted order, or with the exact flows when fitness is 'exact', and returns
+    the transport cost of each depot.
 
-        # Calculate cost of depot 1
-        new_depots = list(depot_cost.keys())
-        new_depots.remove(depots[i])
-        new_depots.append(new_depot_1)
-        new_depot_cost = fill_depots(new_depots, biomass_forecast.copy())
-        total_cost_1 = sum(new_depot_cost.values())
-        
-        if depots[i] - learning_rate > 0:
-            new_depot_2 = depots[i] - learning_rate
-        else: 
-            new_depot_2 = depots[i] + 2 * learning_rate
+    Args:
+        cache: FitnessCache of the run, or None to fill every set. Its keys hold the depots only, so
+            a cache must not outlive the forecast and instance it was filled with.
+    """
+    depots = canonical(depots[:DATA.number_of_depots])
+    if cache is None:
+        return calculate_depot_cost(list(depots), biomass_forecast, fitness)
+    return dict(cache.get_or_compute((fitness, depots), lambda: calculate_depot_cost(list(depots), biomass_forecast, fitness)))
 
+def generate_next_generation(site_neighbours: list[np.ndarray], depots: list[int], depot_cost: dict[int, int], biomass_forecast: np.ndarray,
+                             fitness: str = FITNESS):
+    """
+    Moves each depot in turn to the neighbouring site that lowers the total cost the most.
+    A depot stays where it is when none of its neighbours lowers the cost. Moves are scored
+    with a FillState, which only fills again the depots a move affects, or an AssignmentState
+    when fitness is 'exact'.
 
-        # Calculate cost of depot 2
-        new_depots = list(depot_cost.keys())
-        new_depots.remove(depots[i])
-        new_depots.append(new_depot_2)
-        new_depot_cost = fill_depots(new_depots, biomass_forecast.copy())
-        total_cost_2 = sum(new_depot_cost.values())
-        if total_cost < total_cost_1 and total_cost < total_cost_2:
-            next_generation_of_depots.append(depots[i])
-        elif total_cost_1 < total_cost_2 and total_cost_1 < total_cost:
-            next_generation_of_depots.append(new_depot_1)
-            depots[i] = new_depot_1
-            total_cost = total_cost_1
-        elif total_cost_2 < total_cost_1 and total_cost_2 < total_cost:
-            next_generation_of_depots.append(new_depot_2)
-            depots[i] = new_depot_2
-            total_cost = total_cost_2
-        else:
-            print("I'm confused")
-            random_depot = random.randint(0, 2417)
-            next_generation_of_depots.append(random_depot)
-            depots[i] = random_depot
-            total_cost = sum(depots)
+    Args:
+        site_neighbours: Geographic neighbours of every site, see spatial.load_site_neighbours
 
-    return next_generation_of_depots
+    Returns:
+        The depots after the moves
+    """
+    depots = list(depot_cost.keys())
+    fill_state = (exact_depot_state if fitness == 'exact' else depot_fill_state)(depots, biomass_forecast)
+    total_cost = fill_state.total_cost()
+    for i in range(len(depots)):
+        best_move = None
+        for neighbour in site_neighbours[depots[i]]:
+            if neighbour in depots:
+                continue
+            new_total_cost = fill_state.evaluate_swap(depots[i], neighbour)
+            if new_total_cost < total_cost:
+                best_move = int(neighbour)
+                total_cost = new_total_cost
+        if best_move is not None:
+            fill_state = fill_state.swap(depots[i], best_move)
+            depots[i] = best_move
+    return depots
 
-def perform_mutation(depots: list[int], mutation_rate: float, depots_cost: int, biomass_forecast: pd.DataFrame):
+def perform_mutation(depots: list[int], mutation_rate: float, depots_cost: int, biomass_forecast: np.ndarray, fitness: str = FITNESS,
+                     cache: FitnessCache = None):
     children = depots.copy()
     child_length = len(depots) 
     if random.random() < mutation_rate:
         index = random.randint(0, child_length - 1)
         while True:
-            new_child = random.randint(0, 2417)
+            new_child = random.randint(0, DATA.number_of_sites - 1)
             if new_child not in children:
                 children[index] = new_child  # Replace with a random integer
                 break
-    chlidren_cost = sum(fill_depots(children, biomass_forecast).values())
+    chlidren_cost = sum(fill_depots(children, biomass_forecast, fitness, cache).values())
     if depots_cost > chlidren_cost:
         return children
     else:
         return depots
 
-def main():
-    biomass_forecast = predict_biomass()
-    random_depots = list(generate_inital_locations(sets=1, locations=15)[0]) # Generate random depots
-    learning_rate = 10
-    depot_cost = fill_depots(random_depots, biomass_forecast.copy())
-    print("Initial depots and Cost of each refinery:", depot_cost, "  Total:", sum(depot_cost.values()))
-    depots = random_depots
-    iterations = int(input("How many iterations: ")) 
-    for _ in tqdm(range(iterations), desc="Depot gradient descent:"):
-        depot_cost = fill_depots(depots, biomass_forecast.copy())
-        depots = generate_next_generation(learning_rate, depots, depot_cost, biomass_forecast.copy())
-        if _ < iterations - 1:
+def main(iterations: int = None, time_budget: float = None, seed: int = None, checkpoint: str = None,
+         checkpoint_every: float = CHECKPOINT_INTERVAL, resume: bool = False, neighbour_radius: int = NEIGHBOUR_RADIUS,
+         fitness: str = FITNESS):
+    """
+    Runs the depot gradient descent. Without an iteration count, time budget or checkpoint to resume
+    from the number of iterations is asked for, see checkpoint.py for the command line options.
+    """
+    biomass_forecast = predict_biomass()['2018/2019'].to_numpy()
+    site_neighbours = load_site_neighbours(neighbour_radius)
+    fitness_cache = FitnessCache()
+    start_iteration = 0
+    skipped_mutation = None
+    if resume:
+        state = load_checkpoint(checkpoint)
+        check_fitness(state, fitness)
+        depots = state['depots']
+        start_iteration = state['iteration']
+        best_cost, best_depots = state['best']
+        restore_random_state(state['random_state'])
+        iterations = iterations if iterations is not None else state['iterations']
+        skipped_mutation = state.get('skipped_mutation')
+        print("Resuming from iteration", start_iteration, "with lowest cost:", best_cost)
+    else:
+        random.seed(seed)
+        random_depots = generate_inital_locations(sets=1, locations=DATA.number_of_depots, rng=np.random.default_rng(seed))[0].tolist() # Generate random depots
+        depot_cost = fill_depots(random_depots, biomass_forecast.copy(), fitness, fitness_cache)
+        print("Initial depots and Cost of each refinery:", depot_cost, "  Total:", sum(depot_cost.values()))
+        depots = random_depots
+        best_cost, best_depots = sum(depot_cost.values()), list(depot_cost.keys())
+        if is_interactive(iterations, time_budget, resume):
+            iterations = int(input("How many iterations: ")) 
+
+    def run_state():
+        return {
+            'depots': depots,
+            'iteration': completed_iterations,
+            'iterations': iterations,
+            'best': (best_cost, best_depots),
+            'random_state': random_state(),
+            'fitness': fitness,
+            'skipped_mutation': skipped_mutation,
+        }
+
+    checkpoint_timer = CheckpointTimer(checkpoint, checkpoint_every)
+    start_time = time.monotonic()
+    completed_iterations = start_iteration
+    depot_cost = fill_depots(depots, biomass_forecast.copy(), fitness, fitness_cache)
+    steps = range(start_iteration, iterations) if iterations is not None else itertools.count(start_iteration)
+    METRICS.watch_cache('fitness_cache', fitness_cache)
+    if skipped_mutation is not None and (iterations is None or start_iteration < iterations):
+        # the run that saved the checkpoint skipped the mutation of its last planned iteration, make it now
+        # so a run extended past that iteration draws the same numbers as one that never stopped
+        with METRICS.timer('mutation'):
+            depots = perform_mutation(depots, 1/len(depots), skipped_mutation, biomass_forecast.copy(), fitness, fitness_cache)
+        skipped_mutation = None
+    for _ in tqdm(steps, desc="Depot gradient descent:", initial=start_iteration, total=iterations):
+        with METRICS.timer('evaluation'):
+            depot_cost = fill_depots(depots, biomass_forecast.copy(), fitness, fitness_cache)
+        if sum(depot_cost.values()) < best_cost:
+            best_cost, best_depots = sum(depot_cost.values()), list(depot_cost.keys())
+        with METRICS.timer('descent'):
+            depots = generate_next_generation(site_neighbours, depots, depot_cost, biomass_forecast, fitness)
+        if iterations is None or _ < iterations - 1:
             mutation_rate = 1/len(depots)
-            depots = perform_mutation(depots, mutation_rate, sum(depot_cost.values()), biomass_forecast.copy())
+            with METRICS.timer('mutation'):
+                depots = perform_mutation(depots, mutation_rate, sum(depot_cost.values()), biomass_forecast.copy(), fitness, fitness_cache)
+        else:
+            skipped_mutation = sum(depot_cost.values())
         print(depots)
+        completed_iterations = _ + 1
+        emit("iteration", iteration=completed_iterations, best_cost=best_cost, cost=sum(depot_cost.values()))
+        if out_of_time(start_time, time_budget):
+            break
+        checkpoint_timer.maybe_save(run_state)
+    checkpoint_timer.maybe_save(run_state, force=True)
     print("Final Depots and Cost of each depot:", depot_cost, "  Total:", sum(depot_cost.values()))
+    print("Lowest cost found:", best_cost, best_depots)
+    print("Fitness cache:", fitness_cache.report())
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Gradient descent on the depot locations")
+    parser.add_argument('--neighbour-radius', type=int, default=NEIGHBOUR_RADIUS, help="grid cells a site can move in one step")
+    parser.add_argument('--fitness', choices=FITNESS_MODES, default=FITNESS, help=FITNESS_HELP)
+    add_run_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return check_run_arguments(parser, parser.parse_args(argv))
 
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'gradient_descent_depots')
 
 '''
 Final Depots and Cost of each depot: {1922: 663783.5096799524, 2403: 2657975.6835127235, 1807: 689825.9257929691, 435: 875372.7014236345, 2255: 1429969.611400446, 
@@ -1,148 +1,218 @@
+import argparse
+import itertools
+import json
 import random
-import pandas as pd
+import time
+import numpy as np
 from tqdm import tqdm
 from genetic_solution import generate_inital_locations
-from greedy_solution import DISTANCE_MATRIX, NUMBER_OF_DEPOTS, NUMBER_OF_REFINERIES, generate_cost_depots, generate_depot_matrix, remove_empty_biomass, remove_empty_dist, update_biomass_refinery
-from cost_helpers import DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY, calculate_cost_of_single_trip
-
-def fill_refineries(refineries: list[int], depots: list[int]):
-    refinery_cost = {}
-    pellet_demand_supply = {}
+from data_context import DATA
+from greedy_solution import fill_refinery_flows, refinery_fill_state
+from cost_helpers import DEPOT_PROCESSING_CAPACITY, calculate_cost_per_destination
+from fitness_cache import FitnessCache, canonical
+from assignment import FITNESS, FITNESS_HELP, FITNESS_MODES, exact_refinery_state
+from spatial import NEIGHBOUR_RADIUS, load_site_neighbours
+from refinery_search import CANDIDATE_SITES, search_refineries
+from instrumentation import METRICS, add_instrumentation_arguments, emit, run_instrumented
+from annealing_depots import greedy_depots
+from solution import predict_biomass
+from checkpoint import CHECKPOINT_INTERVAL, CheckpointTimer, add_run_arguments, check_fitness, check_run_arguments, is_interactive, load_checkpoint, out_of_time, random_state, restore_random_state
+
+def depot_pellets(depots: list[int]):
+    """
+    Pellets waiting at each index, every depot holding a full load
+    """
+    depot_forecast = np.zeros(DATA.number_of_sites)
+    depot_forecast[depots] = DEPOT_PROCESSING_CAPACITY
+    return depot_forecast
+
+def load_depots(depots_json: str = None) -> list[int]:
+    """
+    Depots the refineries are placed for, the "depots" of a json file such as the best set written
+    by annealing_depots.py, or the greedy depots of the forecast when depots_json is None
+    """
+    if depots_json is None:
+        return greedy_depots(predict_biomass()['2018/2019'].to_numpy())
+    with open(depots_json) as depots_file:
+        depots = [int(depot) for depot in json.load(depots_file)['depots']]
+    if len(set(depots)) != DATA.number_of_depots or not all(0 <= depot < DATA.number_of_sites for depot in depots):
+        raise ValueError(f"{depots_json} does not hold {DATA.number_of_depots} distinct sites")
+    return depots
+
+def calculate_refinery_cost(refineries: list[int], depots: list[int], fitness: str = FITNESS):
+    if fitness == 'exact':
+        return exact_refinery_state(refineries, depot_pellets(depots)).facility_costs()
+    refinery_cost = dict.fromkeys(refineries, 0)
     # Calculate cost for filling each refinery
-    depot_forecast = pd.DataFrame({'Index': depots, '2018/2019':[int(20000),]*NUMBER_OF_DEPOTS}, index = depots)
-    dist_mat_2 = generate_depot_matrix(depots)
-    for i in range(NUMBER_OF_REFINERIES):
-        refinery = refineries[i] # some randomness for fun
-        move_to_refinery_cost, depot_forecast = update_biomass_refinery(refinery,depot_forecast,dist_mat_2,pellet_demand_supply)
-        refinery_cost[refinery] = move_to_refinery_cost
+    sources, destinations, values = fill_refinery_flows(refineries, depot_pellets(depots))
+    refinery_cost.update(calculate_cost_per_destination(sources, destinations, values))
     return refinery_cost
 
-def generate_next_generation(learning_rate: int, depots: set[int], refinery_cost: dict[int, int]):
-    total_cost = sum(refinery_cost.values())
+def fill_refineries(refineries: list[int], depots: list[int], fitness: str = FITNESS, cache: FitnessCache = None):
+    """
+    Fills the refineries in sorted order from the depots, or with the exact flows when fitness is
+    'exact', and returns the transport cost of each refinery.
+
+    Args:
+        cache: FitnessCache of the run, or None to fill every set. Its keys hold the sites only, so
+            a cache must not outlive the instance it was filled with.
+    """
+    key = (fitness, canonical(refineries[:DATA.number_of_refineries]), canonical(depots))
+    if cache is None:
+        return calculate_refinery_cost(list(key[1]), list(key[2]), fitness)
+    return dict(cache.get_or_compute(key, lambda: calculate_refinery_cost(list(key[1]), list(key[2]), fitness)))
+
+def generate_next_generation(site_neighbours: list[np.ndarray], depots: list[int], refinery_cost: dict[int, int], fitness: str = FITNESS):
+    """
+    Moves each refinery in turn to the neighbouring site that lowers the total cost the most.
+    A refinery stays where it is when none of its neighbours lowers the cost. Moves are scored
+    with a FillState, which only fills again the refineries a move affects, or an AssignmentState
+    when fitness is 'exact'.
+
+    Args:
+        site_neighbours: Geographic neighbours of every site, see spatial.load_site_neighbours
+
+    Returns:
+        The refineries after the moves
+    """
     refineries = list(refinery_cost.keys())
-    next_generation_of_refineries = []
-    # print(refinery_cost)
-    # Move each refinery in direction, determined through learning_rate
+    fill_state = (exact_refinery_state if fitness == 'exact' else refinery_fill_state)(refineries, depot_pellets(depots))
+    total_cost = fill_state.total_cost()
     for i in range(len(refineries)):
-        if refineries[i] + learning_rate < 2417:
-            new_refinery_1 = refineries[i] + learning_rate
-        else: 
-            new_refinery_1 = refineries[i] - 2 * learning_rate
-
-        # Calculate cost of refinery 1
-        new_refineries = list(refinery_cost.keys())
-        new_refineries.remove(refineries[i])
-        new_refineries.append(new_refinery_1)
-        new_refinery_cost = fill_refineries(new_refineries, depots)
-        total_cost_1 = sum(new_refinery_cost.values())
-        
-        if refineries[i] - learning_rate > 0:
-            new_refinery_2 = refineries[i] - learning_rate
-        else: 
-            new_refinery_2 = refineries[i] + 2 * learning_rate
-
-
-        # Calculate cost of refinery 2
-        new_refineries = list(refinery_cost.keys())
-        new_refineries.remove(refineries[i])
-        new_refineries.append(new_refinery_2)
-        new_refinery_cost = fill_refineries(new_refineries, depots)
-        total_cost_2 = sum(new_refinery_cost.values())
-        if total_cost < total_cost_1 and total_cost < total_cost_2:
-            next_generation_of_refineries.append(refineries[i])
-        elif total_cost_1 < total_cost_2 and total_cost_1 < total_cost:
-            next_generation_of_refineries.append(new_refinery_1)
-            refineries[i] = new_refinery_1
-            total_cost = total_cost_1
-        elif total_cost_2 < total_cost_1 and total_cost_2 < total_cost:
-            next_generation_of_refineries.append(new_refinery_2)
-            refineries[i] = new_refinery_2
-            total_cost = total_cost_2
-        else:
-            print("I'm confused")
-            random_refinery = random.randint(0, 2417)
-            next_generation_of_refineries.append(random_refinery)
-            refineries[i] = random_refinery
-            total_cost = sum(refineries)
-
-    # for refinery, cost in refinery_cost.items():
-    #     if refinery + learning_rate < 2417:
-    #         new_refinery_1 = refinery + learning_rate
-    #     else: 
-    #         new_refinery_1 = refinery - 2 * learning_rate
-
-    #     # Calculate cost of refinery 1
-    #     new_refineries = set(refinery_cost.keys())
-    #     new_refineries.remove(refinery)
-    #     new_refineries.add(new_refinery_1)
-    #     new_refinery_cost = fill_refineries(new_refineries, depots)
-    #     total_cost_1 = sum(new_refinery_cost.values())
-        
-    #     if refinery - learning_rate > 0:
-    #         new_refinery_2 = refinery - learning_rate
-    #     else: 
-    #         new_refinery_2 = refinery + 2 * learning_rate
-
-
-    #     # Calculate cost of refinery 2
-    #     new_refineries = set(refinery_cost.keys())
-    #     new_refineries.remove(refinery)
-    #     new_refineries.add(new_refinery_2)
-    #     new_refinery_cost = fill_refineries(new_refineries, depots)
-    #     total_cost_2 = sum(new_refinery_cost.values())
-
-    #     if total_cost < total_cost_1 and total_cost < total_cost_2:
-    #         next_generation_of_refineries.add(refinery)
-    #     elif total_cost_1 < total_cost_2 and total_cost_1 < total_cost:
-    #         next_generation_of_refineries.add(new_refinery_1)
-    #     elif total_cost_2 < total_cost_1 and total_cost_2 < total_cost:
-    #         next_generation_of_refineries.add(new_refinery_2)
-    #     else:
-    #         print("I'm confused")
-    #         next_generation_of_refineries.add(random.randint(0, 2417))
-    return next_generation_of_refineries
-
-def perform_mutation(refineries: list[int], mutation_rate: float, refineries_cost: int):
-    # depots = [388, 504, 811, 1485, 2286, 1101, 1360, 1938, 1907, 1086, 94, 985, 1981, 1694, 1469]
-    # depots = [341, 752, 810, 1016, 1045, 1161, 1224, 1330, 1358, 1403, 1595, 1691, 1719, 1751, 2031]
-    depots = [388, 504, 811, 1485, 2286, 1101, 1360, 1938, 1907, 1086, 94, 985, 1981, 1694, 1469]
+        best_move = None
+        for neighbour in site_neighbours[refineries[i]]:
+            if neighbour in refineries:
+                continue
+            new_total_cost = fill_state.evaluate_swap(refineries[i], neighbour)
+            if new_total_cost < total_cost:
+                best_move = int(neighbour)
+                total_cost = new_total_cost
+        if best_move is not None:
+            fill_state = fill_state.swap(refineries[i], best_move)
+            refineries[i] = best_move
+    return refineries
+
+def perform_mutation(refineries: list[int], mutation_rate: float, refineries_cost: int, depots: list[int], fitness: str = FITNESS,
+                     cache: FitnessCache = None):
     children = refineries.copy()
     child_length = len(children) 
     if random.random() < mutation_rate:
         index = random.randint(0, child_length - 1)
         while True:
-            new_child = random.randint(0, 2417)
+            new_child = random.randint(0, DATA.number_of_sites - 1)
             if new_child not in children:
                 children[index] = new_child  # Replace with a random integer
                 break
-    chlidren_cost = sum(fill_refineries(children, depots).values())
+    chlidren_cost = sum(fill_refineries(children, depots, fitness, cache).values())
     if refineries_cost > chlidren_cost:
         return children
     else:
         return refineries
 
-def main():
-    # depots = [388, 504, 811, 1485, 2286, 1101, 1360, 1938, 1907, 1086, 94, 985, 1981, 1694, 1469]
-    # depots = [341, 752, 810, 1016, 1045, 1161, 1224, 1330, 1358, 1403, 1595, 1691, 1719, 1751, 2031]
-    depots = [388, 504, 811, 1485, 2286, 1101, 1360, 1938, 1907, 1086, 94, 985, 1981, 1694, 1469]
-    random_refineries = list(generate_inital_locations(sets=1, locations=3)[0]) # Generate random refineries
-    # random_refineries = [106, 2161, 1541]
-    # random_refineries = [1324, 218, 352]
-    learning_rate = 1
-    print("Initial Refineries and Cost of each refinery:", fill_refineries(random_refineries.copy(), depots))
-    refineries = random_refineries
-    iterations = int(input("How many iterations: ")) 
-    for _ in tqdm(range(iterations), desc="Refinery gradient descent:"):
-        refinery_cost = fill_refineries(refineries, depots)
-        refineries = generate_next_generation(learning_rate, depots, refinery_cost)
-        if _ < iterations - 1:
+def main(iterations: int = None, time_budget: float = None, seed: int = None, checkpoint: str = None,
+         checkpoint_every: float = CHECKPOINT_INTERVAL, resume: bool = False, neighbour_radius: int = NEIGHBOUR_RADIUS,
+         fitness: str = FITNESS, candidates: int = CANDIDATE_SITES, depots: str = None):
+    """
+    Runs the refinery gradient descent. Without an iteration count, time budget or checkpoint to resume
+    from the number of iterations is asked for, see checkpoint.py for the command line options.
+    The descent starts from the best set over the candidate sites, see refinery_search.py, or from
+    random refineries when candidates is 0. The refineries serve the depots of the depots json file,
+    see load_depots, and a resumed run the depots it was started with.
+    """
+    depots_json = depots
+    site_neighbours = load_site_neighbours(neighbour_radius)
+    fitness_cache = FitnessCache()
+    start_iteration = 0
+    skipped_mutation = None
+    if resume:
+        state = load_checkpoint(checkpoint)
+        check_fitness(state, fitness)
+        refineries = state['refineries']
+        depots = state['depots']
+        start_iteration = state['iteration']
+        best_cost, best_refineries = state['best']
+        restore_random_state(state['random_state'])
+        iterations = iterations if iterations is not None else state['iterations']
+        skipped_mutation = state.get('skipped_mutation')
+        print("Resuming from iteration", start_iteration, "with lowest cost:", best_cost)
+    else:
+        random.seed(seed)
+        depots = load_depots(depots_json)
+        print("Depots:", depots)
+        if candidates:
+            _, random_refineries = search_refineries(depots, depot_pellets(depots), candidates)
+        else:
+            random_refineries = generate_inital_locations(sets=1, locations=DATA.number_of_refineries, rng=np.random.default_rng(seed))[0].tolist() # Generate random refineries
+        # random_refineries = [106, 2161, 1541]
+        # random_refineries = [1324, 218, 352]
+        refinery_cost = fill_refineries(random_refineries.copy(), depots, fitness, fitness_cache)
+        print("Initial Refineries and Cost of each refinery:", refinery_cost)
+        refineries = random_refineries
+        best_cost, best_refineries = sum(refinery_cost.values()), list(refinery_cost.keys())
+        if is_interactive(iterations, time_budget, resume):
+            iterations = int(input("How many iterations: ")) 
+
+    def run_state():
+        return {
+            'refineries': refineries,
+            'depots': depots,
+            'iteration': completed_iterations,
+            'iterations': iterations,
+            'best': (best_cost, best_refineries),
+            'random_state': random_state(),
+            'fitness': fitness,
+            'skipped_mutation': skipped_mutation,
+        }
+
+    checkpoint_timer = CheckpointTimer(checkpoint, checkpoint_every)
+    start_time = time.monotonic()
+    completed_iterations = start_iteration
+    refinery_cost = fill_refineries(refineries, depots, fitness, fitness_cache)
+    steps = range(start_iteration, iterations) if iterations is not None else itertools.count(start_iteration)
+    METRICS.watch_cache('fitness_cache', fitness_cache)
+    if skipped_mutation is not None and (iterations is None or start_iteration < iterations):
+        # the run that saved the checkpoint skipped the mutation of its last planned iteration, make it now
+        # so a run extended past that iteration draws the same numbers as one that never stopped
+        with METRICS.timer('mutation'):
+            refineries = perform_mutation(refineries, 1/len(refineries), skipped_mutation, depots, fitness, fitness_cache)
+        skipped_mutation = None
+    for _ in tqdm(steps, desc="Refinery gradient descent:", initial=start_iteration, total=iterations):
+        with METRICS.timer('evaluation'):
+            refinery_cost = fill_refineries(refineries, depots, fitness, fitness_cache)
+        if sum(refinery_cost.values()) < best_cost:
+            best_cost, best_refineries = sum(refinery_cost.values()), list(refinery_cost.keys())
+        with METRICS.timer('descent'):
+            refineries = generate_next_generation(site_neighbours, depots, refinery_cost, fitness)
+        if iterations is None or _ < iterations - 1:
             mutation_rate = 1/len(refineries)
-            refineries = perform_mutation(refineries, mutation_rate, sum(refinery_cost.values()))
+            with METRICS.timer('mutation'):
+                refineries = perform_mutation(refineries, mutation_rate, sum(refinery_cost.values()), depots, fitness, fitness_cache)
+        else:
+            skipped_mutation = sum(refinery_cost.values())
         print(refineries)
+        completed_iterations = _ + 1
+        emit("iteration", iteration=completed_iterations, best_cost=best_cost, cost=sum(refinery_cost.values()))
+        if out_of_time(start_time, time_budget):
+            break
+        checkpoint_timer.maybe_save(run_state)
+    checkpoint_timer.maybe_save(run_state, force=True)
     print("Final Refineries and Cost of each refinery:", refinery_cost, "  Total:", sum(refinery_cost.values()))
+    print("Lowest cost found:", best_cost, best_refineries)
+    print("Fitness cache:", fitness_cache.report())
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Gradient descent on the refinery locations")
+    parser.add_argument('--neighbour-radius', type=int, default=NEIGHBOUR_RADIUS, help="grid cells a site can move in one step")
+    parser.add_argument('--fitness', choices=FITNESS_MODES, default=FITNESS, help=FITNESS_HELP)
+    parser.add_argument('--depots', help="json file with the \"depots\" to place the refineries for, e.g. the --best file of annealing_depots.py, "
+                        "greedy depots of the forecast when not given")
+    parser.add_argument('--candidates', type=int, default=CANDIDATE_SITES, help="sites the starting refineries are searched over, 0 starts from random ones")
+    add_run_arguments(parser)
+    add_instrumentation_arguments(parser)
+    return check_run_arguments(parser, parser.parse_args(argv))
 
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'gradient_descent_refineries')
 '''
 {2403: 30481400.0, 1637: 9677564.0, 1421: 26258032.0}
 {1537: 12123123.0, 2203: 14049849.0, 1421: 14712261.5}
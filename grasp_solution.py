@@ -0,0 +1,186 @@
+'''
+GRASP multi-start of the greedy construction, over a process pool.
+
+greedy_solution.py builds one solution, always the same. Here every construction picks each
+depot and refinery at random among the RCL_SIZE cheapest candidates of the greedy round, see
+select_facilities, and is then improved by moving each facility to the neighbouring site that
+lowers the total cost the most, for at most IMPROVEMENT_PASSES passes. Moves are scored with a
+FillState, so a construction costs a few greedy fills. Hundreds of constructions run side by
+side on every core and the KEEP cheapest distinct solutions are kept:
+
+    python grasp_solution.py --constructions 500
+    python grasp_solution.py --constructions 2000 --rcl-size 3 --workers 8 --submission
+
+Construction i draws from the i-th child of the seed, so a seeded run finds the same solutions
+whatever the number of workers. The best solutions are written to BEST_JSON, and with
+--submission the cheapest one is written as the submission.
+'''
+import argparse
+import json
+import multiprocessing
+import os
+import numpy as np
+from tqdm import tqdm
+from data_context import DATA
+from greedy_solution import (DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE,
+                             depot_fill_state, refinery_fill_state, forecast_to_array, fill_depot_flows, fill_refinery_flows, select_facilities)
+from generate_submission import generate_submission
+from spatial import NEIGHBOUR_RADIUS, load_site_neighbours
+from instrumentation import METRICS, add_instrumentation_arguments, emit, run_instrumented
+from solution import predict_biomass
+
+CONSTRUCTIONS = 300
+RCL_SIZE = 5 # cheapest candidates a greedy round picks from
+IMPROVEMENT_PASSES = 2 # passes of the local improvement after each construction
+KEEP = 5 # cheapest distinct solutions kept
+WORKERS = os.cpu_count() # 1 runs the constructions in this process
+SEED = None # seed of the constructions, None draws a fresh one each run
+BEST_JSON = 'grasp_best.json'
+
+def improve(state, site_neighbours: list[np.ndarray], passes: int = IMPROVEMENT_PASSES):
+    """
+    Moves each facility in turn to the neighbouring site that lowers the total cost the most,
+    like gradient_descent_depots.generate_next_generation, until a pass finds no move or after
+    the given number of passes.
+
+    Args:
+        state: FillState of the facilities, see depot_fill_state and refinery_fill_state
+        site_neighbours: Geographic neighbours of every site, see spatial.load_site_neighbours
+
+    Returns:
+        FillState of the improved facilities
+    """
+    total_cost = state.total_cost()
+    for _ in range(passes):
+        improved = False
+        for facility in list(state.facilities):
+            best_move = None
+            for neighbour in site_neighbours[facility]:
+                if neighbour in state.position:
+                    continue
+                new_total_cost = state.evaluate_swap(facility, neighbour)
+                if new_total_cost < total_cost:
+                    best_move = int(neighbour)
+                    total_cost = new_total_cost
+            if best_move is not None:
+                state = state.swap(facility, best_move)
+                improved = True
+        if not improved:
+            break
+    return state
+
+def construct(seed: np.random.SeedSequence, biomass: np.ndarray, site_neighbours: list[np.ndarray],
+              rcl_size: int = RCL_SIZE, passes: int = IMPROVEMENT_PASSES):
+    """
+    One randomised greedy construction of the depots and then the refineries, each improved
+    before the next is placed.
+
+    Args:
+        seed: Seed of the construction's generator
+        biomass: Forecasted biomass at each index, left unchanged
+
+    Returns:
+        (cost, depots, refineries): Transport cost of both fills and the sorted facilities
+    """
+    rng = np.random.default_rng(seed)
+    with METRICS.timer('selection'):
+        depots, _ = select_facilities(biomass.copy(), DATA.number_of_depots, DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE,
+                                      rcl_size=rcl_size, rng=rng)
+    with METRICS.timer('descent'):
+        depot_state = improve(depot_fill_state(depots, biomass), site_neighbours, passes)
+    pellets = np.zeros(len(biomass))
+    pellets[depot_state.facilities] = DEPOT_PROCESSING_CAPACITY
+    with METRICS.timer('selection'):
+        refineries, _ = select_facilities(pellets.copy(), DATA.number_of_refineries, REFINERY_PROCESSING_CAPACITY,
+                                          sources=depot_state.facilities, rcl_size=rcl_size, rng=rng)
+    with METRICS.timer('descent'):
+        refinery_state = improve(refinery_fill_state(refineries, pellets), site_neighbours, passes)
+    return depot_state.total_cost() + refinery_state.total_cost(), depot_state.facilities, refinery_state.facilities
+
+_worker_settings = None
+
+def init_worker(biomass: np.ndarray, site_neighbours: list[np.ndarray], rcl_size: int, passes: int):
+    """
+    Runs once in each pool worker, so the forecast and neighbours are handed over once per worker instead of once per task
+    """
+    global _worker_settings
+    _worker_settings = (biomass, site_neighbours, rcl_size, passes)
+
+def construct_in_worker(seed: np.random.SeedSequence):
+    biomass, site_neighbours, rcl_size, passes = _worker_settings
+    return construct(seed, biomass, site_neighbours, rcl_size, passes)
+
+def keep_best(best: list[tuple], solution: tuple, keep: int = KEEP) -> list[tuple]:
+    """
+    Adds a (cost, depots, refineries) solution to the best ones unless the same facilities are
+    already there, and returns the keep cheapest
+    """
+    if any(solution[1:] == kept[1:] for kept in best):
+        return best
+    return sorted(best + [solution], key=lambda kept: kept[0])[:keep]
+
+def write_best(best: list[tuple], path: str):
+    """
+    Writes the best solutions as json, through a temporary file so a crashed run never leaves half a file
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w') as temp_file:
+        json.dump([{"cost": cost, "depots": depots, "refineries": refineries} for cost, depots, refineries in best], temp_file, indent=2)
+    os.replace(temp_path, path)
+
+def main(constructions: int = CONSTRUCTIONS, rcl_size: int = RCL_SIZE, passes: int = IMPROVEMENT_PASSES, keep: int = KEEP,
+         workers: int = WORKERS, seed: int = SEED, neighbour_radius: int = NEIGHBOUR_RADIUS, output: str = BEST_JSON,
+         submission: bool = False):
+    """
+    Runs the constructions and returns the keep cheapest distinct solutions as (cost, depots, refineries), cheapest first
+    """
+    biomass_forecast = predict_biomass().iloc[:, [0, 11]]
+    biomass = forecast_to_array(biomass_forecast)
+    site_neighbours = load_site_neighbours(neighbour_radius)
+    seeds = np.random.SeedSequence(seed).spawn(constructions)
+    settings = (biomass, site_neighbours, rcl_size, passes)
+    if workers > 1:
+        pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=settings)
+        solutions = pool.imap_unordered(construct_in_worker, seeds, chunksize=max(1, constructions // (workers * 8)))
+    else:
+        pool = None
+        init_worker(*settings)
+        solutions = map(construct_in_worker, seeds)
+
+    best = []
+    for i, solution in enumerate(tqdm(solutions, desc="Constructions", total=constructions)):
+        METRICS.count('constructions')
+        best = keep_best(best, (float(solution[0]), [int(depot) for depot in solution[1]], [int(refinery) for refinery in solution[2]]), keep)
+        emit("construction", iteration=i + 1, cost=float(solution[0]), best_cost=best[0][0])
+    if pool is not None:
+        pool.close()
+        pool.join()
+
+    write_best(best, output)
+    for cost, depots, refineries in best:
+        print("Cost:", cost, "  Depots:", depots, "  Refineries:", refineries)
+    print("==> Best solutions written to", output)
+    if submission:
+        _, depots, refineries = best[0]
+        pellets = np.zeros(len(biomass))
+        pellets[depots] = DEPOT_PROCESSING_CAPACITY
+        generate_submission(depots, refineries, fill_depot_flows(depots, biomass.copy()), fill_refinery_flows(refineries, pellets),
+                            biomass_forecast)
+    return best
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Randomised greedy constructions of the depots and refineries, improved locally, over a process pool")
+    parser.add_argument('--constructions', type=int, default=CONSTRUCTIONS, help="number of randomised greedy constructions")
+    parser.add_argument('--rcl-size', type=int, default=RCL_SIZE, help="cheapest candidates each greedy round picks from, 1 is the plain greedy")
+    parser.add_argument('--passes', type=int, default=IMPROVEMENT_PASSES, help="passes of the local improvement after each construction")
+    parser.add_argument('--keep', type=int, default=KEEP, help="number of cheapest distinct solutions kept")
+    parser.add_argument('--workers', type=int, default=WORKERS, help="processes running the constructions")
+    parser.add_argument('--seed', type=int, default=SEED, help="seed of the constructions")
+    parser.add_argument('--neighbour-radius', type=int, default=NEIGHBOUR_RADIUS, help="grid cells a facility can move in the improvement")
+    parser.add_argument('--output', default=BEST_JSON, help="json file the best solutions are written to")
+    parser.add_argument('--submission', action='store_true', help="write the cheapest solution as the submission")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'grasp_solution')
@@ -1,42 +1,89 @@
+import argparse
 from solution import predict_biomass
-from cost_helpers import calculate_cost_of_single_trip
+from cost_helpers import calculate_cost_of_flows
 from generate_submission import update_biomass_demand_supply, update_pellet_demand_supply, generate_submission
-from tqdm import tqdm
+from data_context import DATA, lazy_inputs
+from fill_kernel import fill_facility, fill_facilities
+from fill_state import FillState
+from distance_provider import as_distances
+from instrumentation import METRICS, add_instrumentation_arguments, run_instrumented
+import numpy as np
 import pandas as pd
-import seaborn as sns
-from matplotlib import pyplot as plt
 
-DISTANCE_MATRIX = pd.read_csv('Distance_Matrix.csv')
-SAMPLE_SUBMISSION = pd.read_csv("sample_submission.csv")
-NUMBER_OF_DEPOTS = 15
-NUMBER_OF_REFINERIES = 3
+__getattr__ = lazy_inputs(__name__, {'DISTANCE_MATRIX': 'distance_matrix', 'NEIGHBOUR_ORDER': 'neighbour_order', 'SAMPLE_SUBMISSION': 'sample_submission'})
 DEPOT_PROCESSING_CAPACITY = 20000 * 0.95
 REFINERY_PROCESSING_CAPACITY = 100000 * 0.95
+BIOMASS_COLLECTION_RATE = 0.95 # share of a site's biomass that reaches the depot
 
 
-def generate_cost_depots(dist_mat: pd.DataFrame, biomass_forecast: pd.DataFrame, refineries: list):
+def generate_cost_depots(dist_mat, biomass_forecast: pd.DataFrame, refineries: list, candidates: np.ndarray):
     """
     Calculates the cost of transporting all biomass to a single depot. 
 
     Args:
+        dist_mat: distance between each biomass location, a matrix indexed as [source, destination] or a distance provider
         biomass_forecast: Forecasted biomass at each index which will be updated after each iteration
+        candidates: indexes that can still be chosen
 
     Returns:
         index of biomass with the least cost (int)
     """
-    cost_list = []
-    for i in range(len(dist_mat.columns)-1):
-        curr_index = dist_mat.iloc[:,i+1]
-        curr_index_transport_cost = (curr_index.mul(biomass_forecast.iloc[:,1])).sum()
-        cost_list.append([dist_mat.columns.values[i+1],curr_index_transport_cost])
-        cost_list.sort(key = lambda x: x[1])
+    sources = biomass_forecast.index.to_numpy()
+    transport_cost = as_distances(dist_mat).weighted_sum(biomass_forecast['2018/2019'].to_numpy(), sources)
+    cost_list = candidates[np.argsort(transport_cost[candidates], kind='stable')]
 
-    for i in range(2417):
-        if cost_list[i][0] not in refineries: # check for duplicates
-            return(int(cost_list[i][0]))
+    for index in cost_list:
+        if index not in refineries: # check for duplicates
+            return int(index)
 
 
-def update_biomass_depot(new_depot: int, biomass_forecast: pd.DataFrame, dist_mat: pd.DataFrame, biomass_demand_supply: pd.DataFrame):
+def forecast_to_array(forecast: pd.DataFrame):
+    """
+    Copies the 2018/2019 column of a forecast into an array over all indexes, indexes missing from the forecast hold 0
+    """
+    supply = np.zeros(DATA.number_of_sites)
+    supply[forecast.index.to_numpy()] = forecast['2018/2019'].to_numpy()
+    return supply
+
+def fill_depot_flows(depots: list, biomass: np.ndarray):
+    """
+    Fills each depot in turn from its nearest biomass.
+
+    Args:
+        depots: Index of each depot, in fill order
+        biomass: Forecasted biomass at each index, updated in place
+
+    Returns:
+        sources, destinations, values: Biomass flows as parallel arrays
+    """
+    return fill_facilities(depots, biomass, DEPOT_PROCESSING_CAPACITY, DATA.neighbour_order, BIOMASS_COLLECTION_RATE)
+
+def fill_refinery_flows(refineries: list, pellets: np.ndarray):
+    """
+    Fills each refinery in turn from its nearest depots.
+
+    Args:
+        refineries: Index of each refinery, in fill order
+        pellets: Pellets waiting at each index, updated in place
+
+    Returns:
+        sources, destinations, values: Pellet flows as parallel arrays
+    """
+    return fill_facilities(refineries, pellets, REFINERY_PROCESSING_CAPACITY, DATA.neighbour_order)
+
+def depot_fill_state(depots: list, biomass: np.ndarray):
+    """
+    Fill state of a set of depots for evaluating single depot swaps, see fill_state.FillState
+    """
+    return FillState(depots, biomass, DEPOT_PROCESSING_CAPACITY, DATA.neighbour_order, BIOMASS_COLLECTION_RATE)
+
+def refinery_fill_state(refineries: list, pellets: np.ndarray):
+    """
+    Fill state of a set of refineries for evaluating single refinery swaps, see fill_state.FillState
+    """
+    return FillState(refineries, pellets, REFINERY_PROCESSING_CAPACITY, DATA.neighbour_order)
+
+def update_biomass_depot(new_depot: int, biomass_forecast: pd.DataFrame, neighbour_order: np.ndarray, biomass_demand_supply: pd.DataFrame):
     """
     Calculates the cost of transportation of biomass to current depot. Updates the biomass at respective
     depots after movement
@@ -44,38 +91,19 @@ def update_biomass_depot(new_depot: int, biomass_forecast: pd.DataFrame, dist_ma
     Args:
         new_depot: Index of depot
         biomass_forecast: Forecasted biomass at each index before update
-        dist_mat: distance between each biomass location
+        neighbour_order: sources of each index sorted by distance, see distance_matrix.load_neighbour_order
 
     Returns:
         cost_of_transportation: total amount of biomass * distance
         updated_biomass_forecast: Changes in biomass forecast due to biomass movement
 
     """
-    cost = 0
-    biomass_in_depot = 0
-    shortest_dist_matrix = dist_mat.sort_values(by=str(new_depot), ascending=True)
-    shortest_dist_col = shortest_dist_matrix.loc[:, str(new_depot)]
-    # This is an attempt to weight the biomass. 
-    # However, i think no difference is made lol
-    # dist_matrix_from_depot = dist_mat[str(new_depot)]
-    # forecast = biomass_forecast["2018/2019"]
-    # shortest_dist_col = dist_matrix_from_depot * forecast
-    # shortest_dist_col = shortest_dist_col.sort_values()
-    for index, value in shortest_dist_col.items():
-        
-        if biomass_in_depot >= DEPOT_PROCESSING_CAPACITY:
-            break
-        if biomass_in_depot + biomass_forecast.loc[index,'2018/2019'] * 0.95 > DEPOT_PROCESSING_CAPACITY:
-            update_biomass_demand_supply(new_depot, index, DEPOT_PROCESSING_CAPACITY - biomass_in_depot, biomass_demand_supply)
-            biomass_moved = DEPOT_PROCESSING_CAPACITY - biomass_in_depot
-            biomass_forecast.loc[index,'2018/2019'] -= biomass_moved
-            biomass_in_depot = DEPOT_PROCESSING_CAPACITY
-        else: 
-            update_biomass_demand_supply(new_depot, index, biomass_forecast.loc[index,'2018/2019'] * 0.95, biomass_demand_supply)
-            biomass_moved = biomass_forecast.loc[index,'2018/2019'] * 0.95
-            biomass_in_depot += biomass_moved
-            biomass_forecast.loc[index,'2018/2019'] = 0
-        cost += calculate_cost_of_single_trip(index, new_depot, biomass_moved)
+    supply = forecast_to_array(biomass_forecast)
+    sources, values = fill_facility(neighbour_order[new_depot], supply, DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE)
+    biomass_forecast['2018/2019'] = supply[biomass_forecast.index.to_numpy()]
+    for index, biomass_moved in zip(sources, values):
+        update_biomass_demand_supply(new_depot, int(index), biomass_moved, biomass_demand_supply)
+    cost = calculate_cost_of_flows(sources, new_depot, values)
     return cost, pd.DataFrame(biomass_forecast)
 
 def remove_empty_biomass(biomass_forecast: pd.DataFrame):
@@ -90,40 +118,25 @@ def remove_empty_biomass(biomass_forecast: pd.DataFrame):
         biomass_indices_removed: List of empty biomass locations
         updated_biomass_forecast: Empty locations removed, ready for next iteration
     """
-    removed_indices = []
-    for index in biomass_forecast.index:
-        if biomass_forecast.loc[index,'2018/2019'] == 0:
-            biomass_forecast.drop(index,inplace=True)
-            removed_indices.append(index)
-    return removed_indices, pd.DataFrame(biomass_forecast)
+    is_empty = (biomass_forecast['2018/2019'] == 0).to_numpy()
+    removed_indices = list(biomass_forecast.index[is_empty])
+    return removed_indices, pd.DataFrame(biomass_forecast[~is_empty])
 
-def remove_empty_dist(index_to_remove: list, dist_mat: pd.DataFrame):
+def remove_empty_dist(index_to_remove: list, candidates: np.ndarray):
     """
-    Removes all biomass locations with no biomass left in distance matrix, so
+    Removes all biomass locations with no biomass left from the candidate locations, so
     they wont be considered in choosing the next depot
 
     Args:
         index_to_remove: list of empty biomass locations 
-        dist_mat: initial distance matrix of locations
+        candidates: indexes that can still be chosen
         
     Returns:
-        updated_dist_mat: Distance matrix with columns and rows of empty biomass locations removed
-    """
-    for index in index_to_remove:
-        dist_mat.drop(columns=[str(index)], inplace=True)
-        dist_mat.drop(index,inplace=True)
-    return dist_mat
-
-def generate_depot_matrix(depots: list):
-    new_dist_mat = []
-    for index in range(len(DISTANCE_MATRIX.columns)-1):
-        if index not in depots:
-            continue
-        else:
-            new_dist_mat.append(DISTANCE_MATRIX.loc[int(index)])
-    return pd.DataFrame(new_dist_mat)
+        updated_candidates: Candidates with the empty biomass locations removed
+    """
+    return np.setdiff1d(candidates, index_to_remove)
 
-def update_biomass_refinery(new_refinery: int, depot_forecast: pd.DataFrame, dist_mat_2: pd.DataFrame, pellet_demand_supply: pd.DataFrame):
+def update_biomass_refinery(new_refinery: int, depot_forecast: pd.DataFrame, neighbour_order: np.ndarray, pellet_demand_supply: pd.DataFrame):
     """
     Calculates the cost of transportation of biomass to current depot. Updates the biomass at respective
     depots after movement
@@ -131,89 +144,135 @@ def update_biomass_refinery(new_refinery: int, depot_forecast: pd.DataFrame, dis
     Args:
         new_refinery: Index of depot
         biomass_forecast: Forecasted biomass at each index before update
-        dist_mat: distance between each biomass location
+        neighbour_order: sources of each index sorted by distance, see distance_matrix.load_neighbour_order
 
     Returns:
         cost_of_transportation: total amount of biomass * distance
         updated_biomass_forecast: Changes in biomass forecast due to biomass movement
 
     """
-    cost = 0
-    biomass_in_refinery = 0
-    shortest_dist_matrix = dist_mat_2.sort_values(by=str(new_refinery), ascending=True)
-    shortest_dist_col = shortest_dist_matrix.loc[:, str(new_refinery)]
-    for index, value in shortest_dist_col.items():
-        if biomass_in_refinery >= REFINERY_PROCESSING_CAPACITY:
-            break
-        if biomass_in_refinery + depot_forecast.loc[index,'2018/2019'] > REFINERY_PROCESSING_CAPACITY:
-            update_pellet_demand_supply(new_refinery, index, (REFINERY_PROCESSING_CAPACITY - biomass_in_refinery), pellet_demand_supply)
-            biomass_moved = REFINERY_PROCESSING_CAPACITY - biomass_in_refinery
-            depot_forecast.loc[index,'2018/2019'] -= biomass_moved
-            biomass_in_refinery = REFINERY_PROCESSING_CAPACITY
-        else: 
-            update_pellet_demand_supply(new_refinery, index, depot_forecast.loc[index,'2018/2019'], pellet_demand_supply)
-            biomass_moved = depot_forecast.loc[index,'2018/2019']
-            biomass_in_refinery += depot_forecast.loc[index,'2018/2019']
-            depot_forecast.loc[index,'2018/2019'] = 0
-        cost += calculate_cost_of_single_trip(index, new_refinery, biomass_moved)
-
+    supply = forecast_to_array(depot_forecast)
+    sources, values = fill_facility(neighbour_order[new_refinery], supply, REFINERY_PROCESSING_CAPACITY)
+    depot_forecast['2018/2019'] = supply[depot_forecast.index.to_numpy()]
+    for index, biomass_moved in zip(sources, values):
+        update_pellet_demand_supply(new_refinery, int(index), biomass_moved, pellet_demand_supply)
+    cost = calculate_cost_of_flows(sources, new_refinery, values)
     return cost, pd.DataFrame(depot_forecast)
 
 
+def select_facilities(supply: np.ndarray, count: int, capacity: float, ratio: float = 1.0, sources: list = None,
+                      rcl_size: int = 1, rng: np.random.Generator = None):
+    """
+    Greedily chooses facilities one at a time. Each round picks the candidate that is cheapest to
+    move all remaining supply to, and fills it from its nearest sources. With rcl_size above 1 the
+    round picks uniformly among the rcl_size cheapest candidates instead, the randomised greedy
+    construction of grasp_solution.py.
+
+    The cost of every candidate is one supply x distance product, computed once. After each fill
+    only the supply that moved is subtracted from it. Chosen sites and sources that have been
+    emptied are masked out of the candidates instead of being dropped. Once every source is empty
+    the remaining facilities go to any site not chosen yet.
+
+    Args:
+        supply: Amount available at each index, updated in place
+        count: Number of facilities to choose
+        capacity: Amount each facility takes before it is full
+        ratio: Share of a source's supply that arrives at the facility
+        sources: Indexes holding supply, every index when None. Sources that are emptied stop being candidates
+        rcl_size: Number of cheapest candidates a round picks from
+        rng: numpy generator drawing the picks, a fresh one when None
+
+    Returns:
+        facilities: Chosen indexes in the order they were chosen
+        flows: (sources, destinations, values) arrays of everything moved
+    """
+    is_source = np.ones(len(supply), dtype=bool)
+    if sources is not None:
+        is_source[:] = False
+        is_source[sources] = True
+    is_candidate = np.ones(len(supply), dtype=bool)
+    transport_cost = DATA.distances.weighted_sum(supply)
+    if rcl_size > 1 and rng is None:
+        rng = np.random.default_rng()
+    facilities = []
+    flows = []
+    for _ in range(count):
+        if not is_candidate.any():
+            # every source is empty, the remaining facilities only have to be distinct
+            is_candidate[:] = True
+            is_candidate[facilities] = False
+        candidate_cost = np.where(is_candidate, transport_cost, np.inf)
+        if rcl_size > 1:
+            restricted = np.argpartition(candidate_cost, min(rcl_size, len(supply)) - 1)[:rcl_size]
+            restricted = restricted[np.isfinite(candidate_cost[restricted])]
+            facility = int(rng.choice(restricted))
+        else:
+            facility = int(np.argmin(candidate_cost))
+        facilities.append(facility)
+        is_candidate[facility] = False
+
+        previous_supply = supply.copy()
+        facility_sources, facility_values = fill_facility(DATA.neighbour_order[facility], supply, capacity, ratio)
+        flows.append((facility_sources, np.full(len(facility_sources), facility), facility_values))
+
+        moved = previous_supply[facility_sources] - supply[facility_sources]
+        transport_cost -= DATA.distances.weighted_sum(moved, facility_sources)
+        is_candidate &= ~(is_source & (supply == 0))
+    return facilities, tuple(np.concatenate(flow) for flow in zip(*flows))
+
+def flows_to_demand_supply(sources: np.ndarray, destinations: np.ndarray, values: np.ndarray, update_demand_supply=update_biomass_demand_supply):
+    """
+    Converts flow arrays into the {destination: {source: value}} dicts used by generate_submission
+    """
+    demand_supply = {}
+    for source, destination, value in zip(sources, destinations, values):
+        update_demand_supply(int(destination), int(source), value, demand_supply)
+    return demand_supply
+
+def plot_heatmap(sites: pd.DataFrame, column: str):
+    """
+    Shows a column of sites on the latitude/longitude grid. Plotting is optional, seaborn and
+    matplotlib are only imported here.
+    """
+    import seaborn as sns
+    from matplotlib import pyplot as plt
+    sns.heatmap(sites.pivot(index="Latitude", columns="Longitude", values=column))
+    plt.show()
+
 def main():
     #Choosing the depot locations
     biomass_forecast = predict_biomass().iloc[:,[0,11]]
-    dist_mat = DISTANCE_MATRIX.copy()
-    total_cost = 0
-    depots = []
-    
-    biomass_demand_supply = {}
-    for i in tqdm(range(NUMBER_OF_DEPOTS), desc = "Iterating through depots"):
-        generated_depot = generate_cost_depots(dist_mat, biomass_forecast, [])
-        # print("The next depot is " + str(generated_depot))
-        depots.append(generated_depot)
-
-        move_to_depot_cost, updated_biomass_forecast = update_biomass_depot(generated_depot,biomass_forecast,dist_mat, biomass_demand_supply)
-        #updated_biomass_forecast.to_csv("after_prev_iteration.csv")
-        total_cost += move_to_depot_cost
-
-        index_to_remove, biomass_forecast = remove_empty_biomass(updated_biomass_forecast)
-        #biomass_forecast.to_csv('after_remove_empty_biomass.csv')
-        dist_mat = remove_empty_dist(index_to_remove, dist_mat)
-        #dist_mat.to_csv('after_remove_empty_dist.csv')
+    biomass = forecast_to_array(biomass_forecast)
+    with METRICS.timer('selection'):
+        depots, biomass_flows = select_facilities(biomass, DATA.number_of_depots, DEPOT_PROCESSING_CAPACITY, BIOMASS_COLLECTION_RATE)
+    total_cost = calculate_cost_of_flows(*biomass_flows)
     print("The total transportation cost (harvest to depot) is " + str(total_cost))
     depots = sorted(depots)
     print(depots)
     #Choosing the refinaries
-    pellet_demand_supply = {}
-    depot_forecast = pd.DataFrame({'Index': depots, '2018/2019':[DEPOT_PROCESSING_CAPACITY,]*NUMBER_OF_DEPOTS}, index = depots)
-    dist_mat_2 = generate_depot_matrix(depots)
-    refineries = []
-    for i in tqdm(range(NUMBER_OF_REFINERIES), desc = "Iterating through refineries"):
-        generated_refinery = generate_cost_depots(dist_mat_2, depot_forecast, refineries)
-        refineries.append(generated_refinery)
-
-        move_to_refinery_cost , updated_depot_forecast = update_biomass_refinery(generated_refinery,depot_forecast,dist_mat_2,pellet_demand_supply)
-        total_cost += move_to_refinery_cost
-
-        index_to_remove, depot_forecast = remove_empty_biomass(updated_depot_forecast)
-        #biomass_forecast.to_csv('after_remove_empty_biomass.csv')
-        dist_mat_2 = remove_empty_dist(index_to_remove, dist_mat_2)
-        #dist_mat.to_csv('after_remove_empty_dist.csv')
+    pellets = np.zeros(len(biomass))
+    pellets[depots] = DEPOT_PROCESSING_CAPACITY
+    with METRICS.timer('selection'):
+        refineries, pellet_flows = select_facilities(pellets, DATA.number_of_refineries, REFINERY_PROCESSING_CAPACITY, sources=depots)
+    total_cost += calculate_cost_of_flows(*pellet_flows)
     print("The total transportation cost (depots to refineries) is " + str(total_cost))
     # print(refineries)
-    
-    generate_submission(depots, refineries, biomass_demand_supply, pellet_demand_supply)
+
+    generate_submission(depots, refineries, biomass_flows, pellet_flows, biomass_forecast)
 
     #Generating heatmap
     """
     initial_forecast = predict_biomass()
     merged_df = pd.merge(initial_forecast, biomass_forecast, on = "Index", how='left')
     merged_df.to_csv("remaining_biomass.csv")
-    sns.heatmap(merged_df.pivot("Latitude", "Longitude", "2018/2019_y"))
-    plt.show()
+    plot_heatmap(merged_df, "2018/2019_y")
     """
 
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Greedy choice of the depots and refineries, written as a submission")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'greedy_solution')
 
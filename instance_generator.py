@@ -0,0 +1,179 @@
+'''
+Synthetic instances of any size, for finding out how the optimisers scale past the bundled grid.
+
+An instance has everything the bundled inputs have: a biomass history with the columns of
+Biomass_History.csv, the coordinates of every site, the distance matrix and the number of depots
+and refineries a solution places. Sites lie on a regular lattice with the spacing of the bundled
+grid, biomass is clustered around a few growing regions and varies from year to year, and road
+distances are great circle distances times a detour factor. The same size and seed always give
+the same instance.
+
+    python instance_generator.py 10000 --output instances/10k
+
+writes Biomass_History.csv, Distance_Matrix.npy and instance.json to instances/10k. The matrix is
+written block by block into a memory-mapped file, so generating 50k sites never holds the
+matrix in memory. With --distances haversine no matrix is written at all, the instance computes
+its distances from the coordinates, see distance_provider.py. An instance is used by pointing
+DATA at it:
+
+    with using_inputs(load_instance('instances/10k')):
+        greedy_solution.main()
+
+generate_instance without a directory builds a small instance in memory instead.
+'''
+import argparse
+import json
+import math
+import os
+import numpy as np
+import pandas as pd
+from data_context import DISTANCE_PROVIDER, DISTANCE_PROVIDERS, NEIGHBOUR_ORDER_K, DataContext
+from distance_provider import ROAD_FACTOR, haversine
+from distance_matrix import DISTANCE_MATRIX_DTYPE, build_neighbour_order
+from cost_helpers import DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY
+from instrumentation import add_instrumentation_arguments, run_instrumented
+from solution import HISTORY_COLUMNS
+
+SEED = 0
+GRID_ORIGIN = (20.15456, 68.62419) # latitude and longitude of the south west corner of the bundled grid
+GRID_SPACING = (0.0806, 0.07962) # degrees between neighbouring sites of the bundled grid
+MEAN_BIOMASS = 141.0 # mean yearly biomass of a site of the bundled grid
+SITES_PER_REGION = 300 # sites per growing region, biomass is clustered around these
+PROCESSED_SHARE = 0.85 # share of the mean yearly biomass the depots of an instance are sized for
+DISTANCE_BLOCK_ROWS = 1024 # rows of the distance matrix computed at once
+BIOMASS_HISTORY_CSV = 'Biomass_History.csv'
+DISTANCE_MATRIX_NPY = 'Distance_Matrix.npy'
+INSTANCE_JSON = 'instance.json'
+
+def haversine_distances(latitude_a: np.ndarray, longitude_a: np.ndarray, latitude_b: np.ndarray, longitude_b: np.ndarray) -> np.ndarray:
+    """
+    Great circle distances in km between every site of a and every site of b, as a (len(a) x len(b)) array
+    """
+    return haversine(latitude_a[:, None], longitude_a[:, None], latitude_b[None, :], longitude_b[None, :])
+
+def grid_coordinates(n_sites: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Latitude and longitude of n_sites sites on a square lattice, filled row by row
+    """
+    columns = math.ceil(math.sqrt(n_sites))
+    row, column = np.divmod(np.arange(n_sites), columns)
+    return GRID_ORIGIN[0] + row * GRID_SPACING[0], GRID_ORIGIN[1] + column * GRID_SPACING[1]
+
+def generate_history(latitude: np.ndarray, longitude: np.ndarray, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Biomass history of the sites, with the columns of Biomass_History.csv. Every site has a level
+    set by its distance to the growing regions, and each year scales it by a regional trend and
+    noise of its own.
+    """
+    n_sites = len(latitude)
+    regions = rng.choice(n_sites, max(1, n_sites // SITES_PER_REGION), replace=False)
+    widths = rng.uniform(20.0, 60.0, len(regions)) # km
+    weights = rng.uniform(0.5, 1.5, len(regions))
+    level = np.zeros(n_sites)
+    for start in range(0, n_sites, DISTANCE_BLOCK_ROWS):
+        stop = start + DISTANCE_BLOCK_ROWS
+        distances = haversine_distances(latitude[start:stop], longitude[start:stop], latitude[regions], longitude[regions])
+        level[start:stop] = np.exp(-(distances / widths) ** 2) @ weights
+    level *= rng.lognormal(0.0, 0.5, n_sites)
+    level *= MEAN_BIOMASS / level.mean()
+
+    history = pd.DataFrame({"Index": np.arange(n_sites), "Latitude": latitude, "Longitude": longitude})
+    trend = rng.normal(0.0, 0.03, len(regions))[np.argmin(haversine_distances(latitude, longitude, latitude[regions], longitude[regions]), axis=1)]
+    for age, year in enumerate(HISTORY_COLUMNS):
+        history[year] = level * (1 + trend * (age - len(HISTORY_COLUMNS) / 2)).clip(0.2) * rng.uniform(0.7, 1.3, n_sites)
+    return history
+
+def fill_distance_matrix(distances: np.ndarray, latitude: np.ndarray, longitude: np.ndarray):
+    """
+    Writes the road distance between every pair of sites into distances, DISTANCE_BLOCK_ROWS rows at a time
+    """
+    for start in range(0, len(latitude), DISTANCE_BLOCK_ROWS):
+        stop = start + DISTANCE_BLOCK_ROWS
+        distances[start:stop] = ROAD_FACTOR * haversine_distances(latitude[start:stop], longitude[start:stop], latitude, longitude)
+
+def facility_counts(history: pd.DataFrame) -> tuple[int, int]:
+    """
+    Depots needed to take PROCESSED_SHARE of the mean yearly biomass, and refineries needed to take
+    the pellets of those depots. 15 and 3 on the bundled grid.
+    """
+    biomass = history[HISTORY_COLUMNS].sum().mean()
+    depots = max(1, math.ceil(PROCESSED_SHARE * biomass / DEPOT_PROCESSING_CAPACITY))
+    return depots, max(1, math.ceil(depots * DEPOT_PROCESSING_CAPACITY / REFINERY_PROCESSING_CAPACITY))
+
+def generate_instance(n_sites: int, seed: int = SEED, number_of_depots: int = None, number_of_refineries: int = None,
+                      directory: str = None, neighbour_order_k: int = NEIGHBOUR_ORDER_K, distance_provider: str = DISTANCE_PROVIDER) -> DataContext:
+    """
+    Generates an instance, see the module docstring.
+
+    Args:
+        n_sites: Number of sites
+        seed: Seed of the numpy generator, the same seed and size give the same instance
+        number_of_depots, number_of_refineries: Facilities a solution places, sized from the biomass when None
+        directory: Where the instance is written, it is only held in memory when None
+        neighbour_order_k: Neighbours kept per site, all of them when None
+        distance_provider: 'dense' builds the distance matrix, 'haversine' leaves the distances to the coordinates
+
+    Returns:
+        DataContext of the instance
+    """
+    rng = np.random.default_rng(seed)
+    latitude, longitude = grid_coordinates(n_sites)
+    history = generate_history(latitude, longitude, rng)
+    depots, refineries = facility_counts(history)
+    number_of_depots = number_of_depots or depots
+    number_of_refineries = number_of_refineries or refineries
+    if directory is None:
+        context = DataContext(None, None, None, neighbour_order_k, number_of_depots, number_of_refineries, distance_provider, ROAD_FACTOR)
+        context.biomass_history = history
+        if distance_provider == 'haversine':
+            return context
+        context.distance_matrix = np.empty((n_sites, n_sites), dtype=DISTANCE_MATRIX_DTYPE)
+        fill_distance_matrix(context.distance_matrix, latitude, longitude)
+        context.neighbour_order = build_neighbour_order(context.distance_matrix, neighbour_order_k)
+        return context
+
+    os.makedirs(directory, exist_ok=True)
+    if distance_provider == 'dense':
+        distances = np.lib.format.open_memmap(os.path.join(directory, DISTANCE_MATRIX_NPY), mode='w+',
+                                              dtype=DISTANCE_MATRIX_DTYPE, shape=(n_sites, n_sites))
+        fill_distance_matrix(distances, latitude, longitude)
+        distances.flush()
+        del distances
+    history.to_csv(os.path.join(directory, BIOMASS_HISTORY_CSV), index=False)
+    with open(os.path.join(directory, INSTANCE_JSON), 'w') as instance_file:
+        json.dump({"n_sites": n_sites, "seed": seed, "number_of_depots": number_of_depots,
+                   "number_of_refineries": number_of_refineries, "distance_provider": distance_provider,
+                   "road_factor": ROAD_FACTOR}, instance_file, indent=2)
+    return load_instance(directory, neighbour_order_k)
+
+def load_instance(directory: str, neighbour_order_k: int = NEIGHBOUR_ORDER_K) -> DataContext:
+    """
+    DataContext of an instance written by generate_instance. Its inputs are loaded on first use
+    like the bundled ones, the neighbour order is built and cached next to the distance matrix.
+    """
+    with open(os.path.join(directory, INSTANCE_JSON)) as instance_file:
+        instance = json.load(instance_file)
+    # The distance matrix is only ever loaded from its binary copy, there is no csv to parse
+    distance_matrix_csv = os.path.join(directory, os.path.splitext(DISTANCE_MATRIX_NPY)[0] + '.csv')
+    return DataContext(distance_matrix_csv, os.path.join(directory, BIOMASS_HISTORY_CSV), None, neighbour_order_k,
+                       instance["number_of_depots"], instance["number_of_refineries"],
+                       instance.get("distance_provider", DISTANCE_PROVIDER), instance["road_factor"])
+
+def main(n_sites: int, output: str, seed: int = SEED, depots: int = None, refineries: int = None, distances: str = DISTANCE_PROVIDER):
+    context = generate_instance(n_sites, seed, depots, refineries, output, distance_provider=distances)
+    print(f"==> {n_sites} sites, {context.number_of_depots} depots and {context.number_of_refineries} refineries written to {output}")
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic instance of any size")
+    parser.add_argument('n_sites', type=int, help="number of sites")
+    parser.add_argument('--output', required=True, help="directory the instance is written to")
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--depots', type=int, help="depots a solution places, sized from the biomass when not given")
+    parser.add_argument('--refineries', type=int, help="refineries a solution places, sized from the depots when not given")
+    parser.add_argument('--distances', choices=DISTANCE_PROVIDERS, default=DISTANCE_PROVIDER,
+                        help="'haversine' writes no distance matrix, distances are computed from the coordinates")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    run_instrumented(main, parse_arguments(), 'instance_generator')
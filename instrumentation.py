@@ -0,0 +1,210 @@
+'''
+Timers, counters and profiling hooks for the optimiser runs.
+
+The hot paths record into METRICS, which costs a clock read per call and is always on:
+
+    with METRICS.timer('crossover'):
+        ...
+    METRICS.add_time('fill', seconds)
+    METRICS.count('forecast_cache.hits')
+
+Timed stages are forecast, fill, evaluation, selection, crossover and mutation. A fill is timed
+once per set of facilities or swap evaluation, never inside the fill kernel, which runs once per
+facility and would pay the clock reads in its tightest loop. Objects with hits and misses
+attributes, such as a FitnessCache or the haversine distances, are added with METRICS.watch_cache
+and their hit rates reported next to the counters.
+
+Every entry point takes the same options, see add_instrumentation_arguments:
+
+    python genetic_solution.py --iterations 100 --metrics ga.jsonl
+    python greedy_solution.py --profile cprofile
+    python gradient_descent_depots.py --time-budget 600 --profile sample --profile-output gd.folded
+
+--metrics appends JSON lines to a file: a start line, one line per generation or iteration of the
+optimisers and a summary line, each with the elapsed time, the counters, the calls and seconds of
+every stage with its calls per second of run time, and the cache hit rates. Only this process is
+measured, fills done in pool workers are not counted.
+
+--profile cprofile writes a pstats file, read with python -m pstats. --profile sample interrupts
+the run every PROFILE_INTERVAL seconds of CPU time and counts the stacks it finds, written as
+collapsed stacks, the input of flamegraph.pl and speedscope. Sampling slows the run far less than
+cProfile, so it suits long runs.
+'''
+import argparse
+import cProfile
+import json
+import os
+import signal
+import sys
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+PROFILERS = ('cprofile', 'sample')
+PROFILE_INTERVAL = 0.005 # seconds of CPU time between two samples
+PROFILE_SUFFIXES = {'cprofile': '.prof', 'sample': '.folded'}
+
+class Metrics:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.counters = Counter()
+        self.calls = Counter()
+        self.seconds = Counter()
+        self.caches = {}
+
+    def count(self, name: str, n: int = 1):
+        self.counters[name] += n
+
+    def add_time(self, stage: str, seconds: float, calls: int = 1):
+        self.calls[stage] += calls
+        self.seconds[stage] += seconds
+
+    @contextmanager
+    def timer(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - started)
+
+    def watch_cache(self, name: str, cache):
+        """
+        Reports the hit rate of cache, anything with hits and misses attributes, in every snapshot
+        """
+        self.caches[name] = cache
+
+    def cache_stats(self) -> dict:
+        caches = {name: (cache.hits, cache.misses) for name, cache in self.caches.items()}
+        for name in self.counters:
+            if name.endswith('.hits'):
+                prefix = name[:-len('.hits')]
+                caches[prefix] = (self.counters[name], self.counters[f"{prefix}.misses"])
+        return {name: {"hits": hits, "misses": misses, "hit_rate": hits / (hits + misses) if hits + misses else None}
+                for name, (hits, misses) in caches.items()}
+
+    def snapshot(self) -> dict:
+        elapsed = time.perf_counter() - self.started
+        return {
+            "elapsed": elapsed,
+            "counters": dict(self.counters),
+            "stages": {stage: {"calls": self.calls[stage], "seconds": self.seconds[stage],
+                               "calls_per_second": self.calls[stage] / elapsed if elapsed else None} for stage in self.calls},
+            "caches": self.cache_stats(),
+        }
+
+    def reset(self):
+        self.__init__()
+
+METRICS = Metrics()
+_metrics_file = None
+
+def emit(event: str, **fields):
+    """
+    Appends one JSON line with the event, its fields and a snapshot of METRICS to the --metrics
+    file. Does nothing when the run has no metrics file.
+    """
+    if _metrics_file is None:
+        return
+    line = {"event": event, "time": time.time(), **fields, **METRICS.snapshot()}
+    _metrics_file.write(json.dumps(line, default=float) + "\n")
+    _metrics_file.flush()
+
+class StackSampler:
+    """
+    Counts the Python stacks found by a SIGPROF timer, see the module docstring. Unix only, and
+    only the main thread is sampled.
+    """
+    def __init__(self, interval: float = PROFILE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+
+    def sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            stack.append(f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_code.co_name}")
+            frame = frame.f_back
+        self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self.previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+
+    def write(self, path: str):
+        with open(path, 'w') as output:
+            for stack, count in self.stacks.most_common():
+                output.write(f"{stack} {count}\n")
+
+@contextmanager
+def profiling(profiler: str, output: str):
+    """
+    Runs the with block under cProfile or the stack sampler and writes what they recorded to output
+    """
+    if profiler is None:
+        yield
+        return
+    if profiler not in PROFILERS:
+        raise ValueError(f"profiler must be one of {PROFILERS}, got {profiler!r}")
+    if profiler == 'cprofile':
+        recorder = cProfile.Profile()
+        recorder.enable()
+    else:
+        recorder = StackSampler()
+        recorder.start()
+    try:
+        yield
+    finally:
+        if profiler == 'cprofile':
+            recorder.disable()
+            recorder.dump_stats(output)
+        else:
+            recorder.stop()
+            recorder.write(output)
+        print(f"==> {profiler} profile written to {output}", file=sys.stderr)
+
+@contextmanager
+def instrumented(name: str, metrics: str = None, profile: str = None, profile_output: str = None):
+    """
+    Runs the with block with a metrics file and a profiler when they are asked for, writing the
+    start and summary lines around it
+
+    Args:
+        name: Name of the entry point, also the default name of the profile
+        metrics: JSON lines file the metrics are appended to
+        profile: One of PROFILERS
+        profile_output: File the profile is written to, name plus the profiler's suffix when None
+    """
+    global _metrics_file
+    METRICS.reset()
+    if metrics is not None:
+        _metrics_file = open(metrics, 'a')
+    try:
+        emit("start", entry_point=name, argv=sys.argv[1:], pid=os.getpid())
+        with profiling(profile, profile_output or name + PROFILE_SUFFIXES.get(profile, '')):
+            yield METRICS
+    finally:
+        emit("summary", entry_point=name)
+        if _metrics_file is not None:
+            _metrics_file.close()
+            _metrics_file = None
+
+def add_instrumentation_arguments(parser: argparse.ArgumentParser):
+    """
+    Adds the metrics and profiling options every entry point takes to parser
+    """
+    parser.add_argument('--metrics', help="JSON lines file the run metrics are appended to")
+    parser.add_argument('--profile', choices=PROFILERS, help="profile the run with cProfile or the stack sampler")
+    parser.add_argument('--profile-output', help="file the profile is written to, named after the entry point when not given")
+    return parser
+
+def run_instrumented(main, arguments: argparse.Namespace, name: str):
+    """
+    Calls main with the parsed arguments, less the instrumentation options, inside instrumented()
+    """
+    options = vars(arguments).copy()
+    settings = {option: options.pop(option) for option in ('metrics', 'profile', 'profile_output')}
+    with instrumented(name, **settings):
+        return main(**options)
@@ -0,0 +1,87 @@
+'''
+Exhaustive search for the refinery locations of a fixed set of depots.
+
+With 15 depots and 3 refineries the greedy fill of a refinery set only looks at a 3 x 15 block
+of the distances, so many sets can be filled side by side as arrays. The sites are first
+ranked by their distance to the nearest depot, and every set of refineries drawn from the
+closest `k` of them is then scored in chunks. The lowest cost set is the global optimum over
+those candidates.
+
+    cost, refineries = search_refineries(depots, depot_pellets(depots))
+'''
+import itertools
+import numpy as np
+from data_context import DATA
+from greedy_solution import REFINERY_PROCESSING_CAPACITY
+
+CANDIDATE_SITES = 90 # sites closest to the depots the sets are drawn from
+CHUNK_SIZE = 8192 # refinery sets filled at once
+
+def refinery_set_costs(refinery_sets: np.ndarray, depots: list, pellets: np.ndarray):
+    """
+    Fills many refinery sets at once, with the same flows as greedy_solution.fill_refinery_flows.
+
+    Each set is filled in sorted order, every refinery taking from its nearest depots what the
+    refineries before it left behind.
+
+    Args:
+        refinery_sets: (n_sets x n_refineries) site indexes, each row sorted ascending
+        depots: Depot indexes
+        pellets: Pellets waiting at each index, left unchanged
+
+    Returns:
+        Transport cost of each set
+    """
+    depots = np.unique(depots)
+    refinery_sets = np.asarray(refinery_sets)
+    supply = np.tile(pellets[depots], (len(refinery_sets), 1))
+    costs = np.zeros(len(refinery_sets))
+    rows = np.arange(len(refinery_sets))[:, None]
+    for refineries in refinery_sets.T:
+        distances = np.asarray(DATA.distances.block(depots, refineries), dtype=np.float64).T
+        # nearest depots first, ties in index order like the neighbour order
+        order = np.argsort(distances, axis=1, kind='stable')
+        available = supply[rows, order]
+        filled_before = np.cumsum(available, axis=1) - available
+        taken = np.clip(REFINERY_PROCESSING_CAPACITY - filled_before, 0, available)
+        supply[rows, order] -= taken
+        costs += np.sum(np.take_along_axis(distances, order, axis=1) * taken, axis=1)
+    return costs
+
+def candidate_refineries(depots: list, pellets: np.ndarray, k: int = CANDIDATE_SITES):
+    """
+    The k sites closest to a depot holding pellets, in ascending site order. A refinery far from
+    every depot pays that distance on everything it takes, so the good sets sit among these.
+    """
+    depots = np.unique(depots)
+    depots = depots[pellets[depots] > 0]
+    nearest_depot = DATA.distances.block(depots).min(axis=0)
+    return np.sort(np.argsort(nearest_depot, kind='stable')[:k])
+
+def search_refineries(depots: list, pellets: np.ndarray, k: int = CANDIDATE_SITES, refineries: int = None,
+                      chunk_size: int = CHUNK_SIZE):
+    """
+    Scores every set of refineries drawn from the k candidate sites and returns the cheapest.
+
+    Args:
+        depots: Depot indexes
+        pellets: Pellets waiting at each index, left unchanged
+        k: Number of candidate sites, see candidate_refineries
+        refineries: Number of refineries in a set, DATA.number_of_refineries when None
+        chunk_size: Sets filled at once, bounds the memory used
+
+    Returns:
+        cost, refineries: Lowest transport cost and its refinery indexes
+    """
+    refineries = DATA.number_of_refineries if refineries is None else refineries
+    candidates = candidate_refineries(depots, pellets, k)
+    sets = itertools.combinations(candidates.tolist(), refineries)
+    best_cost, best_set = np.inf, None
+    while True:
+        chunk = np.fromiter(itertools.chain.from_iterable(itertools.islice(sets, chunk_size)), dtype=np.int64).reshape(-1, refineries)
+        if len(chunk) == 0:
+            return best_cost, best_set
+        costs = refinery_set_costs(chunk, depots, pellets)
+        best = int(np.argmin(costs))
+        if costs[best] < best_cost:
+            best_cost, best_set = float(costs[best]), chunk[best].tolist()
@@ -1,69 +1,159 @@
+import argparse
+import numpy as np
 import pandas as pd
-from statsmodels.tsa.arima_model import ARIMA
-from statsmodels.tsa.holtwinters import SimpleExpSmoothing,ExponentialSmoothing
+from data_context import DATA, lazy_inputs
+from forecast_cache import cached_forecast
+from instrumentation import METRICS, add_instrumentation_arguments, run_instrumented
+# statsmodels is slow to import and only the per-site reference models need it, they import it themselves
 
-dist_mat = pd.read_csv('Distance_Matrix.csv')
-biomass_hist = pd.read_csv('Biomass_History.csv')
+__getattr__ = lazy_inputs(__name__, {'biomass_hist': 'biomass_history'})
+FORECAST_CSV = 'forecasted_biomass.csv'
+FORECAST_MODEL = 'exponential_smoothing'
+SMOOTHING_LEVEL = 0.05
+HISTORY_COLUMNS = [str(year) for year in range(2010, 2018)]
+TRAINING_COLUMNS = HISTORY_COLUMNS[1:] # the 2018 models leave out 2010
 
 
 #predict biomass for 2018/2019 using average values
 
 def predict_biomass_average():
-    biomass_hist['2018/2019'] = biomass_hist.iloc[:,3:].mean(axis=1)
+    biomass_hist = DATA.biomass_history.copy()
+    biomass_hist['2018/2019'] = biomass_hist[HISTORY_COLUMNS].mean(axis=1)
     return biomass_hist
 
-def predict_biomass_2018():
-    forecast_list_2018 = []
-    for index in range(len(biomass_hist)):
-        biomass_values = list(biomass_hist.iloc[index,3:]) + [0,]
-        years = [2010, 2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018]
-
-        current_grid = pd.DataFrame({'date':years, 'value':biomass_values})
+def smoothing_recursion(values: np.ndarray, smoothing_level: float, initial_level, smoothing_trend: float = None, initial_trend=0.0):
+    """
+    Runs exponential smoothing over the last axis of values, all rows at once.
+
+    Args:
+        values: (n_series x n_years) observations
+        smoothing_level: Weight of a new observation in the level
+        initial_level, initial_trend: Level and trend before the first observation, per row or shared
+        smoothing_trend: Weight of a new level change in the trend, no trend when None
+
+    Returns:
+        fitted: (n_series x n_years) one step ahead forecast of every observation
+        forecast: Forecast of the year after the last observation
+    """
+    level = initial_level
+    trend = initial_trend if smoothing_trend is not None else 0.0
+    fitted = []
+    for year in range(values.shape[-1]):
+        fitted.append(level + trend)
+        new_level = smoothing_level * values[..., year] + (1 - smoothing_level) * (level + trend)
+        if smoothing_trend is not None:
+            trend = smoothing_trend * (new_level - level) + (1 - smoothing_trend) * trend
+        level = new_level
+    return np.stack(np.broadcast_arrays(*fitted), axis=-1), level + trend
+
+def exponential_smoothing_forecast(history: np.ndarray, smoothing_level: float = SMOOTHING_LEVEL, trend: str = None, smoothing_trend: float = None):
+    """
+    Forecasts the next year of every row of history, the same as fitting a statsmodels
+    ExponentialSmoothing model per row with the smoothing parameters fixed.
+
+    statsmodels estimates the initial level (and trend) by least squares on the one step ahead
+    errors. The smoothing is linear in the initial values, so the fitted values are the
+    smoothing of the history from 0 plus a design matrix shared by all rows times the initial
+    values, and all rows are solved in one lstsq call. The results agree with statsmodels up to
+    the tolerance of its optimiser.
+
+    Args:
+        history: (n_sites x n_years) observations, oldest first
+        smoothing_level: Fixed smoothing level, alpha
+        trend: None, or 'add' for an additive trend
+        smoothing_trend: Fixed smoothing of the trend, beta, needed when trend is 'add'
+
+    Returns:
+        Forecast of each row
+    """
+    if trend not in (None, 'add'):
+        raise ValueError(f"Unsupported trend: {trend}")
+    if trend == 'add' and smoothing_trend is None:
+        raise ValueError("A trend needs a fixed smoothing_trend")
+    history = np.asarray(history, dtype=np.float64)
+    smoothing_trend = smoothing_trend if trend == 'add' else None
+    zeros = np.zeros(history.shape[1])
+    fitted, forecast = smoothing_recursion(history, smoothing_level, 0.0, smoothing_trend)
+    # response of the fitted values and the forecast to an initial level, and to an initial trend
+    basis = [smoothing_recursion(zeros, smoothing_level, 1.0, smoothing_trend, 0.0)]
+    if smoothing_trend is not None:
+        basis.append(smoothing_recursion(zeros, smoothing_level, 0.0, smoothing_trend, 1.0))
+    design = np.stack([basis_fitted for basis_fitted, _ in basis], axis=1)
+    initial_values = np.linalg.lstsq(design, (history - fitted).T, rcond=None)[0]
+    return forecast + np.array([basis_forecast for _, basis_forecast in basis]) @ initial_values
+
+def predict_biomass_2018(smoothing_level: float = SMOOTHING_LEVEL, trend: str = None, smoothing_trend: float = None):
+    biomass_hist = DATA.biomass_history.copy()
+    biomass_hist['2018/2019'] = exponential_smoothing_forecast(biomass_hist[TRAINING_COLUMNS].to_numpy(), smoothing_level, trend, smoothing_trend)
+    return biomass_hist
 
-        train_data = current_grid.iloc[1:len(current_grid)-1]
-        test_data = current_grid.iloc[len(current_grid)-1:]
+def predict_biomass_2018_statsmodels():
+    """
+    Fits a statsmodels model per site, the reference predict_biomass_2018 reproduces
+    """
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    biomass_hist = DATA.biomass_history.copy()
+    forecast_list_2018 = []
+    for training_values in biomass_hist[TRAINING_COLUMNS].to_numpy(dtype=np.float64):
+        train_data = pd.Series(training_values)
 
-        model_2018 = ExponentialSmoothing(train_data.value)
-        model_fitted_2018 = model_2018.fit(smoothing_level = 0.05)
+        model_2018 = ExponentialSmoothing(train_data)
+        model_fitted_2018 = model_2018.fit(smoothing_level = SMOOTHING_LEVEL)
 
         #print('coefficients',model_fitted_2018.params)
-        predictions_2018 = model_fitted_2018.predict(start=len(train_data), end=len(train_data) + len(test_data)-1)
-        forecast_list_2018.append(float(predictions_2018))
+        predictions_2018 = model_fitted_2018.predict(start=len(train_data), end=len(train_data))
+        forecast_list_2018.append(float(predictions_2018.iloc[0]))
     biomass_hist['2018/2019'] = forecast_list_2018
     return biomass_hist
 
 ##not in use currently
 def predict_biomass_2019(predicted_biomass_2018):
+    from statsmodels.tsa.holtwinters import ExponentialSmoothing
+    predicted_biomass_2018 = predicted_biomass_2018.copy()
     forecast_list_2019= []
-    for index in range(len(predicted_biomass_2018)):
-        biomass_values = list(predicted_biomass_2018.iloc[index,3:]) + [0,]
-        years = [2010, 2011, 2012, 2013, 2014, 2015, 2016, 2017, 2018, 2019]
-        current_grid = pd.DataFrame({'date':years, 'value':biomass_values})
+    for training_values in predicted_biomass_2018[TRAINING_COLUMNS + ['2018/2019']].to_numpy(dtype=np.float64):
+        train_data = pd.Series(training_values)
 
-        train_data = current_grid.iloc[1:len(current_grid)-1]
-        test_data = current_grid.iloc[len(current_grid)-1:]
-
-        model_2019 = ExponentialSmoothing(train_data.value)
+        model_2019 = ExponentialSmoothing(train_data)
         model_fitted_2019 = model_2019.fit()
 
         #print('coefficients',model_fitted.params)
-        predictions_2019 = model_fitted_2019.predict(start=len(train_data), end=len(train_data) + len(test_data)-1)
-        forecast_list_2019.append(float(predictions_2019))
+        predictions_2019 = model_fitted_2019.predict(start=len(train_data), end=len(train_data))
+        forecast_list_2019.append(float(predictions_2019.iloc[0]))
     predicted_biomass_2018['2019'] = forecast_list_2019
     return predicted_biomass_2018
 
+FORECAST_MODELS = {
+    'exponential_smoothing': predict_biomass_2018,
+    'average': predict_biomass_average,
+}
+
 #tried to predict for each year individually but fail lmao
 #generated the best score for greedy solution so far
-def predict_biomass():
-    predicted_biomass_2018 = predict_biomass_2018()
-    predicted_biomass_2018.to_csv("forecasted_biomass.csv") #required for generated_submission.py
-    #predicted_biomass_2019 = predict_biomass_2019(predicted_biomass_2018)
-    return predicted_biomass_2018
+def predict_biomass(model: str = FORECAST_MODEL, **params):
+    """
+    Forecast of every site for 2018/2019, see FORECAST_MODELS. Forecasts are cached by the
+    contents of the history, the model and its parameters, see forecast_cache.py, so
+    only the first call with a new combination fits the model.
+
+    Returns:
+        The history with a 2018/2019 column, a fresh copy on every call
+    """
+    if model not in FORECAST_MODELS:
+        raise ValueError(f"Unknown forecast model: {model}")
+    with METRICS.timer('forecast'):
+        return cached_forecast(lambda: FORECAST_MODELS[model](**params), DATA.biomass_history, model, params)
 
 def main():
     #load input data
     predicted_biomass = predict_biomass()
+    predicted_biomass.to_csv(FORECAST_CSV)
     print(predicted_biomass)
 
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description=f"Forecast the biomass of every site and write it to {FORECAST_CSV}")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
 if __name__ == '__main__':
-    main()
+    run_instrumented(main, parse_arguments(), 'solution')
@@ -0,0 +1,80 @@
+'''
+Geographic adjacency of the biomass sites.
+
+The sites lie on a regular latitude/longitude grid with holes where there is no biomass. Each
+site is given its (row, column) cell on that grid, and the neighbours of a site are the sites in
+the cells around it, up to `radius` cells away in any direction. Unlike stepping through the row
+index, a move to a neighbour never jumps to the other edge of the map.
+
+    neighbours = load_site_neighbours()
+    neighbours[site] -> sites around site, nearest cells first
+
+The coordinates are those of DATA.biomass_history, so a synthetic instance gets its own grid.
+'''
+import numpy as np
+import pandas as pd
+from data_context import DATA
+
+NEIGHBOUR_RADIUS = 1 # cells in each direction, 1 gives the 8 surrounding cells
+
+_loaded_neighbours = {}
+
+def load_site_coordinates(history: pd.DataFrame = None) -> np.ndarray:
+    """
+    Returns the (latitude, longitude) of every site as an (n_sites x 2) array, row i is site i
+
+    Args:
+        history: Biomass history holding the coordinates, DATA.biomass_history when None
+    """
+    history = DATA.biomass_history if history is None else history
+    sites = history[['Index', 'Latitude', 'Longitude']].sort_values('Index')
+    return sites[['Latitude', 'Longitude']].to_numpy()
+
+def grid_cells(coordinates: np.ndarray) -> np.ndarray:
+    """
+    Converts coordinates to integer (row, column) cells, using the smallest spacing between
+    distinct latitudes and longitudes as the size of a cell.
+
+    Returns:
+        (n_sites x 2) int array
+    """
+    cells = np.empty(coordinates.shape, dtype=np.int64)
+    for axis in range(2):
+        values = np.unique(coordinates[:, axis])
+        step = np.diff(values).min() if len(values) > 1 else 1.0
+        cells[:, axis] = np.rint((coordinates[:, axis] - values[0]) / step)
+    return cells
+
+def build_site_neighbours(coordinates: np.ndarray, radius: int = NEIGHBOUR_RADIUS) -> list[np.ndarray]:
+    """
+    Finds the sites within radius cells of every site.
+
+    Args:
+        coordinates: (latitude, longitude) of each site
+        radius: Number of cells to look in each direction
+
+    Returns:
+        List with one int array per site, its neighbours with the nearest cells first
+    """
+    cells = grid_cells(coordinates)
+    n_rows, n_columns = cells.max(axis=0) + 1
+    grid = np.full((n_rows + 2 * radius, n_columns + 2 * radius), -1, dtype=np.int64)
+    grid[cells[:, 0] + radius, cells[:, 1] + radius] = np.arange(len(cells))
+
+    offsets = np.array([(row, column) for row in range(-radius, radius + 1) for column in range(-radius, radius + 1) if (row, column) != (0, 0)])
+    offsets = offsets[np.argsort(np.hypot(offsets[:, 0], offsets[:, 1]), kind='stable')]
+    # (n_sites x n_offsets) site in each surrounding cell, -1 where the cell holds no site
+    around = grid[cells[:, :1] + radius + offsets[:, 0], cells[:, 1:] + radius + offsets[:, 1]]
+    return [row[row >= 0] for row in around]
+
+def load_site_neighbours(radius: int = NEIGHBOUR_RADIUS, history: pd.DataFrame = None) -> list[np.ndarray]:
+    """
+    Returns the neighbours of every site of history, DATA.biomass_history when None, see
+    build_site_neighbours. Repeated calls with the same history return the same list.
+    """
+    history = DATA.biomass_history if history is None else history
+    # the history is kept with its neighbours, so its id is not reused while the entry exists
+    key = (id(history), radius)
+    if key not in _loaded_neighbours:
+        _loaded_neighbours[key] = (history, build_site_neighbours(load_site_coordinates(history), radius))
+    return _loaded_neighbours[key][1]
@@ -0,0 +1,228 @@
+'''
+Streaming writer for submissions.
+
+Rows are written block by block straight from arrays, in the order and column layout of
+sample_submission.csv:
+
+    year,data_type,source_index,destination_index,value
+
+Every block is checked before it is written: a known data_type and year, integer site indexes
+inside the grid, one value per flow and no negative or missing amounts. A block that fails
+raises SubmissionError and nothing of it reaches the file. Memory stays flat, only one chunk of
+formatted rows is held at a time, whatever the size of the grid.
+
+Rows go to a temporary file next to the submission, which only replaces it when the writer is
+closed cleanly. A run that fails part way through leaves the previous submission as it was.
+
+    with SubmissionWriter('submission.csv') as writer:
+        writer.write_locations('depot_location', depots)
+        writer.write_flows('biomass_demand_supply', 2018, sources, destinations, values)
+
+A path ending in .parquet is written with pyarrow instead, one row group per block.
+'''
+import os
+import numpy as np
+from data_context import DATA
+from cost_helpers import DATA_TYPES, YEARS
+
+SUBMISSION_CSV = 'submission.csv'
+SUBMISSION_COLUMNS = ("year", "data_type", "source_index", "destination_index", "value")
+LOCATION_YEAR = 20182019 # year of the depot and refinery locations, which hold for both years
+LOCATION_TYPES = ("depot_location", "refinery_location")
+FLOW_TYPES = ("biomass_demand_supply", "pellet_demand_supply")
+WRITE_CHUNK_ROWS = 65536
+
+class SubmissionError(ValueError):
+    pass
+
+def as_indexes(name: str, values, n_sites: int) -> np.ndarray:
+    """
+    Converts site indexes to an int64 array, checking they are whole numbers on the grid
+    """
+    array = np.asarray(values)
+    if array.ndim != 1:
+        raise SubmissionError(f"{name} must be one dimensional, got shape {array.shape}")
+    if array.dtype.kind == 'f':
+        if not np.all(np.isfinite(array)) or np.any(array != np.round(array)):
+            raise SubmissionError(f"{name} must hold whole numbers")
+    elif array.dtype.kind not in 'iu' and len(array):
+        raise SubmissionError(f"{name} must be integers, got {array.dtype}")
+    array = array.astype(np.int64)
+    if len(array) and (array.min() < 0 or array.max() >= n_sites):
+        raise SubmissionError(f"{name} must lie in [0, {n_sites}), got [{array.min()}, {array.max()}]")
+    return array
+
+def as_amounts(name: str, values, length: int) -> np.ndarray:
+    """
+    Converts amounts to a float64 array, checking there is one per row and none is negative or missing
+    """
+    array = np.asarray(values, dtype=np.float64)
+    if array.shape != (length,):
+        raise SubmissionError(f"{name} must hold {length} values, got shape {array.shape}")
+    if not np.all(np.isfinite(array)):
+        raise SubmissionError(f"{name} must be finite")
+    if np.any(array < 0):
+        raise SubmissionError(f"{name} must not be negative")
+    return array
+
+def check_data_type(data_type: str, allowed: tuple):
+    if data_type not in DATA_TYPES or data_type not in allowed:
+        raise SubmissionError(f"data_type must be one of {allowed}, got {data_type!r}")
+
+def check_year(year: int, allowed: tuple):
+    if year not in allowed:
+        raise SubmissionError(f"year must be one of {allowed}, got {year!r}")
+
+def csv_lines(year: int, data_type: str, sources: np.ndarray, destinations: np.ndarray = None, values: np.ndarray = None):
+    """
+    Formats rows as csv lines, empty fields where a column does not apply. Floats are written
+    with repr, the shortest text that reads back as the same float, like pandas.to_csv.
+    """
+    prefix = f"{year},{data_type},"
+    sources = sources.tolist()
+    if destinations is None and values is None:
+        return [f"{prefix}{source},,\n" for source in sources]
+    values = values.tolist()
+    if destinations is None:
+        return [f"{prefix}{source},,{value!r}\n" for source, value in zip(sources, values)]
+    return [f"{prefix}{source},{destination},{value!r}\n" for source, destination, value in zip(sources, destinations.tolist(), values)]
+
+def temporary_path(path: str) -> str:
+    """
+    Temporary file the sinks write to, in the directory of path so os.replace stays a rename
+    """
+    return f"{path}.{os.getpid()}.tmp"
+
+def finish(temp_path: str, path: str, keep: bool):
+    """
+    Moves a finished temporary file into place, or deletes it when keep is false
+    """
+    if keep:
+        os.replace(temp_path, path)
+    elif os.path.exists(temp_path):
+        os.remove(temp_path)
+
+class CsvSink:
+    def __init__(self, path: str):
+        self.path = path
+        self.temp_path = temporary_path(path)
+        self.file = open(self.temp_path, 'w', newline='')
+        self.file.write(",".join(SUBMISSION_COLUMNS) + "\n")
+
+    def write(self, year, data_type, sources, destinations=None, values=None):
+        for start in range(0, len(sources), WRITE_CHUNK_ROWS):
+            stop = start + WRITE_CHUNK_ROWS
+            self.file.writelines(csv_lines(year, data_type, sources[start:stop],
+                                           None if destinations is None else destinations[start:stop],
+                                           None if values is None else values[start:stop]))
+
+    def close(self, keep: bool = True):
+        self.file.close()
+        finish(self.temp_path, self.path, keep)
+
+class ParquetSink:
+    def __init__(self, path: str):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as error:
+            raise ImportError("Writing a submission as parquet needs pyarrow") from error
+        self.pa = pa
+        self.schema = pa.schema([("year", pa.int64()), ("data_type", pa.string()), ("source_index", pa.int64()),
+                                 ("destination_index", pa.int64()), ("value", pa.float64())])
+        self.path = path
+        self.temp_path = temporary_path(path)
+        self.writer = pq.ParquetWriter(self.temp_path, self.schema)
+
+    def write(self, year, data_type, sources, destinations=None, values=None):
+        missing = self.pa.nulls(len(sources))
+        self.writer.write_table(self.pa.table([
+            self.pa.array(np.full(len(sources), year, dtype=np.int64)),
+            self.pa.array([data_type] * len(sources), self.pa.string()),
+            self.pa.array(sources),
+            self.pa.array(destinations) if destinations is not None else missing.cast(self.pa.int64()),
+            self.pa.array(values) if values is not None else missing.cast(self.pa.float64()),
+        ], schema=self.schema))
+
+    def close(self, keep: bool = True):
+        self.writer.close()
+        finish(self.temp_path, self.path, keep)
+
+class SubmissionWriter:
+    """
+    Checks and writes blocks of submission rows, see the module docstring. Used as a context
+    manager, the file is closed when the block ends and only replaces path when the block
+    raised nothing.
+    """
+    def __init__(self, path: str = SUBMISSION_CSV, n_sites: int = None):
+        """
+        Args:
+            path: Output file, parquet when it ends in .parquet, csv otherwise
+            n_sites: Number of sites on the grid, the size of the distance matrix when None
+        """
+        self.path = path
+        self.n_sites = n_sites if n_sites is not None else DATA.number_of_sites
+        self.sink = ParquetSink(path) if path.endswith('.parquet') else CsvSink(path)
+        self.rows = 0
+
+    def write_locations(self, data_type: str, sites, year: int = LOCATION_YEAR):
+        check_data_type(data_type, LOCATION_TYPES)
+        check_year(year, (LOCATION_YEAR,))
+        sites = as_indexes(f"{data_type} sites", sites, self.n_sites)
+        if len(np.unique(sites)) != len(sites):
+            raise SubmissionError(f"{data_type} lists a site twice")
+        self.sink.write(year, data_type, sites)
+        self.rows += len(sites)
+
+    def write_forecast(self, year: int, sites, values):
+        check_year(year, YEARS)
+        sites = as_indexes("biomass_forecast sites", sites, self.n_sites)
+        values = as_amounts("biomass_forecast values", values, len(sites))
+        self.sink.write(year, "biomass_forecast", sites, values=values)
+        self.rows += len(sites)
+
+    def write_flows(self, data_type: str, year: int, sources, destinations, values):
+        check_data_type(data_type, FLOW_TYPES)
+        check_year(year, YEARS)
+        sources = as_indexes(f"{data_type} sources", sources, self.n_sites)
+        destinations = as_indexes(f"{data_type} destinations", destinations, self.n_sites)
+        if len(destinations) != len(sources):
+            raise SubmissionError(f"{data_type} has {len(sources)} sources and {len(destinations)} destinations")
+        values = as_amounts(f"{data_type} values", values, len(sources))
+        self.sink.write(year, data_type, sources, destinations, values)
+        self.rows += len(sources)
+
+    def close(self, keep: bool = True):
+        """
+        Closes the file and moves it to path, or discards it when keep is false
+        """
+        self.sink.close(keep)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(keep=exc_type is None)
+
+def write_submission(depots, refineries, forecast: tuple, biomass_flows: tuple, pellet_flows: tuple,
+                     path: str = SUBMISSION_CSV, years: tuple = YEARS) -> int:
+    """
+    Writes a full submission, the same flows in every year.
+
+    Args:
+        depots, refineries: Site index of each facility
+        forecast: (sites, values) of the biomass forecast
+        biomass_flows, pellet_flows: (sources, destinations, values) of the flows
+        path: Output file, see SubmissionWriter
+
+    Returns:
+        Number of rows written
+    """
+    with SubmissionWriter(path) as writer:
+        writer.write_locations("depot_location", depots)
+        writer.write_locations("refinery_location", refineries)
+        for year in years:
+            writer.write_forecast(year, *forecast)
+            writer.write_flows("biomass_demand_supply", year, *biomass_flows)
+            writer.write_flows("pellet_demand_supply", year, *pellet_flows)
+    return writer.rows
@@ -0,0 +1,27 @@
+'''
+Shared fixtures. Every test runs on a small synthetic instance held in memory, see
+instance_generator.py, so the suite needs none of the bundled inputs.
+'''
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_context import using_inputs
+from instance_generator import generate_instance
+
+N_SITES = 400
+NUMBER_OF_DEPOTS = 4
+NUMBER_OF_REFINERIES = 2
+
+@pytest.fixture
+def instance(tmp_path, monkeypatch):
+    """
+    DATA pointed at a 400 site instance for the length of a test, run from an empty directory so
+    caches and outputs never land in the repository
+    """
+    monkeypatch.chdir(tmp_path)
+    with using_inputs(generate_instance(N_SITES, seed=1, number_of_depots=NUMBER_OF_DEPOTS,
+                                        number_of_refineries=NUMBER_OF_REFINERIES)) as data:
+        yield data
@@ -0,0 +1,26 @@
+import pytest
+from annealing_depots import main
+from checkpoint import load_checkpoint
+
+SLACK = 0.5 # seconds a move and a checkpoint may run past the budget on a slow machine
+
+def test_seeded_runs_reproduce(instance):
+    first = main(iterations=300, seed=4, best='first.json')
+    assert main(iterations=300, seed=4, best='second.json') == first
+
+def test_iterations_are_kept_across_a_resume(instance):
+    main(iterations=150, seed=4, best='best.json', checkpoint='run.pkl')
+    assert load_checkpoint('run.pkl')['iteration'] == 150
+    main(iterations=300, best='best.json', checkpoint='run.pkl', resume=True)
+    assert load_checkpoint('run.pkl')['iteration'] == 300
+
+def test_resumed_run_stays_inside_the_budget(instance):
+    main(time_budget=0.3, seed=0, best='best.json', checkpoint='run.pkl')
+    run = load_checkpoint('run.pkl')
+    assert run['elapsed'] == pytest.approx(0.3, abs=SLACK)
+    main(time_budget=0.6, best='best.json', checkpoint='run.pkl', resume=True)
+    resumed = load_checkpoint('run.pkl')
+    assert resumed['iteration'] > run['iteration']
+    assert 0.6 <= resumed['elapsed'] < 0.6 + SLACK
+    main(time_budget=0.6, best='best.json', checkpoint='run.pkl', resume=True)
+    assert load_checkpoint('run.pkl')['iteration'] == resumed['iteration']
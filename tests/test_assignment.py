@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from assignment import AssignmentState, assign_biomass, assignment_transport_cost, exact_depot_state
+from checkpoint import check_fitness
+from cost_helpers import calculate_cost_of_flows
+from greedy_solution import BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY, fill_depot_flows
+
+DEPOTS = [30, 120, 210, 330]
+
+def biomass(data):
+    return data.biomass_history['2017'].to_numpy(dtype=np.float64)
+
+def test_exact_flows_are_feasible_and_move_all_they_can(instance):
+    supply = biomass(instance)
+    sources, destinations, values = assign_biomass(DEPOTS, supply)
+    received = np.bincount(destinations, weights=values, minlength=instance.number_of_sites)
+    taken = np.bincount(sources, weights=values, minlength=instance.number_of_sites)
+    assert received.max() <= DEPOT_PROCESSING_CAPACITY + 1e-6
+    assert np.all(taken <= supply * BIOMASS_COLLECTION_RATE + 1e-6)
+    assert values.sum() == pytest.approx(min(supply.sum() * BIOMASS_COLLECTION_RATE, len(DEPOTS) * DEPOT_PROCESSING_CAPACITY))
+
+def test_exact_cost_is_at_most_the_greedy_one(instance):
+    # two depots hold less than the biomass, so both fills bring them to capacity
+    supply = biomass(instance)
+    greedy_flows = fill_depot_flows(DEPOTS[:2], supply.copy())
+    exact_flows = assign_biomass(DEPOTS[:2], supply)
+    assert exact_flows[2].sum() == pytest.approx(greedy_flows[2].sum()) == 2 * DEPOT_PROCESSING_CAPACITY
+    assert calculate_cost_of_flows(*exact_flows) <= calculate_cost_of_flows(*greedy_flows) * (1 + 1e-9)
+
+def test_starting_arcs_do_not_change_the_optimum(instance):
+    supply = biomass(instance)
+    full = assignment_transport_cost(DEPOTS, supply, k=None)
+    assert assignment_transport_cost(DEPOTS, supply, k=5) == pytest.approx(full, rel=1e-6)
+    state = exact_depot_state(DEPOTS, supply)
+    fresh = AssignmentState([30, 120, 210, 5], supply * BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY)
+    assert state.evaluate_swap(330, 5) == pytest.approx(fresh.total_cost(), rel=1e-6)
+    assert state.total_cost() == pytest.approx(full, rel=1e-6)
+
+def test_runs_resume_with_their_own_fitness():
+    check_fitness({'fitness': 'exact'}, 'exact')
+    check_fitness({}, 'greedy')
+    with pytest.raises(ValueError):
+        check_fitness({'fitness': 'exact'}, 'greedy')
@@ -0,0 +1,28 @@
+import json
+import numpy as np
+import pandas as pd
+import pytest
+from backtest import backtest, forecast_errors, summarise
+
+CONFIGS = [{'model': 'average'}, {'model': 'last_value'}, {'model': 'exponential_smoothing', 'smoothing_level': 0.8}]
+
+def growing_history():
+    """
+    Every site grows by the same share each year, so the latest years forecast best
+    """
+    years = np.arange(2010, 2018)
+    scale = np.random.default_rng(2).uniform(50, 150, 30)
+    return pd.DataFrame(scale[:, None] * 1.1 ** (years - 2010), columns=years.tolist())
+
+def test_forecast_errors():
+    errors = forecast_errors(np.array([110.0, 90.0, 0.0]), np.array([100.0, 100.0, 0.0]))
+    assert errors == pytest.approx({'wape': 0.1, 'bias': 0.0, 'weighted_rmse': 10.0})
+
+def test_ranking_prefers_the_recent_years():
+    results = backtest(growing_history(), CONFIGS)
+    assert len(results) == len(CONFIGS) * 5
+    assert [json.loads(config)['model'] for config in summarise(results).index] == ['last_value', 'exponential_smoothing', 'average']
+
+def test_pool_gives_the_same_folds():
+    history = growing_history()
+    pd.testing.assert_frame_equal(backtest(history, CONFIGS, workers=2), backtest(history, CONFIGS))
@@ -0,0 +1,34 @@
+import random
+import numpy as np
+import gradient_descent_depots
+from checkpoint import CheckpointTimer, load_checkpoint, random_state, restore_random_state, save_checkpoint
+
+def test_checkpoint_restores_the_random_streams(tmp_path):
+    rng = np.random.default_rng(7)
+    random.seed(7)
+    save_checkpoint(tmp_path / 'run.pkl', {'iteration': 3, 'random_state': random_state(rng)})
+    expected = (random.random(), rng.random())
+    state = load_checkpoint(tmp_path / 'run.pkl')
+    restore_random_state(state['random_state'], rng)
+    assert state['iteration'] == 3
+    assert (random.random(), rng.random()) == expected
+
+def test_checkpoint_timer_only_saves_when_due(tmp_path):
+    timer = CheckpointTimer(str(tmp_path / 'run.pkl'), interval=3600)
+    assert not timer.maybe_save(lambda: {'iteration': 1})
+    assert timer.maybe_save(lambda: {'iteration': 2}, force=True)
+    assert load_checkpoint(tmp_path / 'run.pkl') == {'iteration': 2}
+    assert not CheckpointTimer(None).maybe_save(lambda: {}, force=True)
+
+def descent(**run):
+    gradient_descent_depots.main(seed=3, **run)
+    return load_checkpoint('run.pkl')
+
+def test_resumed_descent_matches_an_uninterrupted_one(instance):
+    straight = descent(iterations=4, checkpoint='run.pkl')
+    descent(iterations=2, checkpoint='run.pkl')
+    resumed = descent(iterations=4, checkpoint='run.pkl', resume=True)
+    assert resumed['iteration'] == straight['iteration'] == 4
+    assert resumed['depots'] == straight['depots']
+    assert resumed['best'] == straight['best']
+    assert resumed['random_state'] == straight['random_state']
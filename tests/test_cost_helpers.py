@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+from cost_helpers import DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY, transportation_cost_breakdown, underutilization_cost_breakdown
+
+DEPOTS = [5, 77, 301]
+REFINERIES = [150]
+
+def flows(data_type, sources, destinations, rng):
+    years = rng.choice([2018, 2019], len(sources))
+    return pd.DataFrame({"year": years, "data_type": data_type, "source_index": sources,
+                         "destination_index": destinations, "value": rng.uniform(0, 500, len(sources))})
+
+def locations(data_type, sites):
+    return pd.DataFrame({"year": 20182019, "data_type": data_type, "source_index": sites})
+
+@pytest.fixture
+def submission(instance):
+    rng = np.random.default_rng(4)
+    biomass = flows("biomass_demand_supply", rng.integers(0, instance.number_of_sites, 300), rng.choice(DEPOTS, 300), rng)
+    pellets = flows("pellet_demand_supply", rng.choice(DEPOTS, 20), rng.choice(REFINERIES, 20), rng)
+    return biomass, pellets
+
+def test_transport_cost_matches_the_row_by_row_sum(instance, submission):
+    expected = {"total": 0}
+    for data_type, demand_supply in zip(("biomass_demand_supply", "pellet_demand_supply"), submission):
+        expected[data_type] = {2018: 0, 2019: 0}
+        for _, row in demand_supply.iterrows():
+            cost = instance.distance_matrix[int(row["source_index"]), int(row["destination_index"])] * row["value"]
+            expected[data_type][row["year"]] += cost
+            expected["total"] += cost
+    breakdown = transportation_cost_breakdown(*submission)
+    for data_type in ("biomass_demand_supply", "pellet_demand_supply"):
+        assert breakdown[data_type] == pytest.approx(expected[data_type], rel=1e-9)
+    assert breakdown["total"] == pytest.approx(expected["total"], rel=1e-9)
+
+def test_underutilization_cost_matches_the_row_by_row_sum(instance, submission):
+    biomass, pellets = submission
+    expected = {}
+    for facility, demand_supply, sites, capacity in (("depot", biomass, DEPOTS, DEPOT_PROCESSING_CAPACITY),
+                                                     ("refinery", pellets, REFINERIES, REFINERY_PROCESSING_CAPACITY)):
+        received = {year: dict.fromkeys(sites, 0) for year in (2018, 2019)}
+        for _, row in demand_supply.iterrows():
+            received[row["year"]][row["destination_index"]] += row["value"]
+        expected[facility] = {year: sum(capacity - value for value in received[year].values()) for year in received}
+    breakdown = underutilization_cost_breakdown(biomass, pellets, locations("depot_location", DEPOTS), locations("refinery_location", REFINERIES))
+    assert breakdown["depot"] == pytest.approx(expected["depot"], rel=1e-9)
+    assert breakdown["refinery"] == pytest.approx(expected["refinery"], rel=1e-9)
@@ -0,0 +1,29 @@
+import os
+import numpy as np
+import pandas as pd
+from distance_matrix import DISTANCE_MATRIX_DTYPE, binary_path, load_distance_matrix
+
+def write_matrix_csv(path, distances):
+    sites = range(len(distances))
+    pd.DataFrame(distances, index=sites, columns=[str(site) for site in sites]).to_csv(path)
+
+def test_csv_is_converted_once_and_memory_mapped(tmp_path):
+    csv_path = str(tmp_path / 'Distance_Matrix.csv')
+    distances = np.arange(16, dtype=np.float64).reshape(4, 4) / 3
+    write_matrix_csv(csv_path, distances)
+    matrix = load_distance_matrix(csv_path)
+    assert isinstance(matrix, np.memmap) and not matrix.flags.writeable
+    assert matrix.dtype == DISTANCE_MATRIX_DTYPE
+    np.testing.assert_array_equal(matrix, distances.astype(DISTANCE_MATRIX_DTYPE))
+    assert os.path.exists(binary_path(csv_path))
+    assert load_distance_matrix(csv_path) is matrix
+
+def test_binary_copy_is_used_without_the_csv(tmp_path):
+    csv_path = str(tmp_path / 'Distance_Matrix.csv')
+    write_matrix_csv(csv_path, np.eye(3))
+    load_distance_matrix(csv_path)
+    os.remove(csv_path)
+    # a fresh npy_path key, so the matrix is read from disk again rather than the loaded copy
+    moved = str(tmp_path / 'moved.npy')
+    os.rename(binary_path(csv_path), moved)
+    np.testing.assert_array_equal(load_distance_matrix(csv_path, moved), np.eye(3))
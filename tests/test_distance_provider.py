@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+from distance_provider import DenseDistances, DistanceProvider, HaversineDistances
+from instance_generator import generate_instance
+
+def test_haversine_agrees_with_the_dense_matrix():
+    dense = generate_instance(300, seed=3, distance_provider='dense').distances
+    computed = generate_instance(300, seed=3, distance_provider='haversine').distances
+    assert isinstance(dense, DenseDistances) and isinstance(computed, HaversineDistances)
+    rng = np.random.default_rng(0)
+    sources, destinations = rng.integers(300, size=(2, 500))
+    np.testing.assert_allclose(computed.pairs(sources, destinations), dense.pairs(sources, destinations), rtol=1e-5)
+    np.testing.assert_allclose(computed.block(sources[:40], destinations[:60]), dense.block(sources[:40], destinations[:60]), rtol=1e-5)
+    weights = rng.random(300)
+    np.testing.assert_allclose(computed.weighted_sum(weights), dense.weighted_sum(weights), rtol=1e-5)
+    # ties between equally distant grid sites may be broken either way, the distances along each order may not
+    rows = np.arange(300)[:, None]
+    np.testing.assert_allclose(dense.block()[computed.neighbour_order(50), rows], dense.block()[dense.neighbour_order(50), rows], rtol=1e-5)
+
+def test_providers_implement_the_whole_interface():
+    class PairsOnly(DistanceProvider):
+        def pairs(self, sources, destinations):
+            return np.zeros(len(sources))
+
+    with pytest.raises(TypeError):
+        PairsOnly()
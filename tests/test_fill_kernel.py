@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from fill_kernel import fill_facilities, fill_facility
+from greedy_solution import BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY
+
+def loop_fill(neighbours, supply, capacity, ratio=1.0):
+    """
+    The fill one neighbour at a time, as greedy_solution did before fill_kernel
+    """
+    sources, values = [], []
+    filled = 0.0
+    for source in neighbours:
+        if filled >= capacity:
+            break
+        available = supply[source] * ratio
+        if available <= 0:
+            continue
+        if filled + available <= capacity:
+            supply[source] = 0
+            moved = available
+        else:
+            moved = capacity - filled
+            supply[source] -= moved
+        sources.append(source)
+        values.append(moved)
+        filled += moved
+    return np.array(sources, dtype=np.int64), np.array(values)
+
+def biomass(data):
+    return data.biomass_history['2017'].to_numpy(dtype=np.float64)
+
+@pytest.mark.parametrize('ratio', [1.0, BIOMASS_COLLECTION_RATE])
+def test_fill_facility_matches_loop_fill(instance, ratio):
+    kernel_supply = biomass(instance)
+    loop_supply = kernel_supply.copy()
+    for facility in (0, 57, 203, 399):
+        neighbours = np.asarray(instance.neighbour_order[facility])
+        sources, values = fill_facility(neighbours, kernel_supply, DEPOT_PROCESSING_CAPACITY, ratio)
+        expected_sources, expected_values = loop_fill(neighbours, loop_supply, DEPOT_PROCESSING_CAPACITY, ratio)
+        np.testing.assert_array_equal(sources, expected_sources)
+        np.testing.assert_allclose(values, expected_values, rtol=1e-9)
+        np.testing.assert_allclose(kernel_supply, loop_supply, rtol=1e-9, atol=1e-9)
+
+def test_fill_facilities_stops_at_capacity(instance):
+    supply = biomass(instance)
+    total = supply.sum()
+    sources, destinations, values = fill_facilities([12, 250], supply, DEPOT_PROCESSING_CAPACITY, instance.neighbour_order)
+    for facility in (12, 250):
+        assert values[destinations == facility].sum() == pytest.approx(DEPOT_PROCESSING_CAPACITY)
+    assert supply.sum() + values.sum() == pytest.approx(total)
+    assert len(np.unique(sources[destinations == 12])) == np.sum(destinations == 12)
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+from fill_state import FillState
+from greedy_solution import BIOMASS_COLLECTION_RATE, DEPOT_PROCESSING_CAPACITY
+
+def biomass(data):
+    return data.biomass_history['2017'].to_numpy(dtype=np.float64)
+
+def test_evaluate_swap_matches_a_fresh_fill(instance):
+    supply = biomass(instance)
+    depots = [30, 120, 210, 330]
+    state = FillState(depots, supply, DEPOT_PROCESSING_CAPACITY, instance.neighbour_order, BIOMASS_COLLECTION_RATE)
+    for old in depots:
+        for new in (0, 31, 125, 215, 399):
+            swapped = [depot for depot in depots if depot != old] + [new]
+            fresh = FillState(swapped, supply, DEPOT_PROCESSING_CAPACITY, instance.neighbour_order, BIOMASS_COLLECTION_RATE)
+            assert state.evaluate_swap(old, new) == pytest.approx(fresh.total_cost(), rel=1e-9)
+            assert state.swap(old, new).total_cost() == pytest.approx(fresh.total_cost(), rel=1e-9)
+    np.testing.assert_array_equal(state.supply_before[0], supply)
@@ -0,0 +1,23 @@
+import numpy as np
+import pytest
+from fitness_cache import FitnessCache, canonical
+from gradient_descent_depots import fill_depots
+
+def test_least_recently_used_entry_is_evicted():
+    cache = FitnessCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+def test_cached_costs_equal_fresh_ones(instance):
+    biomass = instance.biomass_history['2017'].to_numpy(dtype=np.float64)
+    cache = FitnessCache()
+    fresh = fill_depots([300, 20, 150, 90], biomass.copy())
+    assert fill_depots([300, 20, 150, 90], biomass.copy(), cache=cache) == pytest.approx(fresh)
+    assert fill_depots([20, 90, 150, 300], biomass.copy(), cache=cache) == pytest.approx(fresh)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert canonical([300, 20, 150, 90]) == (20, 90, 150, 300)
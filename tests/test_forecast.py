@@ -0,0 +1,28 @@
+import numpy as np
+import pandas as pd
+import pytest
+from solution import SMOOTHING_LEVEL, TRAINING_COLUMNS, exponential_smoothing_forecast, predict_biomass_2018
+
+statsmodels = pytest.importorskip('statsmodels.tsa.holtwinters')
+
+def statsmodels_forecast(history, **fit):
+    forecasts = []
+    for values in history:
+        model = statsmodels.ExponentialSmoothing(pd.Series(values), trend='add' if 'smoothing_trend' in fit else None)
+        forecasts.append(float(model.fit(smoothing_level=SMOOTHING_LEVEL, **fit).forecast(1).iloc[0]))
+    return np.array(forecasts)
+
+def test_closed_form_smoothing_matches_statsmodels(instance):
+    history = instance.biomass_history[TRAINING_COLUMNS].to_numpy(dtype=np.float64)[:40]
+    np.testing.assert_allclose(exponential_smoothing_forecast(history), statsmodels_forecast(history), rtol=1e-5, atol=1e-3)
+
+def test_closed_form_trend_matches_statsmodels(instance):
+    history = instance.biomass_history[TRAINING_COLUMNS].to_numpy(dtype=np.float64)[:40]
+    np.testing.assert_allclose(exponential_smoothing_forecast(history, trend='add', smoothing_trend=0.1),
+                               statsmodels_forecast(history, smoothing_trend=0.1), rtol=1e-4, atol=1e-2)
+
+def test_forecast_leaves_the_history_alone(instance):
+    before = instance.biomass_history.copy()
+    forecast = predict_biomass_2018()
+    pd.testing.assert_frame_equal(instance.biomass_history, before)
+    assert forecast['2018/2019'].shape == (instance.number_of_sites,)
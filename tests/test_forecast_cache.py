@@ -0,0 +1,30 @@
+import os
+import pandas as pd
+from forecast_cache import FORECAST_CACHE_DIR, cached_forecast
+
+def forecast_counting(history, calls):
+    def make_forecast():
+        calls.append(1)
+        return history.assign(forecast=history['2017'] * 1.5)
+    return make_forecast
+
+def test_second_call_is_a_hit(instance):
+    history, calls = instance.biomass_history, []
+    first = cached_forecast(forecast_counting(history, calls), history, 'model', {'alpha': 0.05})
+    second = cached_forecast(forecast_counting(history, calls), history, 'model', {'alpha': 0.05})
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert len(os.listdir(FORECAST_CACHE_DIR)) == 1
+    second['forecast'] = 0
+    assert cached_forecast(forecast_counting(history, calls), history, 'model', {'alpha': 0.05})['forecast'].sum() > 0
+
+def test_history_model_and_parameters_are_keys(instance):
+    history, calls = instance.biomass_history, []
+    cached_forecast(forecast_counting(history, calls), history, 'model', {'alpha': 0.05})
+    cached_forecast(forecast_counting(history, calls), history, 'model', {'alpha': 0.1})
+    cached_forecast(forecast_counting(history, calls), history, 'other', {'alpha': 0.05})
+    edited = history.copy()
+    edited.loc[0, '2017'] += 1
+    cached_forecast(forecast_counting(edited, calls), edited, 'model', {'alpha': 0.05})
+    cached_forecast(forecast_counting(history, calls), history.copy(), 'model', {'alpha': 0.05})
+    assert len(calls) == 4
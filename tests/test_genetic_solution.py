@@ -0,0 +1,24 @@
+import numpy as np
+from genetic_solution import generate_inital_locations, perform_crossover, perform_mutation, tournament_selection
+
+def distinct_rows(sets):
+    return all(len(set(row)) == len(row) for row in sets.tolist())
+
+def test_tournament_participants_are_distinct(instance):
+    costs = np.array([5.0, 3.0, 9.0, 1.0, 7.0])
+    rng = np.random.default_rng(0)
+    # a tournament over the whole population always holds the best individual
+    assert tournament_selection(costs, len(costs), rng).tolist() == [3] * len(costs)
+    winners = tournament_selection(costs, 4, rng)
+    assert 2 not in winners
+
+def test_operators_keep_sites_distinct(instance):
+    rng = np.random.default_rng(1)
+    sets = generate_inital_locations(sets=40, locations=instance.number_of_depots, rng=rng)
+    assert sets.shape == (40, instance.number_of_depots) and distinct_rows(sets)
+    offspring1, offspring2 = perform_crossover(sets[:20], sets[20:], rng)
+    assert distinct_rows(offspring1) and distinct_rows(offspring2)
+    mutated = perform_mutation(sets.copy(), 1.0, rng)
+    assert distinct_rows(mutated)
+    assert all(len(set(new) - set(old)) == 1 for new, old in zip(mutated.tolist(), sets.tolist()))
+    assert mutated.max() < instance.number_of_sites
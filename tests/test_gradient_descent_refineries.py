@@ -0,0 +1,23 @@
+import json
+import pytest
+from checkpoint import load_checkpoint
+from gradient_descent_refineries import load_depots, main
+
+def test_depots_come_from_the_instance(instance):
+    greedy = load_depots()
+    assert len(set(greedy)) == instance.number_of_depots
+    with open('best.json', 'w') as best_file:
+        json.dump({'depots': [5, 50, 150, 250], 'cost': 1.0}, best_file)
+    assert load_depots('best.json') == [5, 50, 150, 250]
+    with open('short.json', 'w') as short_file:
+        json.dump({'depots': [5, 50]}, short_file)
+    with pytest.raises(ValueError):
+        load_depots('short.json')
+
+def test_resumed_run_keeps_its_depots(instance):
+    with open('best.json', 'w') as best_file:
+        json.dump({'depots': [5, 50, 150, 250]}, best_file)
+    main(iterations=1, seed=0, checkpoint='run.pkl', candidates=0, depots='best.json')
+    assert load_checkpoint('run.pkl')['depots'] == [5, 50, 150, 250]
+    main(iterations=2, checkpoint='run.pkl', resume=True)
+    assert load_checkpoint('run.pkl')['depots'] == [5, 50, 150, 250]
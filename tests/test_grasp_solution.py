@@ -0,0 +1,17 @@
+import json
+from grasp_solution import main
+
+def test_seeded_runs_reproduce_whatever_the_workers(instance):
+    best = main(constructions=6, keep=10, workers=1, seed=2, output='one.json')
+    assert main(constructions=6, keep=10, workers=2, seed=2, output='two.json') == best
+    with open('one.json') as one_file:
+        assert [solution['cost'] for solution in json.load(one_file)] == [cost for cost, _, _ in best]
+
+def test_constructions_are_kept_cheapest_first(instance):
+    best = main(constructions=6, keep=10, workers=1, seed=2, output='best.json')
+    assert 1 <= len(best) <= 6
+    assert [cost for cost, _, _ in best] == sorted(cost for cost, _, _ in best)
+    for _, depots, refineries in best:
+        assert len(set(depots)) == instance.number_of_depots
+        assert len(set(refineries)) == instance.number_of_refineries
+    assert main(constructions=6, keep=2, workers=1, seed=2, output='best.json') == best[:2]
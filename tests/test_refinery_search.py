@@ -0,0 +1,34 @@
+import itertools
+import numpy as np
+import pytest
+from cost_helpers import DEPOT_PROCESSING_CAPACITY, calculate_cost_of_flows
+from greedy_solution import fill_refinery_flows
+from refinery_search import candidate_refineries, refinery_set_costs, search_refineries
+
+DEPOTS = [45, 160, 275, 390]
+
+def depot_pellets(n_sites):
+    pellets = np.zeros(n_sites)
+    pellets[DEPOTS] = DEPOT_PROCESSING_CAPACITY
+    return pellets
+
+def greedy_cost(refineries, pellets):
+    return calculate_cost_of_flows(*fill_refinery_flows(sorted(refineries), pellets.copy()))
+
+def test_refinery_set_costs_match_the_greedy_fill(instance):
+    pellets = depot_pellets(instance.number_of_sites)
+    sets = np.array([[0, 399], [10, 200], [44, 46], [159, 391]])
+    costs = refinery_set_costs(sets, DEPOTS, pellets)
+    for refineries, cost in zip(sets, costs):
+        assert cost == pytest.approx(greedy_cost(refineries.tolist(), pellets), rel=1e-9)
+    np.testing.assert_array_equal(pellets, depot_pellets(instance.number_of_sites))
+
+def test_search_refineries_finds_the_best_candidate_set(instance):
+    pellets = depot_pellets(instance.number_of_sites)
+    best_cost, best_set = search_refineries(DEPOTS, pellets, k=20, chunk_size=50)
+    candidates = candidate_refineries(DEPOTS, pellets, 20).tolist()
+    expected = min(greedy_cost(list(refineries), pellets) for refineries in itertools.combinations(candidates, instance.number_of_refineries))
+    assert len(best_set) == instance.number_of_refineries
+    assert set(best_set) <= set(candidates)
+    assert best_cost == pytest.approx(expected, rel=1e-9)
+    assert best_cost == pytest.approx(greedy_cost(best_set, pellets), rel=1e-9)
@@ -0,0 +1,43 @@
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from submission_writer import SubmissionError, SubmissionWriter, write_submission
+from validate_submission import load_submission
+
+DEPOTS = [10, 20]
+REFINERIES = [30]
+
+def small_submission(n_sites, taken=100.0):
+    """
+    Forecast of 150 at sites 1 and 2 only, all of it sent to depot 10 and on to refinery 30
+    """
+    forecast = np.zeros(n_sites)
+    forecast[[1, 2]] = [100.0, 50.0]
+    biomass_flows = (np.array([1, 2]), np.array([10, 10]), np.array([taken, 50.0]))
+    pellet_flows = (np.array([10]), np.array([30]), np.array([taken + 50.0]))
+    return (np.arange(n_sites), forecast), biomass_flows, pellet_flows
+
+def test_written_submission_reads_back(instance):
+    forecast, biomass_flows, pellet_flows = small_submission(instance.number_of_sites)
+    rows = write_submission(DEPOTS, REFINERIES, forecast, biomass_flows, pellet_flows, path='submission.csv')
+    submission = load_submission('submission.csv')
+    assert len(submission) == rows == 3 + 2 * (instance.number_of_sites + 3)
+    assert submission.loc[submission.data_type == 'depot_location', 'source_index'].tolist() == DEPOTS
+    for year in (2018, 2019):
+        flows = submission[(submission.year == year) & (submission.data_type == 'biomass_demand_supply')]
+        assert flows.source_index.tolist() == [1, 2]
+        assert flows.destination_index.tolist() == [10, 10]
+        assert flows.value.tolist() == [100.0, 50.0]
+        values = submission.loc[(submission.year == year) & (submission.data_type == 'biomass_forecast'), 'value'].to_numpy()
+        sites, amounts = forecast
+        np.testing.assert_array_equal(values, amounts[sites])
+
+def test_failed_write_keeps_the_previous_submission(instance):
+    pd.DataFrame({'previous': [1]}).to_csv('submission.csv', index=False)
+    with pytest.raises(SubmissionError):
+        with SubmissionWriter('submission.csv') as writer:
+            writer.write_locations('depot_location', DEPOTS)
+            writer.write_locations('refinery_location', [instance.number_of_sites])
+    assert pd.read_csv('submission.csv').columns.tolist() == ['previous']
+    assert os.listdir('.') == ['submission.csv']
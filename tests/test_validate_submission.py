@@ -0,0 +1,25 @@
+import numpy as np
+import pandas as pd
+from submission_writer import write_submission
+from validate_submission import EXIT_FEASIBLE, EXIT_INVALID, EXIT_VIOLATIONS, validate
+
+DEPOTS = [10, 20]
+REFINERIES = [30]
+
+def small_submission(n_sites, taken=100.0):
+    """
+    Forecast of 150 at sites 1 and 2 only, all of it sent to depot 10 and on to refinery 30
+    """
+    forecast = np.zeros(n_sites)
+    forecast[[1, 2]] = [100.0, 50.0]
+    biomass_flows = (np.array([1, 2]), np.array([10, 10]), np.array([taken, 50.0]))
+    pellet_flows = (np.array([10]), np.array([30]), np.array([taken + 50.0]))
+    return (np.arange(n_sites), forecast), biomass_flows, pellet_flows
+
+def test_validator_exit_codes(instance):
+    write_submission(DEPOTS, REFINERIES, *small_submission(instance.number_of_sites), path='feasible.csv')
+    write_submission(DEPOTS, REFINERIES, *small_submission(instance.number_of_sites, taken=120.0), path='over.csv')
+    pd.read_csv('feasible.csv').drop(columns='value').to_csv('invalid.csv', index=False)
+    assert validate('feasible.csv') == EXIT_FEASIBLE
+    assert validate('over.csv') == EXIT_VIOLATIONS
+    assert validate('invalid.csv') == EXIT_INVALID
@@ -0,0 +1,221 @@
+'''
+Checks a submission file against the constraints of the problem and prints its cost.
+
+    python validate_submission.py submission.csv
+    python validate_submission.py candidates/*.csv --quiet
+
+Constraints, checked for every year:
+
+    locations     at most 25 depots and 5 refineries, none listed twice, given for 20182019
+    forecast      one non-negative forecast per site
+    sources       biomass taken from a site is at most its forecast
+    processed     the biomass moved is at least 80% of the forecast
+    capacity      depots take at most 20000 biomass, refineries at most 100000 pellets
+    routing       biomass goes to depots, pellets go from depots to refineries
+    conservation  the pellets leaving a depot equal the biomass it receives
+
+All checks are array operations over the whole file, so a submission is checked and scored in
+a few milliseconds once the distance matrix is loaded.
+
+Exit codes: 0 when every file is feasible, 1 when a file breaks a constraint, 2 when a file
+cannot be read as a submission.
+'''
+import argparse
+import sys
+import numpy as np
+import pandas as pd
+from data_context import DATA
+from cost_helpers import DEPOT_PROCESSING_CAPACITY, REFINERY_PROCESSING_CAPACITY, DATA_TYPES, YEARS, submission_cost_breakdown
+from instrumentation import add_instrumentation_arguments, run_instrumented
+from submission_writer import LOCATION_YEAR, SUBMISSION_COLUMNS, SubmissionError
+
+MAX_DEPOTS = 25
+MAX_REFINERIES = 5
+MIN_PROCESSED_SHARE = 0.8 # share of the forecast biomass that has to be moved each year
+TOLERANCE = 1e-3 # slack on amounts, for float sums of flows written as text
+MAX_REPORTED = 5 # examples printed per constraint
+
+EXIT_FEASIBLE = 0
+EXIT_VIOLATIONS = 1
+EXIT_INVALID = 2
+
+def load_submission(path: str) -> pd.DataFrame:
+    """
+    Reads a submission and checks its columns and types.
+
+    Raises:
+        SubmissionError: When the file is not a submission, e.g. a missing column or a
+            site index that is not a whole number
+    """
+    try:
+        submission = pd.read_parquet(path) if path.endswith('.parquet') else pd.read_csv(path)
+    except (OSError, ValueError) as error:
+        raise SubmissionError(f"cannot read {path}: {error}") from error
+    missing = [column for column in SUBMISSION_COLUMNS if column not in submission.columns]
+    if missing:
+        raise SubmissionError(f"missing columns {missing}")
+    unknown = sorted(set(submission["data_type"].astype(str)) - set(DATA_TYPES))
+    if unknown:
+        raise SubmissionError(f"unknown data_type {unknown}")
+    for column in ("year", "source_index", "destination_index", "value"):
+        if not pd.api.types.is_numeric_dtype(submission[column]):
+            raise SubmissionError(f"{column} is not numeric")
+    for column in ("year", "source_index"):
+        values = submission[column].to_numpy(dtype=np.float64)
+        if np.isnan(values).any() or np.any(values != np.round(values)):
+            raise SubmissionError(f"{column} must be a whole number on every row")
+    flows = submission["data_type"].isin(("biomass_demand_supply", "pellet_demand_supply")).to_numpy()
+    destinations = submission["destination_index"].to_numpy(dtype=np.float64)[flows]
+    if np.isnan(destinations).any() or np.any(destinations != np.round(destinations)):
+        raise SubmissionError("destination_index must be a whole number on every flow")
+    if np.isnan(submission["value"].to_numpy(dtype=np.float64)[flows | (submission["data_type"] == "biomass_forecast").to_numpy()]).any():
+        raise SubmissionError("value is missing on a forecast or flow row")
+    return submission
+
+def rows_of(submission: pd.DataFrame, data_type: str, year: int = None):
+    """
+    (sources, destinations, values) arrays of the rows of one data_type, and one year when given
+    """
+    rows = submission["data_type"] == data_type
+    if year is not None:
+        rows &= submission["year"] == year
+    rows = submission[rows]
+    destinations = rows["destination_index"].fillna(-1).to_numpy(dtype=np.int64)
+    return rows["source_index"].to_numpy(dtype=np.int64), destinations, rows["value"].to_numpy(dtype=np.float64)
+
+def examples(sites: np.ndarray, amounts: np.ndarray = None) -> str:
+    shown = [f"{site}" if amounts is None else f"{site} ({amount:.6g})" for site, amount in
+             zip(sites[:MAX_REPORTED].tolist(), [None] * len(sites) if amounts is None else amounts[:MAX_REPORTED].tolist())]
+    more = f" and {len(sites) - MAX_REPORTED} more" if len(sites) > MAX_REPORTED else ""
+    return ", ".join(shown) + more
+
+def check_locations(submission: pd.DataFrame, n_sites: int) -> tuple[list[tuple[str, str]], np.ndarray, np.ndarray]:
+    """
+    Returns:
+        violations: (constraint, message) pairs
+        depots, refineries: Site indexes of the listed facilities
+    """
+    violations = []
+    facilities = []
+    for data_type, limit in (("depot_location", MAX_DEPOTS), ("refinery_location", MAX_REFINERIES)):
+        rows = submission[submission["data_type"] == data_type]
+        sites = rows["source_index"].to_numpy(dtype=np.int64)
+        if len(sites) > limit:
+            violations.append(("locations", f"{len(sites)} {data_type} rows, at most {limit} allowed"))
+        wrong_year = rows["year"].to_numpy() != LOCATION_YEAR
+        if wrong_year.any():
+            violations.append(("locations", f"{data_type} rows must have year {LOCATION_YEAR}: sites {examples(sites[wrong_year])}"))
+        unique, counts = np.unique(sites, return_counts=True)
+        if np.any(counts > 1):
+            violations.append(("locations", f"{data_type} lists sites more than once: {examples(unique[counts > 1])}"))
+        off_grid = (sites < 0) | (sites >= n_sites)
+        if off_grid.any():
+            violations.append(("locations", f"{data_type} sites outside the grid: {examples(sites[off_grid])}"))
+        facilities.append(unique[(unique >= 0) & (unique < n_sites)])
+    return violations, facilities[0], facilities[1]
+
+def check_year(submission: pd.DataFrame, year: int, depots: np.ndarray, refineries: np.ndarray, n_sites: int) -> list[tuple[str, str]]:
+    """
+    Checks the forecast and flows of one year, see the module docstring
+    """
+    violations = []
+    forecast_sites, _, forecast_values = rows_of(submission, "biomass_forecast", year)
+    biomass_sources, biomass_destinations, biomass_values = rows_of(submission, "biomass_demand_supply", year)
+    pellet_sources, pellet_destinations, pellet_values = rows_of(submission, "pellet_demand_supply", year)
+    indexes = np.concatenate((forecast_sites, biomass_sources, biomass_destinations, pellet_sources, pellet_destinations))
+    if len(indexes) and (indexes.min() < 0 or indexes.max() >= n_sites):
+        return [("routing", f"{year}: site indexes outside [0, {n_sites})")]
+
+    counts = np.bincount(forecast_sites, minlength=n_sites)
+    if np.any(counts != 1):
+        violations.append(("forecast", f"{year}: sites without exactly one forecast: {examples(np.flatnonzero(counts != 1))}"))
+    if np.any(forecast_values < 0):
+        violations.append(("forecast", f"{year}: negative forecast at sites {examples(forecast_sites[forecast_values < 0], forecast_values[forecast_values < 0])}"))
+    negative = np.concatenate((biomass_values, pellet_values)) < 0
+    if negative.any():
+        violations.append(("flows", f"{year}: {int(negative.sum())} flows with a negative value"))
+
+    forecast = np.bincount(forecast_sites, weights=forecast_values, minlength=n_sites)
+    taken = np.bincount(biomass_sources, weights=biomass_values, minlength=n_sites)
+    over = np.flatnonzero(taken > forecast + TOLERANCE)
+    if len(over):
+        violations.append(("sources", f"{year}: biomass taken beyond the forecast at sites {examples(over, taken[over] - forecast[over])}"))
+    if biomass_values.sum() < MIN_PROCESSED_SHARE * forecast.sum() - TOLERANCE:
+        violations.append(("processed", f"{year}: {biomass_values.sum():.6g} biomass moved, "
+                                        f"at least {MIN_PROCESSED_SHARE:.0%} of {forecast.sum():.6g} required"))
+
+    is_depot = np.zeros(n_sites, dtype=bool)
+    is_depot[depots] = True
+    is_refinery = np.zeros(n_sites, dtype=bool)
+    is_refinery[refineries] = True
+    for name, sites, allowed in (("biomass destinations", biomass_destinations, is_depot),
+                                 ("pellet sources", pellet_sources, is_depot),
+                                 ("pellet destinations", pellet_destinations, is_refinery)):
+        stray = np.unique(sites[~allowed[sites]])
+        if len(stray):
+            violations.append(("routing", f"{year}: {name} that are not listed: {examples(stray)}"))
+
+    received = np.bincount(biomass_destinations, weights=biomass_values, minlength=n_sites)
+    processed = np.bincount(pellet_destinations, weights=pellet_values, minlength=n_sites)
+    for facility, inflow, capacity in (("depot", received, DEPOT_PROCESSING_CAPACITY), ("refinery", processed, REFINERY_PROCESSING_CAPACITY)):
+        full = np.flatnonzero(inflow > capacity + TOLERANCE)
+        if len(full):
+            violations.append(("capacity", f"{year}: {facility}s over {capacity}: {examples(full, inflow[full])}"))
+
+    shipped = np.bincount(pellet_sources, weights=pellet_values, minlength=n_sites)
+    unbalanced = np.flatnonzero(np.abs(received - shipped) > TOLERANCE)
+    if len(unbalanced):
+        violations.append(("conservation", f"{year}: depots shipping a different amount than they receive: "
+                                           f"{examples(unbalanced, shipped[unbalanced] - received[unbalanced])}"))
+    return violations
+
+def check_submission(submission: pd.DataFrame, n_sites: int = None) -> list[tuple[str, str]]:
+    """
+    Checks every constraint of a loaded submission.
+
+    Returns:
+        (constraint, message) of every violation, empty when the submission is feasible
+    """
+    n_sites = n_sites if n_sites is not None else DATA.number_of_sites
+    violations, depots, refineries = check_locations(submission, n_sites)
+    for year in YEARS:
+        violations += check_year(submission, year, depots, refineries, n_sites)
+    return violations
+
+def validate(path: str, quiet: bool = False) -> int:
+    """
+    Loads, checks and scores one submission file and returns its exit code
+    """
+    try:
+        submission = load_submission(path)
+    except SubmissionError as error:
+        print(f"{path}: invalid submission: {error}")
+        return EXIT_INVALID
+    violations = check_submission(submission)
+    for constraint, message in violations:
+        print(f"{path}: [{constraint}] {message}")
+    if violations:
+        print(f"{path}: {len(violations)} violations")
+        return EXIT_VIOLATIONS
+    breakdown = submission_cost_breakdown(submission)
+    if quiet:
+        print(f"{path}: feasible, cost {breakdown['total']:.6f}")
+    else:
+        print(f"{path}: feasible")
+        print("  transport:", breakdown["transport"])
+        print("  underutilization:", breakdown["underutilization"])
+        print("  total cost:", breakdown["total"])
+    return EXIT_FEASIBLE
+
+def main(paths: list[str], quiet: bool = False) -> int:
+    return max(validate(path, quiet) for path in paths)
+
+def parse_arguments(argv: list[str] = None):
+    parser = argparse.ArgumentParser(description="Check submissions against the constraints and print their cost")
+    parser.add_argument('paths', nargs='+', metavar='submission', help="csv or parquet submission files")
+    parser.add_argument('--quiet', action='store_true', help="one line per feasible file")
+    add_instrumentation_arguments(parser)
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    sys.exit(run_instrumented(main, parse_arguments(), 'validate_submission'))